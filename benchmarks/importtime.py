@@ -0,0 +1,67 @@
+"""
+Measures the import time of each module of pyprot with python -X importtime, and checks it against a budget.
+Usage : python benchmarks/importtime.py [number of runs]
+Each module is imported in a new interpreter, and its best cumulative import time over all runs is kept.
+The exit status is 1 if a module exceeds its budget, or imports a module that must only be loaded on first use.
+"""
+import os
+import subprocess
+import sys
+
+# Import time budgets in milliseconds : modules computing with numpy pay for its import (about 100 ms)
+BUDGETS = {
+    "pyprot": 20,
+    "pyprot.base.aminoacid": 50,
+    "pyprot.base.sequence": 50,
+    "pyprot.data.compressed": 50,
+    "pyprot.data.chunks": 50,
+    "pyprot.data.fasta": 100,
+    "pyprot.data.dssp": 100,
+    "pyprot.data.packed": 400,
+    "pyprot.data.corpus": 400,
+    "pyprot.align": 20,
+    "pyprot.align.matrices": 50,
+    "pyprot.align.score": 400,
+    "pyprot.align.dynamic": 400,
+    "pyprot.align.align": 400,
+    "pyprot.align.blosum": 400,
+    "pyprot.align.database": 400,
+    "pyprot.structure.gor": 400,
+}
+
+# Modules that are only loaded by the functions that need them
+LAZY_MODULES = ("matplotlib", "concurrent.futures")
+
+
+def importTime(module):
+    """
+    Imports 'module' in a new interpreter, and returns its cumulative import time in milliseconds
+    and the names of all modules it imported.
+    """
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+    environment = dict(os.environ, PYTHONPATH=root + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import " + module],
+                            env=environment, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            selfTime, cumulativeTime, name = line[len("import time:"):].split("|")
+            if cumulativeTime.strip().isdigit():
+                times[name.strip()] = int(cumulativeTime) / 1000
+    return times[module], set(times)
+
+
+def main(runs=3):
+    failures = 0
+    for module, budget in BUDGETS.items():
+        best, imported = min(importTime(module) for run in range(runs))
+        lazy = [name for name in LAZY_MODULES if name in imported]
+        status = "ok" if best <= budget and not lazy else "FAILED"
+        failures += status != "ok"
+        print("{:<26} {:8.1f} ms / {:4d} ms  {}{}".format(
+            module, best, budget, status, " (imports {})".format(", ".join(lazy)) if lazy else ""))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*map(int, sys.argv[1:])))
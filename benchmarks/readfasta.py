@@ -0,0 +1,65 @@
+"""
+Measures the throughput of pyprot.data.fasta.getSequencesFromFasta, in MB/s.
+Usage : python benchmarks/readfasta.py [path to a FASTA file]
+Without a path, a random FASTA file of about 100 MB is generated (and deleted afterwards).
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from pyprot.base.aminoacid import AminoAcid
+from pyprot.data.fasta import getSequencesFromFasta
+
+
+def writeRandomFasta(path, size, lineWidth=60):
+    """
+    Writes random Sequences of 100 to 1000 amino acids to a FASTA file at 'path', until it holds 'size' bytes.
+    """
+    names = "".join(AminoAcid.getNames())
+    written, index = 0, 0
+    with open(path, "w") as file:
+        while written < size:
+            residues = "".join(random.choice(names) for i in range(random.randint(100, 1000)))
+            lines = [">random_{}".format(index)]
+            lines.extend(residues[start:start + lineWidth] for start in range(0, len(residues), lineWidth))
+            record = "\n".join(lines) + "\n"
+            file.write(record)
+            written += len(record)
+            index += 1
+
+
+def benchmark(path, batchSize=None):
+    """
+    Reads the FASTA file at 'path' and returns the number of Sequences, of amino acids and the throughput in MB/s.
+    """
+    start = time.perf_counter()
+    sequenceCount, residueCount = 0, 0
+    for batch in getSequencesFromFasta(path, batchSize):
+        for sequence in batch if batchSize is not None else [batch]:
+            sequenceCount += 1
+            residueCount += len(sequence)
+    elapsed = time.perf_counter() - start
+    return sequenceCount, residueCount, os.path.getsize(path) / elapsed / 1e6
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        fastaPath, temporary = sys.argv[1], False
+    else:
+        descriptor, fastaPath = tempfile.mkstemp(suffix=".fasta")
+        os.close(descriptor)
+        temporary = True
+        writeRandomFasta(fastaPath, 100 * 10 ** 6)
+
+    try:
+        for size in (None, 1000):
+            sequences, residues, throughput = benchmark(fastaPath, size)
+            print("batchSize={}: {} sequences, {} amino acids, {:.1f} MB/s".format(size, sequences, residues,
+                                                                                 throughput))
+    finally:
+        if temporary:
+            os.remove(fastaPath)
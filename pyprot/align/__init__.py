@@ -0,0 +1,7 @@
+def search(*args, **kwargs):
+    """
+    Same as pyprot.align.database.search, which is only imported on first use,
+    so that importing the other modules of the package stays fast.
+    """
+    from pyprot.align.database import search
+    return search(*args, **kwargs)
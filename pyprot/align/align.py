@@ -1,6 +1,7 @@
 from copy import deepcopy
 
 from pyprot.base.sequence import Sequence
+from pyprot.align import dynamic
 
 
 class Aligned:
@@ -142,16 +143,65 @@ class Aligned:
         return "\n".join(res)
 
 
+class BandedRow:
+    """
+    Represents a row of a banded matrix : only values from column 'start' onwards are stored,
+    all other columns (up to 'size') read as 'default' and cannot be written to.
+    """
+
+    def __init__(self, values, start, size, default):
+        self._values = values
+        self._start = start
+        self._size = size
+        self._default = default
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, col):
+        if isinstance(col, slice):
+            return [self[i] for i in range(*col.indices(self._size))]
+        if col < 0:
+            col += self._size
+        if not 0 <= col < self._size:
+            raise IndexError("BandedRow index out of range")
+        index = col - self._start
+        if 0 <= index < len(self._values):
+            return self._values[index]
+        return self._default
+
+    def __setitem__(self, col, value):
+        if col < 0:
+            col += self._size
+        index = col - self._start
+        if not 0 <= index < len(self._values):
+            raise IndexError("Column " + str(col) + " is outside of the band")
+        self._values[index] = value
+
+    def __iter__(self):
+        for col in range(self._size):
+            yield self[col]
+
+
 class Align:
     """
     Represents an alignment matrix, used to determine the alignment score between two Sequences
     """
 
-    def __init__(self, scoreMatrix):
+    _engines = ("python", "numpy")  # choices for the matrix filling engine
+    _alignModes = ("global", "semiglobal", "local")
+
+    def __init__(self, scoreMatrix, engine="python"):
         """
         Creates an AlignMatrix object that uses scoreMatrix as a scoring system between amino acids.
+        'engine' selects how matrices are filled : "python" computes cells one by one, "numpy" computes
+        them with vectorized operations (much faster on long Sequences, with identical results).
         """
+        if engine not in Align._engines:
+            raise ValueError("engine must be 'python' or 'numpy'")
+
         self._scoreMatrix = scoreMatrix  # scoring matrix to use
+        self._engine = engine  # matrix filling engine
 
         self._colSeq = None  # copies of Sequences to align
         self._rowSeq = None
@@ -166,6 +216,7 @@ class Align:
         self._isMultiple = False  # Is the alignment done against multiple Sequences at once ?
         self._resultCount = None  # The number of expected results
         self._subOptimalDepth = None
+        self._bandWidth = None  # Width of the diagonal band (None if the whole matrix is computed)
 
         self._maxAlignScore = 0  # Maximum score
         self._currentAlignScore = 0  # Score for this alignment
@@ -182,18 +233,25 @@ class Align:
         self._alignedRowSeq = None  # Aligned Sequences (result of alignment)
         self._alignedColSeq = None
 
-    def globalAlign(self, seqA, seqB, iniGapPenalty=1, extGapPenalty=None, semiGlobal=False, resultCount=-1):
+    def globalAlign(self, seqA, seqB, iniGapPenalty=1, extGapPenalty=None, semiGlobal=False, resultCount=-1,
+                    bandWidth=None):
         """
         Returns all best global alignment between 'seqA' and 'seqB' with the provided
         initial and extended gap penalties.
         If 'semiGlobal' is True, allows alignment to discard the start and end of either Sequence.
         (this allows for better alignments when Sequences overlap only partially)
+        If 'bandWidth' is set, only cells at most 'bandWidth' diagonals away from the main diagonals are computed.
+        The band is doubled until the best alignment does not touch its edges (see getBandWidth) : this is meant
+        for similar Sequences, whose best alignment stays close to the diagonal.
         """
+        if bandWidth is not None and bandWidth < 1:
+            raise ValueError("bandWidth must be at least 1")
         if semiGlobal:
             self._alignMode = "semiglobal"
         else:
             self._alignMode = "global"
         self._resultCount = resultCount
+        self._bandWidth = bandWidth
 
         # Initialize all data structures
         self.__initialize(seqA, seqB, iniGapPenalty, extGapPenalty)
@@ -214,6 +272,7 @@ class Align:
         If 'subOptimalDepth' equals m, looks for m best suboptimal alignments as well.
         """
         self._alignMode = "local"
+        self._bandWidth = None
 
         # Initialize all data structures
         self.__initialize(seqA, seqB, iniGapPenalty, extGapPenalty)
@@ -253,6 +312,116 @@ class Align:
         colSeq = [i for i in range(len(self._scoreMatrix))]
         yield from self.localAlign(colSeq, Sequence, 0, None, resultCount, subOptimalDepth)
 
+    def getBandWidth(self):
+        """
+        Returns the band width used by the last alignment (after widening), or None if it was not banded.
+        """
+        return self._bandWidth
+
+    def score(self, seqA, seqB, iniGapPenalty=1, extGapPenalty=None, mode="global"):
+        """
+        Returns the best alignment score between 'seqA' and 'seqB' in mode 'mode' ("global", "semiglobal" or
+        "local"), along with the end positions of that alignment in 'seqA' and 'seqB' (as in Aligned).
+        No alignment is built : only two rows of scores are kept in memory, along the shortest Sequence.
+        When several positions share the best score, the first one is returned (as the first alignment
+        yielded by globalAlign or localAlign).
+        """
+        if mode not in Align._alignModes:
+            raise ValueError("mode must be 'global', 'semiglobal' or 'local'")
+        if len(seqA) == 0 or len(seqB) == 0:
+            raise ValueError("Sequences to align cannot be empty")
+        extGapPenalty = iniGapPenalty if extGapPenalty is None else extGapPenalty
+
+        # Matrices are symmetric : rows follow the longest Sequence (seqB, unless transposed)
+        transposed = len(seqA) > len(seqB)
+        rowSeq, colSeq = (seqA, seqB) if transposed else (seqB, seqA)
+
+        if self._engine == "numpy":
+            # Diagonals are stored by row, so rows and columns are swapped
+            table, rowCodes, colCodes = dynamic.substitutionTable(self._scoreMatrix, colSeq, rowSeq)
+            score, col, row = dynamic.bestScoreByDiagonals(table, rowCodes, colCodes, iniGapPenalty,
+                                                            extGapPenalty, mode, not transposed)
+        else:
+            score, row, col = self.__scoreByRows(rowSeq, colSeq, iniGapPenalty, extGapPenalty, mode, transposed)
+
+        return (score, row, col) if transposed else (score, col, row)
+
+    def linearAlign(self, seqA, seqB, iniGapPenalty=1, extGapPenalty=None, mode="global"):
+        """
+        Returns a best alignment between 'seqA' and 'seqB' in mode 'mode' ("global", "semiglobal" or "local"),
+        as an Aligned object with the same score and end positions as the first result of globalAlign or localAlign.
+        The alignment is found by divide and conquer (Myers and Miller) instead of backtracking through matrices,
+        so memory stays proportional to the length of the Sequences instead of their product.
+        """
+        score, seqAEnd, seqBEnd = self.score(seqA, seqB, iniGapPenalty, extGapPenalty, mode)
+        extGapPenalty = iniGapPenalty if extGapPenalty is None else extGapPenalty
+
+        table, rowCodes, colCodes = dynamic.substitutionTable(self._scoreMatrix, seqB, seqA)
+        row, col, moves = dynamic.alignmentPath(table, rowCodes, colCodes, seqBEnd, seqAEnd, mode,
+                                                iniGapPenalty, extGapPenalty)
+
+        alignedColSeq, alignedRowSeq = [], []
+        seqAStart, seqBStart = col, row
+        for move in moves:
+            if move == "T":  # top
+                alignedColSeq.append("-")
+                alignedRowSeq.append(seqB[row])
+                row += 1
+            elif move == "D":  # diagonal
+                alignedColSeq.append(seqA[col])
+                alignedRowSeq.append(seqB[row])
+                row, col = row + 1, col + 1
+            else:  # left
+                alignedColSeq.append(seqA[col])
+                alignedRowSeq.append("-")
+                col += 1
+
+        return Aligned(Sequence(alignedColSeq, seqA.getDescription()),
+                       Sequence(alignedRowSeq, seqB.getDescription()), seqAStart, seqBStart,
+                       mode, score, self._scoreMatrix, False)
+
+    def __scoreByRows(self, rowSeq, colSeq, iniGapPenalty, extGapPenalty, alignMode, transposed):
+        """
+        Returns the best score between 'rowSeq' and 'colSeq' and its position, computed row by row (python engine).
+        Ties are broken as in __findBestScore, by columns first if 'transposed' is True.
+        """
+        def initialValue(index):
+            if alignMode == "global" and index > 0:
+                return iniGapPenalty + extGapPenalty * (index - 1)
+            return 0
+
+        alignRow = [initialValue(col) for col in range(len(colSeq) + 1)]
+        rowGapRow = list(alignRow)
+
+        bestScore, bestRow, bestCol = None, 0, 0
+        for row in range(1, len(rowSeq) + 1):
+            rowAA = rowSeq[row - 1]
+            newAlignRow = [initialValue(row)]
+            newRowGapRow = [initialValue(row)]
+            colGap = initialValue(row)
+
+            for col in range(1, len(colSeq) + 1):
+                rowGap = max(alignRow[col] + iniGapPenalty, rowGapRow[col] + extGapPenalty)
+                colGap = max(newAlignRow[col - 1] + iniGapPenalty, colGap + extGapPenalty)
+                matchScore = alignRow[col - 1] + self._scoreMatrix.getScore(rowAA, colSeq[col - 1])
+                if alignMode == "local":
+                    newAlignRow.append(max(colGap, rowGap, matchScore, 0))
+                else:
+                    newAlignRow.append(max(colGap, rowGap, matchScore))
+                newRowGapRow.append(rowGap)
+
+            alignRow, rowGapRow = newAlignRow, newRowGapRow
+
+            if alignMode != "global":
+                score = max(alignRow[1:])
+                col = alignRow.index(score, 1)
+                if bestScore is None or score > bestScore or (transposed and score == bestScore and col < bestCol):
+                    bestScore, bestRow, bestCol = score, row, col
+
+        if alignMode == "global":
+            return alignRow[-1], len(rowSeq), len(colSeq)
+        return bestScore, bestRow, bestCol
+
     def __initialize(self, seqA, seqB, iniGapPenalty, extGapPenalty):
         """
         Sets all initial values for required data structures.
@@ -286,36 +455,153 @@ class Align:
         self._extGapPenalty = iniGapPenalty if extGapPenalty is None else extGapPenalty
 
         # Matrices
-        self._alignMatrix = [[0 for i in range(len(self._colSeq) + 1)] \
-                             for j in range(len(self._rowSeq) + 1)]
-        self._rowGapMatrix = deepcopy(self._alignMatrix)
-        self._colGapMatrix = deepcopy(self._alignMatrix)
+        self.__fillMatrices()
+
+        # Banded alignment : widen the band until the best alignment stays away from its edges
+        while self._bandWidth is not None and self.__touchesBandEdge():
+            self._bandWidth *= 2
+            self.__fillMatrices()
+
+    def __fillMatrices(self):
+        """
+        Fills all matrices (within the band, if any) and finds best scores.
+        """
+        if self._engine == "numpy":
+            self.__fillArrays()
+        else:
+            self._alignMatrix = self.__newMatrix(0, float("-inf"))
+            self._rowGapMatrix = self.__newMatrix(0, float("-inf"))
+            self._colGapMatrix = self.__newMatrix(0, float("-inf"))
+            self._originMatrix = self.__newMatrix("", "")
+
+            # Global alignment : first line and colunm have initial scores and origins
+            if self._alignMode == "global":
+                self.__initAlignValues()
+
+            # Fill all matrices
+            for row in range(1, len(self._rowSeq) + 1):
+                columns = self.__bandColumns(row)
+                for col in range(max(1, columns.start), columns.stop):
+                    self.__fill(row, col)
+
+            # Find best scores
+            self.__findBestScore()
+
+    def __bandDiagonals(self):
+        """
+        Returns the lowest and highest diagonals (column - row) of the band.
+        The band covers both the main diagonal and the one ending in the bottom right corner of the matrices.
+        """
+        lengthDifference = len(self._colSeq) - len(self._rowSeq)
+        return min(0, lengthDifference) - self._bandWidth, max(0, lengthDifference) + self._bandWidth
 
-        self._originMatrix = [["" for i in range(len(self._colSeq) + 1)] \
-                              for j in range(len(self._rowSeq) + 1)]
+    def __bandColumns(self, row):
+        """
+        Returns the range of columns of row 'row' that are computed (all of them if the alignment is not banded).
+        """
+        if self._bandWidth is None:
+            return range(len(self._colSeq) + 1)
+        lowDiagonal, highDiagonal = self.__bandDiagonals()
+        return range(max(0, row + lowDiagonal), min(len(self._colSeq), row + highDiagonal) + 1)
+
+    def __newMatrix(self, value, outsideValue):
+        """
+        Returns a matrix filled with 'value', made of BandedRows reading 'outsideValue' outside of the band if any.
+        """
+        size = len(self._colSeq) + 1
+        if self._bandWidth is None:
+            return [[value for i in range(size)] for j in range(len(self._rowSeq) + 1)]
+        return [BandedRow([value for i in columns], columns.start, size, outsideValue)
+                for columns in map(self.__bandColumns, range(len(self._rowSeq) + 1))]
+
+    def __touchesBandEdge(self):
+        """
+        Returns True if the first best alignment goes through a diagonal on the edge of the band,
+        unless that edge is also the edge of the matrices (then widening the band would change nothing).
+        If no best alignment was found within the band, returns True until the band covers the whole matrices.
+        """
+        lowDiagonal, highDiagonal = self.__bandDiagonals()
+        lowEdge = lowDiagonal if lowDiagonal > -len(self._rowSeq) else None
+        highEdge = highDiagonal if highDiagonal < len(self._colSeq) else None
 
-        # Global alignment : first line and colunm have initial scores and origins
         if self._alignMode == "global":
-            self.__initAlignValues()
+            ends = [(len(self._rowSeq), len(self._colSeq))]
+        else:
+            ends = list(zip(self._maxScoreRows, self._maxScoreCols))
+            if not ends:
+                return lowEdge is not None or highEdge is not None
+
+        for row, col in ends:
+            while self._originMatrix[row][col] != "":
+                if col - row in (lowEdge, highEdge):
+                    return True
+                origin = self._originMatrix[row][col][0]
+                row, col = row - (origin != "L"), col - (origin != "T")
+            if col - row in (lowEdge, highEdge):
+                return True
+        return False
+
+    def __fillArrays(self):
+        """
+        Fills all matrices at once with vectorized operations (numpy engine), and finds best scores.
+        Matrices are then stored as lists, exactly as the python engine would have filled them.
+        Gap matrices are only converted once needed to reevaluate scores (see __clearBestPath).
+        """
+        if self._bandWidth is not None:
+            self.__fillBandArrays()
+            return
 
-        # Fill all matrices
-        for row in range(1, len(self._rowSeq) + 1):
-            for col in range(1, len(self._colSeq) + 1):
-                self.__fill(row, col)
+        scores = dynamic.substitutionScores(self._scoreMatrix, self._rowSeq, self._colSeq)
+        gapPenalties = None
+        if self._isMultiple:
+            gapPenalties = [self._scoreMatrix.getGapPenalty(col) for col in range(len(self._colSeq) + 1)]
 
-        # Find best scores
-        self.__findBestScore()
+        alignMatrix, rowGapMatrix, colGapMatrix, originMatrix = dynamic.fillMatrices(
+            scores, self._iniGapPenalty, self._extGapPenalty, self._alignMode, gapPenalties)
+
+        self._maxAlignScore, self._maxScoreRows, self._maxScoreCols = dynamic.findBestScores(alignMatrix)
+
+        self._alignMatrix = alignMatrix.tolist()
+        self._rowGapMatrix = rowGapMatrix
+        self._colGapMatrix = colGapMatrix
+        self._originMatrix = dynamic.originNames(originMatrix)
+
+    def __fillBandArrays(self):
+        """
+        Fills the band of all matrices with vectorized operations (numpy engine), and finds best scores.
+        Matrices are then stored as lists of BandedRows, as the python engine would have filled them.
+        """
+        lowDiagonal, highDiagonal = self.__bandDiagonals()
+        table, rowCodes, colCodes = dynamic.substitutionTable(self._scoreMatrix, self._rowSeq, self._colSeq)
+        alignMatrix, rowGapMatrix, colGapMatrix, originMatrix = dynamic.fillBand(
+            table, rowCodes, colCodes, self._iniGapPenalty, self._extGapPenalty, self._alignMode,
+            lowDiagonal, highDiagonal)
+
+        self._maxAlignScore, self._maxScoreRows, self._maxScoreCols = \
+            dynamic.findBandBestScores(alignMatrix, lowDiagonal, len(self._colSeq))
+
+        size = len(self._colSeq) + 1
+        matrices = ([], [], [], [])
+        for row in range(len(self._rowSeq) + 1):
+            columns = self.__bandColumns(row)
+            first = columns.start - row - lowDiagonal + 1
+            bandSlice = slice(first, first + len(columns))
+            for matrix, array in zip(matrices[:3], (alignMatrix, rowGapMatrix, colGapMatrix)):
+                matrix.append(BandedRow(array[row, bandSlice].tolist(), columns.start, size, float("-inf")))
+            matrices[3].append(BandedRow(dynamic.originNames(originMatrix[row, bandSlice]),
+                                         columns.start, size, ""))
+        self._alignMatrix, self._rowGapMatrix, self._colGapMatrix, self._originMatrix = matrices
 
     def __initAlignValues(self):
         for i in range(1, max(len(self._colSeq), len(self._rowSeq)) + 1):
             val = self._iniGapPenalty + self._extGapPenalty * (i - 1)
-            if i <= len(self._colSeq):  # First row
+            if i <= len(self._colSeq) and i in self.__bandColumns(0):  # First row
                 self._alignMatrix[0][i] = val
                 self._rowGapMatrix[0][i] = val
                 self._colGapMatrix[0][i] = val
                 self._originMatrix[0][i] = "L"  # Origin is left
 
-            if i <= len(self._rowSeq):  # First column
+            if i <= len(self._rowSeq) and 0 in self.__bandColumns(i):  # First column
                 self._alignMatrix[i][0] = val
                 self._rowGapMatrix[i][0] = val
                 self._colGapMatrix[i][0] = val
@@ -368,6 +654,11 @@ class Align:
         """
         self._allAlignPaths.extend(self._bestAlignPath)
 
+        # Gap matrices filled by the numpy engine are still arrays
+        if not isinstance(self._rowGapMatrix, list):
+            self._rowGapMatrix = self._rowGapMatrix.tolist()
+            self._colGapMatrix = self._colGapMatrix.tolist()
+
         # Clear scores from best align path
         for row, col in self._bestAlignPath:
             self._alignMatrix[row][col] = 0  # Reset scores
@@ -387,11 +678,17 @@ class Align:
         self.__findBestScore()
 
     def __findBestScore(self):
+        if self._engine == "numpy":
+            self._maxAlignScore, self._maxScoreRows, self._maxScoreCols = \
+                dynamic.findBestScores(self._alignMatrix)
+            return
+
         self._maxAlignScore = -1
         self._maxScoreCols = []
         self._maxScoreRows = []
         for row in range(1, len(self._rowSeq) + 1):
-            for col in range(1, len(self._colSeq) + 1):
+            columns = self.__bandColumns(row)
+            for col in range(max(1, columns.start), columns.stop):
                 score = self._alignMatrix[row][col]
                 if score > self._maxAlignScore:  # New max alignment
                     self._maxAlignScore = score
@@ -416,7 +713,8 @@ class Align:
                 or (self._alignMode == "semiglobal" and (i == 0 or j == 0)):
 
             alignDescription = self._alignMode + \
-                               ("-suboptimal" + "(" + str(self._subOptimalDepth) + ")") * self._isSuboptimal
+                               ("-suboptimal" + "(" + str(self._subOptimalDepth) + ")") * self._isSuboptimal + \
+                               ("-banded" + "(" + str(self._bandWidth) + ")") * (self._bandWidth is not None)
 
             # Create result (Sequence obj. for MSA, Aligned obj. otherwise)
             if self._isMultiple:
@@ -1,6 +1,11 @@
+import json
+import os
 from math import log, ceil
+from multiprocessing import Pool
 
-from pyprot.base.aminoacid import AminoAcid
+import numpy as np
+
+from pyprot.base.aminoacid import AminoAcid, AA_NAMES
 from pyprot.data.fasta import getSequencesFromFasta
 from pyprot.align.score import ScoreMatrix
 
@@ -24,35 +29,71 @@ def belongs(outSequence, group, minMatches):
 def makeGroupsFromFasta(path, requiredIdentityPercent):
     """
     Loads Sequences from file at 'path' and separate them in groups with an identity of 
-    at least 'requiredIdentityPercent'.
+    at least 'requiredIdentityPercent' (see clusterSequences).
     Returns a list representing the groups as lists of Protein objects.
     """
-    sequences = [seq for seq in getSequencesFromFasta(path)]
-    groups = [[sequences[0]]]  # First sequence is assigned to first group
+    return clusterSequences(list(getSequencesFromFasta(path)), requiredIdentityPercent)
+
 
-    seqSize = len(sequences[0])  # Size of the sequences
+def clusterSequences(sequences, requiredIdentityPercent, chunkSize=1024):
+    """
+    Separates 'sequences' in groups by single-linkage clustering, as done by BLOSUM : two Sequences are in the same
+    group if they have an identity of at least 'requiredIdentityPercent', or are both in the group of a third one.
+    Identities are computed for 'chunkSize' Sequences at a time against all others.
+    Returns the groups as lists of Sequences, in order of their first Sequence.
+    Size of all sequences is assumed to be equal.
+    """
+    codes = np.frombuffer(b"".join(map(_getCodes, sequences)), dtype=np.uint8)
+    seqSize = len(sequences[0])
+    if codes.size != seqSize * len(sequences):
+        raise ValueError("All sequences must have the same size")
+    codes = codes.reshape(len(sequences), seqSize)
 
     # Number of matches required to achieve requiredIdentityPercent
     minMatches = ceil((requiredIdentityPercent / 100) * seqSize)
 
-    # For each outSequence not yet in a group
-    for outSequence in sequences[1:]:
-        groupFound = False  # has a group been found ?
-        groupIndex = 0  # index of the group we're looking in
+    # Each Sequence is a row with a 1 for its AminoAcid in each column, so the product of two rows is their identity
+    rows = np.zeros((len(sequences), seqSize * len(AA_NAMES)), dtype=np.float32)
+    rows[np.arange(len(sequences))[:, np.newaxis], np.arange(seqSize) * len(AA_NAMES) + codes] = 1
 
-        # Look for a group where outSequence belongs
-        while (not groupFound) and groupIndex < len(groups):
-            if belongs(outSequence, groups[groupIndex], minMatches):
-                groups[groupIndex].append(outSequence)
-                groupFound = True
-            else:
-                groupIndex += 1  # Move on to next group
+    parents = np.arange(len(sequences))  # Union-find forest, where roots are the first Sequence of their group
+    for start in range(0, len(sequences), chunkSize):
+        matches = rows[start:start + chunkSize].dot(rows.T)
+        seqA, seqB = np.nonzero(matches >= minMatches)
+        seqA += start
+        later = seqB > seqA
+        _union(parents, seqA[later], seqB[later])
 
-        # If no group works, create a new one
-        if not groupFound:
-            groups.append([outSequence])
+    groups = {}
+    for sequence, root in zip(sequences, _find(parents, np.arange(len(sequences)))):
+        groups.setdefault(root, []).append(sequence)
+    return list(groups.values())
 
-    return groups
+
+def _find(parents, elements):
+    """
+    Returns the roots of 'elements' in the union-find forest 'parents', after compressing all of its paths.
+    """
+    while True:
+        grandParents = parents[parents]
+        if np.array_equal(grandParents, parents):
+            return parents[elements]
+        parents[:] = grandParents
+
+
+def _union(parents, elementsA, elementsB):
+    """
+    Merges the sets of each pair of elements from 'elementsA' and 'elementsB' in the union-find forest 'parents'.
+    All pairs are merged at once : each root is attached to the lowest root it is paired with, until all pairs
+    share their root. Roots are always the lowest element of their set.
+    """
+    while True:
+        rootsA, rootsB = _find(parents, elementsA), _find(parents, elementsB)
+        different = rootsA != rootsB
+        if not different.any():
+            return
+        rootsA, rootsB = rootsA[different], rootsB[different]
+        np.minimum.at(parents, np.maximum(rootsA, rootsB), np.minimum(rootsA, rootsB))
 
 
 def valueDictsFromGroups(groups):
@@ -86,52 +127,86 @@ def valueDictsFromGroups(groups):
     return groupValues, groupSizes
 
 
+def valueArraysFromGroups(groups):
+    """
+    Transforms 'groups' into an array of shape (groups, columns, len(AA_NAMES)), holding the frequency of each
+    AminoAcid (by id) within each column of each group : the same values as valueDictsFromGroups, divided by the
+    size of the groups.
+    """
+    seqSize = len(groups[0][0])
+    frequencies = np.zeros((len(groups), seqSize, len(AA_NAMES)))
+    columns = np.arange(seqSize) * len(AA_NAMES)
+
+    for groupIndex, group in enumerate(groups):
+        codes = np.frombuffer(b"".join(map(_getCodes, group)), dtype=np.uint8).reshape(len(group), seqSize)
+        counts = np.bincount((columns + codes).ravel(), minlength=frequencies[groupIndex].size)
+        frequencies[groupIndex] = counts.reshape(seqSize, len(AA_NAMES)) / len(group)
+    return frequencies
+
+
+def _getCodes(sequence):
+    """
+    Returns the ids of the AminoAcids of 'sequence', as bytes.
+    """
+    if hasattr(sequence, "getCodes"):
+        return bytes(sequence.getCodes())
+    return bytes(aminoAcid.getId() for aminoAcid in sequence)
+
+
 def getFrequencies(groupValues, groupSizes):
     """
     Evaluates the frequencies of AminoAcids within columns of groups in 'groupValues'.
     Frequencies are weighted according to group sizes in 'groupSizes'.
+    Returns two dictionaries and a number, as getFrequenciesFromArrays.
+    """
+    frequencies = np.zeros((len(groupSizes), len(groupValues[0]), len(AA_NAMES)))
+    for groupIndex, (groupAAs, groupSize) in enumerate(zip(groupValues, groupSizes)):
+        for col, groupCol in enumerate(groupAAs):
+            for aa, aaCount in groupCol.items():
+                frequencies[groupIndex, col, aa.getId()] = aaCount / groupSize
+    return getFrequenciesFromArrays(frequencies)
+
+
+def getFrequenciesFromArrays(frequencies):
+    """
+    Evaluates the frequencies of AminoAcid pairs found in the same column of two different groups,
+    from the 'frequencies' of AminoAcids in each column of each group (see valueArraysFromGroups).
     Returns two dictionaries and a number:
     -'freqPairs' maps pairs of AminoAcids to their frequencies
     -'freqSingle' maps single AminoAcids to their frequencies
     -'freqSum' is the sum of all frequencies
     """
-    seqSize = len(groupValues[0])  # Size of the Sequences
-    groupCount = len(groupSizes)  # Number of groups
-
-    freqPairs = {}  # frequencies of amino acid pairs (fAB)
-
-    # Frequencies of single amino acids (fA)
-    freqSingle = {AminoAcid(aa): 0 for aa in AminoAcid.getAllNames()}
-
-    freqSum = 0  # Sum of frequencies  sum(fAB)
-
-    for col in range(seqSize):  # Each column
-        for groupAIndex in range(groupCount - 1):  # Each groupA
-            groupA = groupValues[groupAIndex]
-            groupASize = groupSizes[groupAIndex]
+    return _frequenciesFromPairs(getPairFrequencies(frequencies))
 
-            for groupBIndex in range(groupAIndex + 1, groupCount):  # Each further groupB
-                groupB = groupValues[groupBIndex]
-                groupBSize = groupSizes[groupBIndex]
 
-                for aaA, aaACount in groupA[col].items():  # Each AA from groupA
-                    aaAFreq = aaACount / groupASize  # Its frequency within groupA
+def getPairFrequencies(frequencies):
+    """
+    Returns the matrix of the frequencies of AminoAcid pairs (by id) found in the same column of two different groups,
+    from the 'frequencies' of AminoAcids in each column of each group (see valueArraysFromGroups).
+    Each pair of groups is counted twice, once in each order, so the matrix is symmetric.
+    """
+    # pairs[a, b] sums the frequency of a in each group times the frequency of b in all other groups (of the
+    # same column). Its terms are never negative, so pairs that are never found stay exactly null.
+    otherFrequencies = frequencies.sum(axis=0) - frequencies
+    flatFrequencies = frequencies.reshape(-1, len(AA_NAMES))
+    return flatFrequencies.T.dot(otherFrequencies.reshape(-1, len(AA_NAMES)))
 
-                    for aaB, aaBCount in groupB[col].items():  # Each AA from groupB
-                        aaBFreq = aaBCount / groupBSize  # Its frequency within groupB
 
-                        aaPairFreq = aaAFreq * aaBFreq  # Pair frequency
-                        freqSum += aaPairFreq  # Sum of all frequencies
-                        freqSingle[aaA] += aaPairFreq / 2
-                        freqSingle[aaB] += aaPairFreq / 2
+def _frequenciesFromPairs(pairs):
+    """
+    Returns the 'freqPairs', 'freqSingle' and 'freqSum' of getFrequenciesFromArrays, from a matrix of 'pairs'
+    frequencies (see getPairFrequencies).
+    """
+    freqPairs = {}  # frequencies of amino acid pairs (fAB)
+    for aaA, aaB in zip(*np.nonzero(np.tril(pairs))):
+        pairFreq = pairs[aaA, aaB] / 2 if aaA == aaB else (pairs[aaA, aaB] + pairs[aaB, aaA]) / 2
+        freqPairs[(AminoAcid.fromId(int(aaA)), AminoAcid.fromId(int(aaB)))] = float(pairFreq)
 
-                        # Index is unique to this pair
-                        pairIndex = (aaA, aaB) if aaA > aaB else (aaB, aaA)
-                        try:
-                            freqPairs[pairIndex] += aaPairFreq
-                        except:
-                            freqPairs[pairIndex] = aaPairFreq
+    # Frequencies of single amino acids (fA)
+    singleFreqs = pairs.sum(axis=1) / 2
+    freqSingle = {aa: float(singleFreqs[aa.getId()]) for aa in map(AminoAcid, AminoAcid.getAllNames())}
 
+    freqSum = float(pairs.sum() / 2)  # Sum of frequencies  sum(fAB)
     return freqPairs, freqSingle, freqSum
 
 
@@ -183,28 +258,123 @@ def blosumFromProbabilities(probPairs, probSingle, requiredIdentityPercent):
     return scoreMatrix
 
 
-def blosumFromFasta(requiredIdentityPercent, *filepaths):
+class BlosumCounts:
+    """
+    Represents the pair frequencies (see getPairFrequencies) of block files grouped with the same identity,
+    kept separately for each file. Counts can be merged, saved and loaded, so that files are only processed once.
+    """
+
+    def __init__(self, requiredIdentityPercent, fileCounts=None):
+        """
+        Creates counts for groups with an identity of at least 'requiredIdentityPercent', holding 'fileCounts' :
+        a dictionary mapping the absolute path of each file to its (size, modification time, pair frequencies).
+        """
+        self.requiredIdentityPercent = requiredIdentityPercent
+        self.fileCounts = dict(fileCounts or {})
+
+    @staticmethod
+    def fromFasta(path, requiredIdentityPercent):
+        """
+        Returns the counts of the block file (in FASTA format) located in 'path'.
+        """
+        stat = os.stat(path)
+        frequencies = valueArraysFromGroups(makeGroupsFromFasta(path, requiredIdentityPercent))
+        fileCounts = {os.path.abspath(path): (stat.st_size, stat.st_mtime_ns, getPairFrequencies(frequencies))}
+        return BlosumCounts(requiredIdentityPercent, fileCounts)
+
+    def __add__(self, other):
+        """Returns the counts of the files of both counts (those of 'other' replace those of the same files)."""
+        if other.requiredIdentityPercent != self.requiredIdentityPercent:
+            raise ValueError("Only counts with the same identity can be merged")
+        fileCounts = dict(self.fileCounts)
+        fileCounts.update(other.fileCounts)
+        return BlosumCounts(self.requiredIdentityPercent, fileCounts)
+
+    def __len__(self):
+        """Number of files in the counts."""
+        return len(self.fileCounts)
+
+    def isCurrent(self, path):
+        """
+        Returns True if the counts hold the file located in 'path', unchanged since it was counted.
+        """
+        stat = os.stat(path)
+        size, mtime, pairs = self.fileCounts.get(os.path.abspath(path), (None, None, None))
+        return (size, mtime) == (stat.st_size, stat.st_mtime_ns)
+
+    def select(self, *filepaths):
+        """
+        Returns the counts of the files located in 'filepaths' only.
+        """
+        paths = set(map(os.path.abspath, filepaths))
+        return BlosumCounts(self.requiredIdentityPercent,
+                            {path: counts for path, counts in self.fileCounts.items() if path in paths})
+
+    def getFrequencies(self):
+        """
+        Returns the 'freqPairs', 'freqSingle' and 'freqSum' of all files together (see getFrequenciesFromArrays).
+        """
+        pairs = sum((counts[2] for counts in self.fileCounts.values()), np.zeros((len(AA_NAMES), len(AA_NAMES))))
+        return _frequenciesFromPairs(pairs)
+
+    def getScoreMatrix(self):
+        """
+        Returns the BLOSUM ScoreMatrix of all files together.
+        """
+        freqPairs, freqSingle, freqSum = self.getFrequencies()
+        probPairs, probSingle = sumFrequenciesToProb([freqPairs], [freqSingle], [freqSum])
+        return blosumFromProbabilities(probPairs, probSingle, self.requiredIdentityPercent)
+
+    def save(self, path):
+        """
+        Saves the counts to 'path', as a numpy .npz file.
+        """
+        files = [[filePath, size, mtime] for filePath, (size, mtime, pairs) in self.fileCounts.items()]
+        pairs = np.array([counts[2] for counts in self.fileCounts.values()]).reshape(-1, len(AA_NAMES), len(AA_NAMES))
+        with open(path, 'wb') as countsFile:
+            np.savez(countsFile, pairs=pairs, files=np.array(json.dumps(files)),
+                     requiredIdentityPercent=np.array(self.requiredIdentityPercent))
+
+    @staticmethod
+    def load(path):
+        """
+        Returns the counts saved to 'path' (see save).
+        """
+        with np.load(path) as data:
+            files = json.loads(str(data["files"]))
+            fileCounts = {filePath: (size, mtime, pairs)
+                          for (filePath, size, mtime), pairs in zip(files, data["pairs"])}
+            return BlosumCounts(data["requiredIdentityPercent"].item(), fileCounts)
+
+
+def blosumFromFasta(requiredIdentityPercent, *filepaths, workers=None, countsPath=None):
     """
     Creates and returns a ScoreMatrix for all sequences in the provided 'filepaths',
     using the BLOSUM approach with an identity of at least 'requiredIdentityPercent'.
-    Each file is grouped independently and only then their weighted probabilities are merged.
-    :param requiredIdentityPercent: 
-    :param filepaths: 
-    """
-    # Results for each different files are first stored in lists
-    freqPairsList, freqSingleList, freqSumList = [], [], []
-
-    for path in filepaths:  # for each .fasta file
-        groups = makeGroupsFromFasta(path, requiredIdentityPercent)  # groups
-        groupValues, groupSizes = valueDictsFromGroups(groups)  # groups as dicts
-        freqPairs, freqSingle, freqSum = getFrequencies(groupValues, groupSizes)  # frequencies
-
-        freqPairsList.append(freqPairs)  # Append results
-        freqSingleList.append(freqSingle)
-        freqSumList.append(freqSum)
-
-    # Merge (sum) results together
-    probPairs, probSingle = sumFrequenciesToProb(freqPairsList, freqSingleList, freqSumList)
-    # Create the BLOSUM matrix
-    blosum = blosumFromProbabilities(probPairs, probSingle, requiredIdentityPercent)
-    print(blosum)
+    Each file is grouped independently, over 'workers' processes (as many as CPUs if None, none if 1),
+    and only then their weighted probabilities are merged.
+    If 'countsPath' is given, the counts of each file are saved to it (see BlosumCounts), and files that were
+    already counted with the same identity are not processed again.
+    """
+    counts = BlosumCounts(requiredIdentityPercent)
+    if countsPath is not None and os.path.exists(countsPath):
+        savedCounts = BlosumCounts.load(countsPath)
+        if savedCounts.requiredIdentityPercent == requiredIdentityPercent:
+            counts = savedCounts
+
+    # Results for each new or modified file are merged with the previous ones
+    newPaths = [path for path in dict.fromkeys(filepaths) if not counts.isCurrent(path)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    arguments = [(path, requiredIdentityPercent) for path in newPaths]
+    if workers == 1 or len(newPaths) < 2:
+        newCounts = [BlosumCounts.fromFasta(*argument) for argument in arguments]
+    else:
+        with Pool(min(workers, len(newPaths))) as pool:
+            newCounts = pool.starmap(BlosumCounts.fromFasta, arguments)
+    for fileCounts in newCounts:
+        counts += fileCounts
+
+    if countsPath is not None and newCounts:
+        counts.save(countsPath)
+    return counts.select(*filepaths).getScoreMatrix()
@@ -0,0 +1,89 @@
+import heapq
+import os
+from multiprocessing import Pool
+
+from pyprot.align.align import Align
+from pyprot.data.chunks import getChunks, mapChunks
+from pyprot.data.fasta import getSequencesFromFasta
+
+# Alignment settings of the current process, set by _initWorker
+_worker = None
+
+
+def search(query, fastaPath, scoreMatrix, iniGapPenalty=1, extGapPenalty=None, mode="local", hitCount=10,
+           workers=None, chunkSize=256, engine="numpy"):
+    """
+    Aligns the Sequence 'query' against every Sequence of the FASTA file located in 'fastaPath',
+    and returns the 'hitCount' best alignments as a list of Aligned objects, ranked by decreasing score
+    (targets with equal scores are ranked in file order).
+    Targets are read as a stream and scored in chunks of 'chunkSize' Sequences, distributed over 'workers'
+    processes (as many as CPUs if None, none if 1). Alignments are only built for the best hits.
+    'mode' and gap penalties are used as in Align.score, and 'engine' as in Align.
+    """
+    if hitCount < 1:
+        raise ValueError("hitCount must be at least 1")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    settings = (query, scoreMatrix, iniGapPenalty, extGapPenalty, mode, hitCount, engine)
+
+    # Targets are kept with their index in the file, and empty ones are skipped
+    targets = ((index, sequence) for index, sequence in enumerate(getSequencesFromFasta(fastaPath))
+               if len(sequence) > 0)
+    chunks = getChunks(targets, chunkSize)
+    if workers == 1:
+        _initWorker(*settings)
+        try:
+            hits = _bestHits(map(_scoreChunk, chunks), hitCount)
+            return list(map(_alignHit, hits))
+        finally:
+            _initWorker(None, None, None, None, None, None, None)
+
+    with Pool(workers, _initWorker, settings) as pool:
+        # Only a few chunks per process are waiting at once, so the file is never fully loaded
+        scoredChunks = (chunkHits for chunk, chunkHits in mapChunks(pool, _scoreChunk, chunks, 4 * workers))
+        hits = _bestHits(scoredChunks, hitCount)
+        return pool.map(_alignHit, hits)
+
+
+def _bestHits(scoredChunks, hitCount):
+    """
+    Returns the 'hitCount' best (score, -index, Sequence) hits from all 'scoredChunks', best first.
+    """
+    hits = []
+    for chunkHits in scoredChunks:
+        for hit in chunkHits:
+            if len(hits) < hitCount:
+                heapq.heappush(hits, hit)
+            elif hit[:2] > hits[0][:2]:
+                heapq.heapreplace(hits, hit)
+    return sorted(hits, key=lambda hit: hit[:2], reverse=True)
+
+
+def _initWorker(query, scoreMatrix, iniGapPenalty, extGapPenalty, mode, hitCount, engine):
+    """
+    Stores the alignment settings of a search in the current process.
+    """
+    global _worker
+    if query is None:
+        _worker = None
+    else:
+        _worker = (query, Align(scoreMatrix, engine), iniGapPenalty, extGapPenalty, mode, hitCount)
+
+
+def _scoreChunk(chunk):
+    """
+    Scores all (index, Sequence) pairs of 'chunk' against the query, and returns the best hits of the chunk
+    as (score, -index, Sequence) tuples.
+    """
+    query, align, iniGapPenalty, extGapPenalty, mode, hitCount = _worker
+    hits = ((align.score(query, target, iniGapPenalty, extGapPenalty, mode)[0], -index, target)
+            for index, target in chunk)
+    return heapq.nlargest(hitCount, hits, key=lambda hit: hit[:2])
+
+
+def _alignHit(hit):
+    """
+    Returns the Aligned object of a (score, -index, Sequence) hit.
+    """
+    query, align, iniGapPenalty, extGapPenalty, mode, hitCount = _worker
+    return align.linearAlign(query, hit[2], iniGapPenalty, extGapPenalty, mode)
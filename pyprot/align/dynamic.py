@@ -0,0 +1,502 @@
+import numpy as np
+
+from pyprot.base.sequence import CompactSequence
+
+# Origin flags, combined as bits in origin arrays
+ORIGIN_LEFT = 1
+ORIGIN_DIAGONAL = 2
+ORIGIN_TOP = 4
+
+# String representation of each combination of origin flags, as used by Align
+ORIGIN_NAMES = ("", "L", "D", "LD", "T", "LT", "DT", "LDT")
+
+
+def encodeItems(items):
+    """
+    Encodes 'items' (AminoAcids, or any hashable value) as integer codes.
+    Returns the list of distinct items, in order of appearance, and an array mapping each item to its code.
+    """
+    codes = {}
+    encoded = np.empty(len(items), dtype=np.intp)
+    for index, item in enumerate(items):
+        try:
+            encoded[index] = codes[item]
+        except KeyError:
+            encoded[index] = codes[item] = len(codes)
+    return list(codes), encoded
+
+
+def aminoAcidIds(aminoAcids):
+    """
+    Returns the ids of all AminoAcids of 'aminoAcids' (see AminoAcid.getId) as an array.
+    """
+    if isinstance(aminoAcids, CompactSequence):
+        return np.frombuffer(aminoAcids.getCodes(), dtype=np.uint8).astype(np.intp)
+    return np.fromiter((aa.getId() for aa in aminoAcids), dtype=np.intp, count=len(aminoAcids))
+
+
+def substitutionTable(scoreMatrix, rowSeq, colSeq):
+    """
+    Returns a table holding the score between each pair of distinct items of 'rowSeq' and 'colSeq', as given
+    by 'scoreMatrix', along with the codes of 'rowSeq' and 'colSeq' items (indexes in the table).
+    Score matrices with a full table of scores (see ScoreMatrix.getTable) use it directly, with AminoAcid ids as codes.
+    """
+    if hasattr(scoreMatrix, "getTable"):
+        return scoreMatrix.getTable(), aminoAcidIds(rowSeq), aminoAcidIds(colSeq)
+
+    rowItems, rowCodes = encodeItems(rowSeq)
+    colItems, colCodes = encodeItems(colSeq)
+    table = np.array([[scoreMatrix.getScore(rowItem, colItem) for colItem in colItems] for rowItem in rowItems])
+    return table, rowCodes, colCodes
+
+
+def substitutionScores(scoreMatrix, rowSeq, colSeq):
+    """
+    Returns an array of shape (len(rowSeq), len(colSeq)) holding the score between each pair of items
+    of 'rowSeq' and 'colSeq', as given by 'scoreMatrix'.
+    Scores are only looked up once for each distinct pair of items.
+    """
+    table, rowCodes, colCodes = substitutionTable(scoreMatrix, rowSeq, colSeq)
+    return table[np.ix_(rowCodes, colCodes)]
+
+
+def fillMatrices(scores, iniGapPenalty, extGapPenalty, alignMode, gapPenalties=None):
+    """
+    Fills the alignment, row gap, column gap and origin matrices for the substitution 'scores' between
+    row and column items, using the same recurrences as Align (affine gap penalties).
+    Cells are computed one anti-diagonal at a time, since each cell only depends on previous anti-diagonals.
+    If 'gapPenalties' is provided (one value per column, plus one), gap matrices take its values instead
+    of being computed (multiple sequence alignment against a PSSM).
+    Returns the four matrices as arrays of shape (rows + 1, columns + 1).
+    """
+    rowCount, colCount = scores.shape
+    dtype = np.result_type(scores, np.asarray(iniGapPenalty), np.asarray(extGapPenalty))
+    if gapPenalties is not None:
+        gapPenalties = np.asarray(gapPenalties)
+        dtype = np.result_type(dtype, gapPenalties)
+
+    alignMatrix = np.zeros((rowCount + 1, colCount + 1), dtype=dtype)
+    rowGapMatrix = np.zeros_like(alignMatrix)
+    colGapMatrix = np.zeros_like(alignMatrix)
+    originMatrix = np.zeros((rowCount + 1, colCount + 1), dtype=np.uint8)
+
+    # Global alignment : first line and column have initial scores and origins
+    if alignMode == "global":
+        initialValues = iniGapPenalty + extGapPenalty * np.arange(max(rowCount, colCount), dtype=dtype)
+        for matrix in (alignMatrix, rowGapMatrix, colGapMatrix):
+            matrix[0, 1:] = initialValues[:colCount]
+            matrix[1:, 0] = initialValues[:rowCount]
+        originMatrix[0, 1:] = ORIGIN_LEFT
+        originMatrix[1:, 0] = ORIGIN_TOP
+
+    # Cells of an anti-diagonal are evenly spaced in flattened matrices (by 'colCount' cells),
+    # and so are the cells they depend on : they can all be accessed through slices.
+    step = colCount
+    paddedScores = np.zeros_like(alignMatrix)
+    paddedScores[1:, 1:] = scores
+    paddedScores, align, rowGap, colGap, origin = (matrix.reshape(-1) for matrix in (
+        paddedScores, alignMatrix, rowGapMatrix, colGapMatrix, originMatrix))
+    if gapPenalties is not None:
+        paddedPenalties = np.tile(gapPenalties, rowCount + 1)
+
+    for diagonal in range(2, rowCount + colCount + 1):
+        firstRow = max(1, diagonal - colCount)
+        lastRow = min(rowCount, diagonal - 1)
+        start, stop = diagonal + firstRow * step, diagonal + lastRow * step + 1
+        cells = slice(start, stop, step)
+        topCells = slice(start - colCount - 1, stop - colCount - 1, step)
+        leftCells = slice(start - 1, stop - 1, step)
+        diagonalCells = slice(start - colCount - 2, stop - colCount - 2, step)
+
+        if gapPenalties is not None:
+            deleteScores = paddedPenalties[cells]
+            insertScores = paddedPenalties[leftCells]
+        else:
+            deleteScores = np.maximum(align[topCells] + iniGapPenalty, rowGap[topCells] + extGapPenalty)
+            insertScores = np.maximum(align[leftCells] + iniGapPenalty, colGap[leftCells] + extGapPenalty)
+        matchScores = align[diagonalCells] + paddedScores[cells]
+
+        maxScores = np.maximum(np.maximum(insertScores, deleteScores), matchScores)
+        if alignMode == "local":
+            maxScores = np.maximum(maxScores, 0)
+
+        rowGap[cells] = deleteScores
+        colGap[cells] = insertScores
+        align[cells] = maxScores
+        origin[cells] = (ORIGIN_LEFT * (insertScores == maxScores)
+                         + ORIGIN_DIAGONAL * (matchScores == maxScores)
+                         + ORIGIN_TOP * (deleteScores == maxScores))
+
+    return alignMatrix, rowGapMatrix, colGapMatrix, originMatrix
+
+
+def originNames(originMatrix):
+    """
+    Converts an array of origin flags into nested lists of origin strings ("L", "D", "T" concatenations).
+    """
+    return np.array(ORIGIN_NAMES, dtype=object)[originMatrix].tolist()
+
+
+def findBestScores(alignMatrix, minimum=-1):
+    """
+    Returns the maximum score found in 'alignMatrix' (excluding its first row and column, and at least
+    'minimum'), along with the rows and columns where it is found, in row-major order.
+    """
+    scores = np.asarray(alignMatrix)[1:, 1:]
+    maxScore = max(scores.max().item(), minimum)
+    rows, cols = np.nonzero(scores == maxScore)
+    return maxScore, (rows + 1).tolist(), (cols + 1).tolist()
+
+
+def bestScoreByDiagonals(table, rowCodes, colCodes, iniGapPenalty, extGapPenalty, alignMode, transposed=False):
+    """
+    Returns the best alignment score between the Sequences encoded as 'rowCodes' and 'colCodes' (see
+    substitutionTable), along with the row and column where it is found, using the same recurrences as Align.
+    Only the last two anti-diagonals of each matrix are kept, so memory is proportional to the number of rows.
+    Global alignments end in the last cell. Otherwise, ties are broken by taking the first position in
+    row-major order, or column-major order if 'transposed' is True (rows and columns being swapped).
+    """
+    rowCount, colCount = len(rowCodes), len(colCodes)
+    dtype = np.result_type(table, np.asarray(iniGapPenalty), np.asarray(extGapPenalty))
+
+    # Diagonal arrays are indexed by row : cell (row, diagonal - row) is stored at index row
+    align, previousAlign, olderAlign = (np.zeros(rowCount + 1, dtype=dtype) for i in range(3))
+    rowGap, previousRowGap = (np.zeros(rowCount + 1, dtype=dtype) for i in range(2))
+    colGap, previousColGap = (np.zeros(rowCount + 1, dtype=dtype) for i in range(2))
+
+    bestScore, bestRow, bestCol = None, 0, 0
+    for diagonal in range(1, rowCount + colCount + 1):
+        # First row and column (diagonal arrays are reused, so these must always be set)
+        initialValue = iniGapPenalty + extGapPenalty * (diagonal - 1) if alignMode == "global" else 0
+        if diagonal <= colCount:
+            align[0] = rowGap[0] = colGap[0] = initialValue
+        if diagonal <= rowCount:
+            align[diagonal] = rowGap[diagonal] = colGap[diagonal] = initialValue
+
+        firstRow = max(1, diagonal - colCount)
+        lastRow = min(rowCount, diagonal - 1)
+        if firstRow <= lastRow:
+            cells = slice(firstRow, lastRow + 1)
+            topCells = slice(firstRow - 1, lastRow)
+            scores = table[rowCodes[firstRow - 1:lastRow], colCodes[diagonal - lastRow - 1:diagonal - firstRow][::-1]]
+
+            deleteScores = np.maximum(previousAlign[topCells] + iniGapPenalty, previousRowGap[topCells] + extGapPenalty)
+            insertScores = np.maximum(previousAlign[cells] + iniGapPenalty, previousColGap[cells] + extGapPenalty)
+            matchScores = olderAlign[topCells] + scores
+
+            maxScores = np.maximum(np.maximum(insertScores, deleteScores), matchScores)
+            if alignMode == "local":
+                maxScores = np.maximum(maxScores, 0)
+
+            rowGap[cells] = deleteScores
+            colGap[cells] = insertScores
+            align[cells] = maxScores
+
+            if alignMode != "global":
+                # First maximum by row (or last by row when transposed, meaning first by column)
+                if transposed:
+                    index = len(maxScores) - 1 - int(np.argmax(maxScores[::-1]))
+                else:
+                    index = int(np.argmax(maxScores))
+                score, row = maxScores[index].item(), firstRow + index
+                col = diagonal - row
+                isBefore = (row, col) < (bestRow, bestCol) if not transposed else (col, row) < (bestCol, bestRow)
+                if bestScore is None or score > bestScore or (score == bestScore and isBefore):
+                    bestScore, bestRow, bestCol = score, row, col
+
+        # Shift diagonals
+        olderAlign, previousAlign, align = previousAlign, align, olderAlign
+        previousRowGap, rowGap = rowGap, previousRowGap
+        previousColGap, colGap = colGap, previousColGap
+
+    if alignMode == "global":
+        return previousAlign[rowCount].item(), rowCount, colCount
+    return bestScore, bestRow, bestCol
+
+
+# States of a path reaching a cell : last move was diagonal (match), top (row gap) or left (column gap)
+STATES = ("D", "T", "L")
+
+
+def forwardRows(table, rowCodes, colCodes, corner, firstRow, firstCol, lastRow, lastCol, iniGapPenalty,
+                extGapPenalty, blockRow=False, blockCol=False):
+    """
+    Yields, for each row from 'firstRow' to 'lastRow', the best scores of paths starting from cell
+    (firstRow, firstCol) and reaching each column from 'firstCol' to 'lastCol' of that row, for each state
+    (see STATES), as three arrays.
+    'corner' holds the alignment, row gap and column gap scores of the starting cell, as in Align.
+    If 'blockRow' (or 'blockCol') is True, paths cannot go through the first row (or column) of the
+    rectangle : it is the first row (or column) of the whole matrix, which only holds initial values.
+    Each row is computed at once : column gaps only depend on previous columns through a cumulative maximum.
+    """
+    gapPenalty = max(iniGapPenalty, extGapPenalty)  # a gap can always be extended by reopening it
+    width = lastCol - firstCol + 1
+    offsets = gapPenalty * np.arange(width)
+
+    match = np.full(width, -np.inf)
+    rowGap = np.full(width, -np.inf)
+    colGap = np.full(width, -np.inf)
+    match[0], rowGap[0], colGap[0] = corner
+    if not blockRow and width > 1:
+        colGap[1:] = max(corner[0] + iniGapPenalty, corner[2] + gapPenalty) + offsets[:-1]
+    yield firstRow, match, rowGap, colGap
+
+    for row in range(firstRow + 1, lastRow + 1):
+        align = np.maximum(np.maximum(match, rowGap), colGap)
+        rowGap = np.maximum(align + iniGapPenalty, rowGap + gapPenalty)
+        if blockCol:
+            rowGap[0] = -np.inf
+        match = np.empty(width)
+        match[0] = -np.inf
+        match[1:] = align[:-1] + table[rowCodes[row - 1], colCodes[firstCol:lastCol]]
+
+        # colGap[c] = max(best[c - 1] + iniGapPenalty, colGap[c - 1] + gapPenalty)
+        best = np.maximum(match, rowGap)
+        colGap = np.empty(width)
+        colGap[0] = -np.inf
+        colGap[1:] = np.maximum.accumulate(best[:-1] + iniGapPenalty - offsets[:-1]) + offsets[:-1]
+        yield row, match, rowGap, colGap
+
+
+def backwardRows(table, rowCodes, colCodes, lastRow, lastCol, endStates, firstRow, firstCol, iniGapPenalty,
+                 extGapPenalty):
+    """
+    Yields, for each row from 'lastRow' back to 'firstRow', the best scores of paths going from each column
+    (from 'firstCol' to 'lastCol') of that row to cell (lastRow, lastCol), for each state the path is in
+    when reaching the column (see STATES), as three arrays.
+    Paths must reach the last cell in one of 'endStates'.
+    """
+    gapPenalty = max(iniGapPenalty, extGapPenalty)
+    width = lastCol - firstCol + 1
+    offsets = gapPenalty * np.arange(width)
+
+    match, rowGap, colGap = (np.full(width, -np.inf) for i in range(3))
+    for state, scores in zip(STATES, (match, rowGap, colGap)):
+        if state in endStates:
+            scores[-1] = 0
+    # On the last row, only moves to the left remain
+    colGap[:-1] = colGap[-1] + offsets[:0:-1]
+    match[:-1] = rowGap[:-1] = colGap[1:] + iniGapPenalty
+    yield lastRow, match, rowGap, colGap
+
+    for row in range(lastRow - 1, firstRow - 1, -1):
+        top = rowGap
+        diagonal = np.full(width, -np.inf)
+        diagonal[:-1] = match[1:] + table[rowCodes[row], colCodes[firstCol:lastCol]]
+
+        # colGap[c] = max(iniGapPenalty + top[c], diagonal[c], gapPenalty + colGap[c + 1])
+        common = np.maximum(iniGapPenalty + top, diagonal)
+        colGap = np.maximum.accumulate((common + offsets)[::-1])[::-1] - offsets
+        left = np.full(width, -np.inf)
+        left[:-1] = colGap[1:]
+
+        match = np.maximum(np.maximum(iniGapPenalty + top, iniGapPenalty + left), diagonal)
+        rowGap = np.maximum(np.maximum(gapPenalty + top, iniGapPenalty + left), diagonal)
+        yield row, match, rowGap, colGap
+
+
+# Rectangles up to this size (in cells) are solved directly by basePath
+BASE_PATH_AREA = 1 << 14
+
+
+def basePath(table, rowCodes, colCodes, corner, firstRow, firstCol, lastRow, lastCol, endStates, iniGapPenalty,
+             extGapPenalty, blockRow=False, blockCol=False):
+    """
+    Returns the moves ("D", "T" or "L", see STATES) of the best path from cell (firstRow, firstCol) to cell
+    (lastRow, lastCol), which must be reached in one of 'endStates' (see forwardRows for other parameters).
+    All scores of the rectangle are kept : it must be small.
+    """
+    gapPenalty = max(iniGapPenalty, extGapPenalty)
+    rows = [np.array(scores) for row, *scores in forwardRows(
+        table, rowCodes, colCodes, corner, firstRow, firstCol, lastRow, lastCol, iniGapPenalty, extGapPenalty,
+        blockRow, blockCol)]
+
+    row, col = lastRow - firstRow, lastCol - firstCol
+    state = max((rows[row][STATES.index(s)][col], STATES.index(s)) for s in endStates)[1]
+    moves = []
+    while row != 0 or col != 0:
+        moves.append(STATES[state])
+        if STATES[state] == "D":
+            row, col = row - 1, col - 1
+            candidates = rows[row][:, col]
+        elif STATES[state] == "T":
+            row -= 1
+            candidates = rows[row][:, col] + (iniGapPenalty, gapPenalty, iniGapPenalty)
+        else:
+            col -= 1
+            candidates = rows[row][:, col] + (iniGapPenalty, iniGapPenalty, gapPenalty)
+        state = int(np.argmax(candidates))
+    moves.reverse()
+    return moves
+
+
+def linearPath(table, rowCodes, colCodes, corner, firstRow, firstCol, lastRow, lastCol, endStates, iniGapPenalty,
+               extGapPenalty, blockRow=False, blockCol=False):
+    """
+    Returns the same moves as basePath, in memory proportional to the size of the rectangle's sides.
+    The best path crosses the middle row at a cell, and in a state, that maximizes the sum of the best scores
+    from the first cell and to the last cell (Myers and Miller) : both halves are then solved recursively.
+    """
+    if lastRow - firstRow <= 1 or (lastRow - firstRow + 1) * (lastCol - firstCol + 1) <= BASE_PATH_AREA:
+        return basePath(table, rowCodes, colCodes, corner, firstRow, firstCol, lastRow, lastCol, endStates,
+                        iniGapPenalty, extGapPenalty, blockRow, blockCol)
+
+    midRow = (firstRow + lastRow) // 2
+    for row, *forwardScores in forwardRows(table, rowCodes, colCodes, corner, firstRow, firstCol, midRow, lastCol,
+                                           iniGapPenalty, extGapPenalty, blockRow, blockCol):
+        pass
+    for row, *backwardScores in backwardRows(table, rowCodes, colCodes, lastRow, lastCol, endStates, midRow,
+                                             firstCol, iniGapPenalty, extGapPenalty):
+        pass
+
+    totals = np.array(forwardScores) + np.array(backwardScores)
+    stateIndex, colIndex = np.unravel_index(np.argmax(totals), totals.shape)
+    midCol, midState = firstCol + int(colIndex), STATES[stateIndex]
+
+    # The second half starts in the state the first half ends with
+    midCorner = [0 if state in ("D", midState) else -np.inf for state in STATES]
+    return linearPath(table, rowCodes, colCodes, corner, firstRow, firstCol, midRow, midCol, midState,
+                      iniGapPenalty, extGapPenalty, blockRow, blockCol) + \
+        linearPath(table, rowCodes, colCodes, midCorner, midRow, midCol, lastRow, lastCol, endStates,
+                   iniGapPenalty, extGapPenalty)
+
+
+def alignmentPath(table, rowCodes, colCodes, lastRow, lastCol, alignMode, iniGapPenalty, extGapPenalty):
+    """
+    Returns the first row and column of the best alignment (as in Align) ending in cell (lastRow, lastCol),
+    along with the moves ("D", "T" or "L") that lead from there to the last cell, in linear memory.
+    """
+    gapPenalty = max(iniGapPenalty, extGapPenalty)
+
+    def initialValue(index):
+        if alignMode == "global" and index > 0:
+            return iniGapPenalty + extGapPenalty * (index - 1)
+        return 0
+
+    # Paths start from the first row or column of the matrix (or from any cell with a null score, if local) :
+    # find the start of the best path, going back from the last cell.
+    bestScore, startRow, startCol = -np.inf, 0, 0
+    nextScores = None
+    for row, match, rowGap, colGap in backwardRows(table, rowCodes, colCodes, lastRow, lastCol, STATES, 0, 0,
+                                                   iniGapPenalty, extGapPenalty):
+        candidates = np.full(lastCol + 1, -np.inf)
+        if row == 0:
+            # First row : paths go down (top gap) or diagonally, but never left
+            candidates[1:] = gapPenalty + nextScores[1][1:]
+            candidates[:-1] = np.maximum(candidates[:-1], nextScores[0][1:] + table[rowCodes[0], colCodes[:lastCol]])
+            candidates += [initialValue(col) for col in range(lastCol + 1)]
+        else:
+            # First column : paths go left (column gap) or diagonally, but never down
+            candidates[0] = gapPenalty + colGap[1]
+            if row < lastRow:
+                candidates[0] = max(candidates[0], nextScores[0][1] + table[rowCodes[row], colCodes[0]])
+            candidates[0] += initialValue(row)
+            if alignMode == "local":
+                candidates[1:] = match[1:]
+
+        # Among equal scores, the latest start is kept (as when backtracking local alignments)
+        col = int(np.argmax(candidates[::-1]))
+        col = lastCol - col
+        if candidates[col] > bestScore:
+            bestScore, startRow, startCol = candidates[col], row, col
+        nextScores = match, rowGap, colGap
+
+    if startRow == 0 or startCol == 0:
+        value = initialValue(max(startRow, startCol))
+        corner = (value, value, value)
+    else:
+        corner = (0, -np.inf, -np.inf)
+    moves = linearPath(table, rowCodes, colCodes, corner, startRow, startCol, lastRow, lastCol, STATES,
+                       iniGapPenalty, extGapPenalty, startRow == 0, startCol == 0)
+
+    # Global alignments go back to the first cell, through the first row or column
+    if alignMode == "global":
+        moves = ["L"] * startCol + ["T"] * startRow + moves
+        startRow, startCol = 0, 0
+    return startRow, startCol, moves
+
+
+def bandSentinel(dtype):
+    """
+    Returns the value given to cells outside of a band : minus infinity, or a very low integer.
+    """
+    if np.issubdtype(dtype, np.integer):
+        return np.iinfo(dtype).min // 4
+    return -np.inf
+
+
+def fillBand(table, rowCodes, colCodes, iniGapPenalty, extGapPenalty, alignMode, lowDiagonal, highDiagonal):
+    """
+    Fills the same matrices as fillMatrices (for global or semiglobal alignments), but only for cells whose
+    diagonal (column - row) lies between 'lowDiagonal' and 'highDiagonal'.
+    Matrices are returned in band coordinates : cell (row, col) is stored in column col - row - lowDiagonal + 1
+    of an array of shape (rows + 1, band width + 2), where the first and last columns only hold bandSentinel values.
+    """
+    rowCount, colCount = len(rowCodes), len(colCodes)
+    width = highDiagonal - lowDiagonal + 3
+    dtype = np.result_type(table, np.asarray(iniGapPenalty), np.asarray(extGapPenalty))
+
+    alignMatrix = np.full((rowCount + 1, width), bandSentinel(dtype), dtype=dtype)
+    rowGapMatrix = alignMatrix.copy()
+    colGapMatrix = alignMatrix.copy()
+    originMatrix = np.zeros((rowCount + 1, width), dtype=np.uint8)
+
+    # First line and column, within the band
+    for index in range(max(rowCount, colCount) + 1):
+        value = 0
+        if alignMode == "global" and index > 0:
+            value = iniGapPenalty + extGapPenalty * (index - 1)
+        if index <= colCount and lowDiagonal <= index <= highDiagonal:
+            for matrix in (alignMatrix, rowGapMatrix, colGapMatrix):
+                matrix[0, index - lowDiagonal + 1] = value
+            originMatrix[0, index - lowDiagonal + 1] = ORIGIN_LEFT if alignMode == "global" and index > 0 else 0
+        if 0 < index <= rowCount and lowDiagonal <= -index <= highDiagonal:
+            for matrix in (alignMatrix, rowGapMatrix, colGapMatrix):
+                matrix[index, -index - lowDiagonal + 1] = value
+            originMatrix[index, -index - lowDiagonal + 1] = ORIGIN_TOP if alignMode == "global" else 0
+
+    # Cells of an anti-diagonal are evenly spaced in flattened band matrices (by width - 2 cells)
+    step = width - 2
+    align, rowGap, colGap, origin = (matrix.reshape(-1) for matrix in (
+        alignMatrix, rowGapMatrix, colGapMatrix, originMatrix))
+
+    for diagonal in range(2, rowCount + colCount + 1):
+        firstRow = max(1, diagonal - colCount, (diagonal - highDiagonal + 1) // 2)
+        lastRow = min(rowCount, diagonal - 1, (diagonal - lowDiagonal) // 2)
+        if firstRow > lastRow:
+            continue
+        start = firstRow * step + diagonal - lowDiagonal + 1
+        stop = lastRow * step + diagonal - lowDiagonal + 2
+        cells = slice(start, stop, step)
+        topCells = slice(start - width + 1, stop - width + 1, step)
+        leftCells = slice(start - 1, stop - 1, step)
+        diagonalCells = slice(start - width, stop - width, step)
+        scores = table[rowCodes[firstRow - 1:lastRow], colCodes[diagonal - lastRow - 1:diagonal - firstRow][::-1]]
+
+        deleteScores = np.maximum(align[topCells] + iniGapPenalty, rowGap[topCells] + extGapPenalty)
+        insertScores = np.maximum(align[leftCells] + iniGapPenalty, colGap[leftCells] + extGapPenalty)
+        matchScores = align[diagonalCells] + scores
+        maxScores = np.maximum(np.maximum(insertScores, deleteScores), matchScores)
+
+        rowGap[cells] = deleteScores
+        colGap[cells] = insertScores
+        align[cells] = maxScores
+        origin[cells] = (ORIGIN_LEFT * (insertScores == maxScores)
+                         + ORIGIN_DIAGONAL * (matchScores == maxScores)
+                         + ORIGIN_TOP * (deleteScores == maxScores))
+
+    return alignMatrix, rowGapMatrix, colGapMatrix, originMatrix
+
+
+def findBandBestScores(alignMatrix, lowDiagonal, colCount, minimum=-1):
+    """
+    Same as findBestScores, for an alignment matrix in band coordinates (see fillBand).
+    """
+    rows = np.arange(alignMatrix.shape[0])[:, np.newaxis]
+    cols = rows + lowDiagonal - 1 + np.arange(alignMatrix.shape[1])
+    inside = (rows >= 1) & (cols >= 1) & (cols <= colCount)
+    inside[:, 0] = inside[:, -1] = False
+
+    maxScore = max(alignMatrix[inside].max().item(), minimum)
+    rows, bandCols = np.nonzero(inside & (alignMatrix == maxScore))
+    return maxScore, rows.tolist(), (rows + lowDiagonal - 1 + bandCols).tolist()
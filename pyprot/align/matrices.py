@@ -0,0 +1,410 @@
+"""
+Built-in score matrices, loadable by name with ScoreMatrix.named.
+Generated from the .iij files of examples/resources/blosum : each matrix is stored as the short names
+of its amino acids, and the lines of the lower triangle of its scores.
+"""
+
+BLOSUM_ORDER = "ARNDCQEGHILKMFPSTWYVBZX"
+
+MATRICES = {
+    "BLOSUM30": (BLOSUM_ORDER, (
+        ( 4,),
+        (-1,  8),
+        ( 0, -2,  8),
+        ( 0, -1,  1,  9),
+        (-3, -2, -1, -3, 17),
+        ( 1,  3, -1, -1, -2,  8),
+        ( 0, -1, -1,  1,  1,  2,  6),
+        ( 0, -2,  0, -1, -4, -2, -2,  8),
+        (-2, -1, -1, -2, -5,  0,  0, -3, 14),
+        ( 0, -3,  0, -4, -2, -2, -3, -1, -2,  6),
+        (-1, -2, -2, -1,  0, -2, -1, -2, -1,  2,  4),
+        ( 0,  1,  0,  0, -3,  0,  2, -1, -2, -2, -2,  4),
+        ( 1,  0,  0, -3, -2, -1, -1, -2,  2,  1,  2,  2,  6),
+        (-2, -1, -1, -5, -3, -3, -4, -3, -3,  0,  2, -1, -2, 10),
+        (-1, -1, -3, -1, -3,  0,  1, -1,  1, -3, -3,  1, -4, -4, 11),
+        ( 1, -1,  0,  0, -2, -1,  0,  0, -1, -1, -2,  0, -2, -1, -1,  4),
+        ( 1, -3,  1, -1, -2,  0, -2, -2, -2,  0,  0, -1,  0, -2,  0,  2,  5),
+        (-5,  0, -7, -4, -2, -1, -1,  1, -5, -3, -2, -2, -3,  1, -3, -3, -5, 20),
+        (-4,  0, -4, -1, -6, -1, -2, -3,  0, -1,  3, -1, -1,  3, -2, -2, -1,  5,  9),
+        ( 1, -1, -2, -2, -2, -3, -3, -3, -3,  4,  1, -2,  0,  1, -4, -1,  1, -3,  1,  5),
+        ( 0, -2,  4,  5, -2, -1,  0,  0, -2, -2, -1,  0, -2, -3, -2,  0,  0, -5, -3, -2,  5),
+        ( 0,  0, -1,  0,  0,  4,  5, -2,  0, -3, -1,  1, -1, -4,  0, -1, -1, -1, -2, -3,  0,  4),
+        ( 0, -1,  0, -1, -2,  0, -1, -1, -1,  0,  0,  0,  0, -1, -1,  0,  0, -2, -1,  0, -1,  0, -1),
+    )),
+    "BLOSUM35": (BLOSUM_ORDER, (
+        ( 5,),
+        (-1,  8),
+        (-1, -1,  7),
+        (-1, -1,  1,  8),
+        (-2, -3, -1, -3, 15),
+        ( 0,  2,  1, -1, -3,  7),
+        (-1, -1, -1,  2, -1,  2,  6),
+        ( 0, -2,  1, -2, -3, -2, -2,  7),
+        (-2, -1,  1,  0, -4, -1, -1, -2, 12),
+        (-1, -3, -1, -3, -4, -2, -3, -3, -3,  5),
+        (-2, -2, -2, -2, -2, -2, -1, -3, -2,  2,  5),
+        ( 0,  2,  0, -1, -2,  0,  1, -1, -2, -2, -2,  5),
+        ( 0,  0, -1, -3, -4, -1, -2, -1,  1,  1,  3,  0,  6),
+        (-2, -1, -1, -3, -4, -4, -3, -3, -3,  1,  2, -1,  0,  8),
+        (-2, -2, -2, -1, -4,  0,  0, -2, -1, -1, -3,  0, -3, -4, 10),
+        ( 1, -1,  0, -1, -3,  0,  0,  1, -1, -2, -2,  0, -1, -1, -2,  4),
+        ( 0, -2,  0, -1, -1,  0, -1, -2, -2, -1,  0,  0,  0, -1,  0,  2,  5),
+        (-2,  0, -2, -3, -5, -1, -1, -1, -4, -1,  0,  0,  1,  1, -4, -2, -2, 16),
+        (-1,  0, -2, -2, -5,  0, -1, -2,  0,  0,  0, -1,  0,  3, -3, -1, -2,  3,  8),
+        ( 0, -1, -2, -2, -2, -3, -2, -3, -4,  4,  2, -2,  1,  1, -3, -1,  1, -2,  0,  5),
+        (-1, -1,  4,  5, -2,  0,  0,  0,  0, -2, -2,  0, -2, -2, -1,  0, -1, -3, -2, -2,  5),
+        (-1,  0,  0,  1, -2,  4,  5, -2, -1, -3, -2,  1, -2, -3,  0,  0, -1, -1, -1, -2,  0,  4),
+        ( 0, -1,  0, -1, -2, -1, -1, -1, -1,  0,  0,  0,  0, -1, -1,  0,  0, -1, -1,  0, -1,  0, -1),
+    )),
+    "BLOSUM40": (BLOSUM_ORDER, (
+        ( 5,),
+        (-2,  9),
+        (-1,  0,  8),
+        (-1, -1,  2,  9),
+        (-2, -3, -2, -2, 16),
+        ( 0,  2,  1, -1, -4,  8),
+        (-1, -1, -1,  2, -2,  2,  7),
+        ( 1, -3,  0, -2, -3, -2, -3,  8),
+        (-2,  0,  1,  0, -4,  0,  0, -2, 13),
+        (-1, -3, -2, -4, -4, -3, -4, -4, -3,  6),
+        (-2, -2, -3, -3, -2, -2, -2, -4, -2,  2,  6),
+        (-1,  3,  0,  0, -3,  1,  1, -2, -1, -3, -2,  6),
+        (-1, -1, -2, -3, -3, -1, -2, -2,  1,  1,  3, -1,  7),
+        (-3, -2, -3, -4, -2, -4, -3, -3, -2,  1,  2, -3,  0,  9),
+        (-2, -3, -2, -2, -5, -2,  0, -1, -2, -2, -4, -1, -2, -4, 11),
+        ( 1, -1,  1,  0, -1,  1,  0,  0, -1, -2, -3,  0, -2, -2, -1,  5),
+        ( 0, -2,  0, -1, -1, -1, -1, -2, -2, -1, -1,  0, -1, -1,  0,  2,  6),
+        (-3, -2, -4, -5, -6, -1, -2, -2, -5, -3, -1, -2, -2,  1, -4, -5, -4, 19),
+        (-2, -1, -2, -3, -4, -1, -2, -3,  2,  0,  0, -1,  1,  4, -3, -2, -1,  3,  9),
+        ( 0, -2, -3, -3, -2, -3, -3, -4, -4,  4,  2, -2,  1,  0, -3, -1,  1, -3, -1,  5),
+        (-1, -1,  4,  6, -2,  0,  1, -1,  0, -3, -3,  0, -3, -3, -2,  0,  0, -4, -3, -3,  5),
+        (-1,  0,  0,  1, -3,  4,  5, -2,  0, -4, -2,  1, -2, -4, -1,  0, -1, -2, -2, -3,  2,  5),
+        ( 0, -1, -1, -1, -2, -1, -1, -1, -1, -1, -1, -1,  0, -1, -2,  0,  0, -2, -1, -1, -1, -1, -1),
+    )),
+    "BLOSUM45": (BLOSUM_ORDER, (
+        ( 5,),
+        (-2,  7),
+        (-1,  0,  6),
+        (-2, -1,  2,  7),
+        (-1, -3, -2, -3, 12),
+        (-1,  1,  0,  0, -3,  6),
+        (-1,  0,  0,  2, -3,  2,  6),
+        ( 0, -2,  0, -1, -3, -2, -2,  7),
+        (-2,  0,  1,  0, -3,  1,  0, -2, 10),
+        (-1, -3, -2, -4, -3, -2, -3, -4, -3,  5),
+        (-1, -2, -3, -3, -2, -2, -2, -3, -2,  2,  5),
+        (-1,  3,  0,  0, -3,  1,  1, -2, -1, -3, -3,  5),
+        (-1, -1, -2, -3, -2,  0, -2, -2,  0,  2,  2, -1,  6),
+        (-2, -2, -2, -4, -2, -4, -3, -3, -2,  0,  1, -3,  0,  8),
+        (-1, -2, -2, -1, -4, -1,  0, -2, -2, -2, -3, -1, -2, -3,  9),
+        ( 1, -1,  1,  0, -1,  0,  0,  0, -1, -2, -3, -1, -2, -2, -1,  4),
+        ( 0, -1,  0, -1, -1, -1, -1, -2, -2, -1, -1, -1, -1, -1, -1,  2,  5),
+        (-2, -2, -4, -4, -5, -2, -3, -2, -3, -2, -2, -2, -2,  1, -3, -4, -3, 15),
+        (-2, -1, -2, -2, -3, -1, -2, -3,  2,  0,  0, -1,  0,  3, -3, -2, -1,  3,  8),
+        ( 0, -2, -3, -3, -1, -3, -3, -3, -3,  3,  1, -2,  1,  0, -3, -1,  0, -3, -1,  5),
+        (-1, -1,  4,  5, -2,  0,  1, -1,  0, -3, -3,  0, -2, -3, -2,  0,  0, -4, -2, -3,  4),
+        (-1,  0,  0,  1, -3,  4,  4, -2,  0, -3, -2,  1, -1, -3, -1,  0, -1, -2, -2, -3,  2,  4),
+        ( 0, -1, -1, -1, -2, -1, -1, -1, -1, -1, -1, -1, -1, -1, -1,  0,  0, -2, -1, -1, -1, -1, -1),
+    )),
+    "BLOSUM50": (BLOSUM_ORDER, (
+        ( 5,),
+        (-2,  7),
+        (-1, -1,  7),
+        (-2, -2,  2,  8),
+        (-1, -4, -2, -4, 13),
+        (-1,  1,  0,  0, -3,  7),
+        (-1,  0,  0,  2, -3,  2,  6),
+        ( 0, -3,  0, -1, -3, -2, -3,  8),
+        (-2,  0,  1, -1, -3,  1,  0, -2, 10),
+        (-1, -4, -3, -4, -2, -3, -4, -4, -4,  5),
+        (-2, -3, -4, -4, -2, -2, -3, -4, -3,  2,  5),
+        (-1,  3,  0, -1, -3,  2,  1, -2,  0, -3, -3,  6),
+        (-1, -2, -2, -4, -2,  0, -2, -3, -1,  2,  3, -2,  7),
+        (-3, -3, -4, -5, -2, -4, -3, -4, -1,  0,  1, -4,  0,  8),
+        (-1, -3, -2, -1, -4, -1, -1, -2, -2, -3, -4, -1, -3, -4, 10),
+        ( 1, -1,  1,  0, -1,  0, -1,  0, -1, -3, -3,  0, -2, -3, -1,  5),
+        ( 0, -1,  0, -1, -1, -1, -1, -2, -2, -1, -1, -1, -1, -2, -1,  2,  5),
+        (-3, -3, -4, -5, -5, -1, -3, -3, -3, -3, -2, -3, -1,  1, -4, -4, -3, 15),
+        (-2, -1, -2, -3, -3, -1, -2, -3,  2, -1, -1, -2,  0,  4, -3, -2, -2,  2,  8),
+        ( 0, -3, -3, -4, -1, -3, -3, -4, -4,  4,  1, -3,  1, -1, -3, -2,  0, -3, -1,  5),
+        (-2, -1,  4,  5, -3,  0,  1, -1,  0, -4, -4,  0, -3, -4, -2,  0,  0, -5, -3, -4,  5),
+        (-1,  0,  0,  1, -3,  4,  5, -2,  0, -3, -3,  1, -1, -4, -1,  0, -1, -2, -2, -3,  2,  5),
+        (-1, -1, -1, -1, -2, -1, -1, -2, -1, -1, -1, -1, -1, -2, -2, -1,  0, -3, -1, -1, -1, -1, -1),
+    )),
+    "BLOSUM55": (BLOSUM_ORDER, (
+        ( 5,),
+        (-2,  8),
+        (-2, -1,  8),
+        (-2, -2,  2,  8),
+        ( 0, -4, -3, -4, 13),
+        (-1,  1,  0,  0, -4,  7),
+        (-1,  0,  0,  2, -4,  2,  7),
+        ( 0, -3,  0, -2, -3, -2, -3,  8),
+        (-2,  0,  1, -1, -4,  1, -1, -2, 11),
+        (-2, -4, -4, -4, -2, -4, -4, -5, -4,  6),
+        (-2, -3, -4, -5, -2, -3, -4, -5, -3,  2,  6),
+        (-1,  3,  0, -1, -4,  2,  1, -2,  0, -4, -3,  6),
+        (-1, -2, -3, -4, -2,  0, -3, -3, -2,  2,  3, -2,  8),
+        (-3, -3, -4, -5, -3, -4, -4, -4, -1,  0,  1, -4,  0,  9),
+        (-1, -3, -2, -2, -3, -1, -1, -3, -3, -3, -4, -1, -3, -5, 10),
+        ( 2, -1,  1,  0, -1,  0,  0,  0, -1, -3, -3,  0, -2, -3, -1,  5),
+        ( 0, -1,  0, -1, -1, -1, -1, -2, -2, -1, -2, -1, -1, -3, -1,  2,  6),
+        (-4, -3, -5, -5, -4, -2, -3, -3, -3, -3, -3, -4, -2,  2, -5, -4, -3, 15),
+        (-2, -2, -2, -3, -3, -1, -2, -4,  2, -1, -1, -2, -1,  4, -4, -2, -2,  3,  9),
+        ( 0, -3, -4, -4, -1, -3, -3, -4, -4,  4,  1, -3,  1, -1, -3, -2,  0, -4, -2,  5),
+        (-2, -1,  4,  5, -4,  0,  1, -1,  0, -4, -4,  0, -3, -5, -2,  0, -1, -5, -3, -4,  5),
+        (-1,  0,  0,  1, -4,  4,  5, -3,  0, -4, -3,  1, -2, -4, -1,  0, -1, -3, -2, -3,  2,  5),
+        (-1, -1, -1, -2, -2, -1, -1, -2, -1, -1, -1, -1, -1, -2, -2, -1, -1, -3, -1, -1, -1, -1, -1),
+    )),
+    "BLOSUM60": (BLOSUM_ORDER, (
+        ( 4,),
+        (-1,  5),
+        (-1,  0,  6),
+        (-2, -1,  1,  6),
+        ( 0, -3, -2, -3,  9),
+        (-1,  1,  0,  0, -3,  5),
+        (-1,  0,  0,  2, -3,  2,  5),
+        ( 0, -2,  0, -1, -2, -2, -2,  6),
+        (-2,  0,  1, -1, -3,  1,  0, -2,  7),
+        (-1, -3, -3, -3, -1, -3, -3, -3, -3,  4),
+        (-1, -2, -3, -3, -1, -2, -3, -4, -3,  2,  4),
+        (-1,  2,  0, -1, -3,  1,  1, -1, -1, -3, -2,  4),
+        (-1, -1, -2, -3, -1,  0, -2, -2, -1,  1,  2, -1,  5),
+        (-2, -3, -3, -3, -2, -3, -3, -3, -1,  0,  0, -3,  0,  6),
+        (-1, -2, -2, -1, -3, -1, -1, -2, -2, -3, -3, -1, -2, -4,  7),
+        ( 1, -1,  1,  0, -1,  0,  0,  0, -1, -2, -2,  0, -1, -2, -1,  4),
+        ( 0, -1,  0, -1, -1, -1, -1, -2, -2, -1, -1, -1, -1, -2, -1,  1,  4),
+        (-3, -3, -4, -4, -2, -2, -3, -2, -2, -2, -2, -3, -1,  1, -4, -3, -2, 10),
+        (-2, -2, -2, -3, -2, -1, -2, -3,  2, -1, -1, -2, -1,  3, -3, -2, -2,  2,  6),
+        ( 0, -2, -3, -3, -1, -2, -2, -3, -3,  3,  1, -2,  1, -1, -2, -2,  0, -3, -1,  4),
+        (-2, -1,  3,  4, -3,  0,  1, -1,  0, -3, -3,  0, -3, -3, -2,  0,  0, -4, -2, -3,  4),
+        (-1,  0,  0,  1, -3,  3,  4, -2,  0, -3, -2,  1, -1, -3, -1,  0, -1, -2, -2, -2,  1,  3),
+        ( 0, -1, -1, -1, -2, -1, -1, -1, -1, -1, -1, -1, -1, -1, -2,  0,  0, -2, -1, -1, -1, -1, -1),
+    )),
+    "BLOSUM62": (BLOSUM_ORDER, (
+        ( 4,),
+        (-1,  5),
+        (-2,  0,  6),
+        (-2, -2,  1,  6),
+        ( 0, -3, -3, -3,  9),
+        (-1,  1,  0,  0, -3,  5),
+        (-1,  0,  0,  2, -4,  2,  5),
+        ( 0, -2,  0, -1, -3, -2, -2,  6),
+        (-2,  0,  1, -1, -3,  0,  0, -2,  8),
+        (-1, -3, -3, -3, -1, -3, -3, -4, -3,  4),
+        (-1, -2, -3, -4, -1, -2, -3, -4, -3,  2,  4),
+        (-1,  2,  0, -1, -3,  1,  1, -2, -1, -3, -2,  5),
+        (-1, -1, -2, -3, -1,  0, -2, -3, -2,  1,  2, -1,  5),
+        (-2, -3, -3, -3, -2, -3, -3, -3, -1,  0,  0, -3,  0,  6),
+        (-1, -2, -2, -1, -3, -1, -1, -2, -2, -3, -3, -1, -2, -4,  7),
+        ( 1, -1,  1,  0, -1,  0,  0,  0, -1, -2, -2,  0, -1, -2, -1,  4),
+        ( 0, -1,  0, -1, -1, -1, -1, -2, -2, -1, -1, -1, -1, -2, -1,  1,  5),
+        (-3, -3, -4, -4, -2, -2, -3, -2, -2, -3, -2, -3, -1,  1, -4, -3, -2, 11),
+        (-2, -2, -2, -3, -2, -1, -2, -3,  2, -1, -1, -2, -1,  3, -3, -2, -2,  2,  7),
+        ( 0, -3, -3, -3, -1, -2, -2, -3, -3,  3,  1, -2,  1, -1, -2, -2,  0, -3, -1,  4),
+        (-2, -1,  3,  4, -3,  0,  1, -1,  0, -3, -4,  0, -3, -3, -2,  0, -1, -4, -3, -3,  4),
+        (-1,  0,  0,  1, -3,  3,  4, -2,  0, -3, -3,  1, -1, -3, -1,  0, -1, -3, -2, -2,  1,  4),
+        ( 0, -1, -1, -1, -2, -1, -1, -1, -1, -1, -1, -1, -1, -1, -2,  0,  0, -2, -1, -1, -1, -1, -1),
+    )),
+    "BLOSUM65": (BLOSUM_ORDER, (
+        ( 4,),
+        (-1,  6),
+        (-2,  0,  6),
+        (-2, -2,  1,  6),
+        ( 0, -4, -3, -4,  9),
+        (-1,  1,  0,  0, -3,  6),
+        (-1,  0,  0,  2, -4,  2,  5),
+        ( 0, -2, -1, -1, -3, -2, -2,  6),
+        (-2,  0,  1, -1, -3,  1,  0, -2,  8),
+        (-1, -3, -3, -3, -1, -3, -3, -4, -3,  4),
+        (-2, -2, -4, -4, -1, -2, -3, -4, -3,  2,  4),
+        (-1,  2,  0, -1, -3,  1,  1, -2, -1, -3, -3,  5),
+        (-1, -2, -2, -3, -2,  0, -2, -3, -2,  1,  2, -2,  6),
+        (-2, -3, -3, -4, -2, -3, -3, -3, -1,  0,  0, -3,  0,  6),
+        (-1, -2, -2, -2, -3, -1, -1, -2, -2, -3, -3, -1, -3, -4,  8),
+        ( 1, -1,  1,  0, -1,  0,  0,  0, -1, -2, -3,  0, -2, -2, -1,  4),
+        ( 0, -1,  0, -1, -1, -1, -1, -2, -2, -1, -1, -1, -1, -2, -1,  1,  5),
+        (-3, -3, -4, -5, -2, -2, -3, -3, -2, -2, -2, -3, -2,  1, -4, -3, -3, 10),
+        (-2, -2, -2, -3, -2, -2, -2, -3,  2, -1, -1, -2, -1,  3, -3, -2, -2,  2,  7),
+        ( 0, -3, -3, -3, -1, -2, -3, -3, -3,  3,  1, -2,  1, -1, -2, -2,  0, -3, -1,  4),
+        (-2, -1,  3,  4, -3,  0,  1, -1,  0, -3, -4,  0, -3, -3, -2,  0, -1, -4, -3, -3,  4),
+        (-1,  0,  0,  1, -4,  3,  4, -2,  0, -3, -3,  1, -2, -3, -1,  0, -1, -3, -2, -2,  1,  4),
+        (-1, -1, -1, -1, -2, -1, -1, -2, -1, -1, -1, -1, -1, -2, -2, -1, -1, -2, -1, -1, -1, -1, -1),
+    )),
+    "BLOSUM70": (BLOSUM_ORDER, (
+        ( 4,),
+        (-2,  6),
+        (-2, -1,  6),
+        (-2, -2,  1,  6),
+        (-1, -4, -3, -4,  9),
+        (-1,  1,  0, -1, -3,  6),
+        (-1,  0,  0,  1, -4,  2,  5),
+        ( 0, -3, -1, -2, -3, -2, -2,  6),
+        (-2,  0,  0, -1, -4,  1,  0, -2,  8),
+        (-2, -3, -4, -4, -1, -3, -4, -4, -4,  4),
+        (-2, -3, -4, -4, -2, -2, -3, -4, -3,  2,  4),
+        (-1,  2,  0, -1, -4,  1,  1, -2, -1, -3, -3,  5),
+        (-1, -2, -2, -3, -2,  0, -2, -3, -2,  1,  2, -2,  6),
+        (-2, -3, -3, -4, -2, -3, -4, -4, -1,  0,  0, -3,  0,  6),
+        (-1, -2, -2, -2, -3, -2, -1, -3, -2, -3, -3, -1, -3, -4,  8),
+        ( 1, -1,  0,  0, -1,  0,  0, -1, -1, -3, -3,  0, -2, -3, -1,  4),
+        ( 0, -1,  0, -1, -1, -1, -1, -2, -2, -1, -2, -1, -1, -2, -1,  1,  5),
+        (-3, -3, -4, -5, -3, -2, -4, -3, -2, -3, -2, -3, -2,  1, -4, -3, -3, 11),
+        (-2, -2, -2, -4, -3, -2, -3, -4,  2, -1, -1, -2, -1,  3, -3, -2, -2,  2,  7),
+        ( 0, -3, -3, -4, -1, -2, -3, -4, -3,  3,  1, -3,  1, -1, -3, -2,  0, -3, -2,  4),
+        (-2, -1,  3,  4, -4,  0,  1, -1, -1, -4, -4, -1, -3, -4, -2,  0, -1, -4, -3, -3,  4),
+        (-1,  0,  0,  1, -4,  3,  4, -2,  0, -3, -3,  1, -2, -4, -1,  0, -1, -3, -2, -3,  0,  4),
+        (-1, -1, -1, -2, -2, -1, -1, -2, -1, -1, -1, -1, -1, -2, -2, -1, -1, -3, -2, -1, -1, -1, -1),
+    )),
+    "BLOSUM75": (BLOSUM_ORDER, (
+        ( 4,),
+        (-2,  6),
+        (-2, -1,  6),
+        (-2, -2,  1,  6),
+        (-1, -4, -3, -4,  9),
+        (-1,  1,  0, -1, -3,  6),
+        (-1,  0, -1,  1, -5,  2,  5),
+        ( 0, -3, -1, -2, -3, -2, -3,  6),
+        (-2,  0,  0, -1, -4,  1,  0, -2,  8),
+        (-2, -3, -4, -4, -1, -3, -4, -5, -4,  4),
+        (-2, -3, -4, -4, -2, -3, -4, -4, -3,  1,  4),
+        (-1,  2,  0, -1, -4,  1,  1, -2, -1, -3, -3,  5),
+        (-1, -2, -3, -4, -2,  0, -2, -3, -2,  1,  2, -2,  6),
+        (-3, -3, -4, -4, -2, -4, -4, -4, -2,  0,  0, -4,  0,  6),
+        (-1, -2, -3, -2, -4, -2, -1, -3, -2, -3, -3, -1, -3, -4,  8),
+        ( 1, -1,  0, -1, -1,  0,  0, -1, -1, -3, -3,  0, -2, -3, -1,  5),
+        ( 0, -1,  0, -1, -1, -1, -1, -2, -2, -1, -2, -1, -1, -2, -1,  1,  5),
+        (-3, -3, -4, -5, -3, -2, -4, -3, -2, -3, -2, -4, -2,  1, -5, -3, -3, 11),
+        (-2, -2, -3, -4, -3, -2, -3, -4,  2, -2, -1, -2, -2,  3, -4, -2, -2,  2,  7),
+        ( 0, -3, -3, -4, -1, -2, -3, -4, -4,  3,  1, -3,  1, -1, -3, -2,  0, -3, -2,  4),
+        (-2, -1,  3,  4, -4,  0,  1, -1, -1, -4, -4, -1, -3, -4, -2,  0, -1, -5, -3, -4,  4),
+        (-1,  0,  0,  1, -4,  3,  4, -2,  0, -4, -3,  1, -2, -4, -2,  0, -1, -3, -3, -3,  0,  4),
+        (-1, -1, -1, -2, -2, -1, -1, -2, -1, -2, -1, -1, -1, -2, -2, -1, -1, -3, -2, -1, -2, -1, -1),
+    )),
+    "BLOSUM80": (BLOSUM_ORDER, (
+        ( 5,),
+        (-2,  6),
+        (-2, -1,  6),
+        (-2, -2,  1,  6),
+        (-1, -4, -3, -4,  9),
+        (-1,  1,  0, -1, -4,  6),
+        (-1, -1, -1,  1, -5,  2,  6),
+        ( 0, -3, -1, -2, -4, -2, -3,  6),
+        (-2,  0,  0, -2, -4,  1,  0, -3,  8),
+        (-2, -3, -4, -4, -2, -3, -4, -5, -4,  5),
+        (-2, -3, -4, -5, -2, -3, -4, -4, -3,  1,  4),
+        (-1,  2,  0, -1, -4,  1,  1, -2, -1, -3, -3,  5),
+        (-1, -2, -3, -4, -2,  0, -2, -4, -2,  1,  2, -2,  6),
+        (-3, -4, -4, -4, -3, -4, -4, -4, -2, -1,  0, -4,  0,  6),
+        (-1, -2, -3, -2, -4, -2, -2, -3, -3, -4, -3, -1, -3, -4,  8),
+        ( 1, -1,  0, -1, -2,  0,  0, -1, -1, -3, -3, -1, -2, -3, -1,  5),
+        ( 0, -1,  0, -1, -1, -1, -1, -2, -2, -1, -2, -1, -1, -2, -2,  1,  5),
+        (-3, -4, -4, -6, -3, -3, -4, -4, -3, -3, -2, -4, -2,  0, -5, -4, -4, 11),
+        (-2, -3, -3, -4, -3, -2, -3, -4,  2, -2, -2, -3, -2,  3, -4, -2, -2,  2,  7),
+        ( 0, -3, -4, -4, -1, -3, -3, -4, -4,  3,  1, -3,  1, -1, -3, -2,  0, -3, -2,  4),
+        (-2, -2,  4,  4, -4,  0,  1, -1, -1, -4, -4, -1, -3, -4, -2,  0, -1, -5, -3, -4,  4),
+        (-1,  0,  0,  1, -4,  3,  4, -3,  0, -4, -3,  1, -2, -4, -2,  0, -1, -4, -3, -3,  0,  4),
+        (-1, -1, -1, -2, -3, -1, -1, -2, -2, -2, -2, -1, -1, -2, -2, -1, -1, -3, -2, -1, -2, -1, -1),
+    )),
+    "BLOSUM85": (BLOSUM_ORDER, (
+        ( 5,),
+        (-2,  6),
+        (-2, -1,  7),
+        (-2, -2,  1,  7),
+        (-1, -4, -4, -5,  9),
+        (-1,  1,  0, -1, -4,  6),
+        (-1, -1, -1,  1, -5,  2,  6),
+        ( 0, -3, -1, -2, -4, -3, -3,  6),
+        (-2,  0,  0, -2, -5,  1, -1, -3,  8),
+        (-2, -4, -4, -5, -2, -4, -4, -5, -4,  5),
+        (-2, -3, -4, -5, -2, -3, -4, -5, -3,  1,  4),
+        (-1,  2,  0, -1, -4,  1,  0, -2, -1, -3, -3,  6),
+        (-2, -2, -3, -4, -2,  0, -3, -4, -3,  1,  2, -2,  7),
+        (-3, -4, -4, -4, -3, -4, -4, -4, -2, -1,  0, -4, -1,  7),
+        (-1, -2, -3, -2, -4, -2, -2, -3, -3, -4, -4, -2, -3, -4,  8),
+        ( 1, -1,  0, -1, -2, -1, -1, -1, -1, -3, -3, -1, -2, -3, -1,  5),
+        ( 0, -2,  0, -2, -2, -1, -1, -2, -2, -1, -2, -1, -1, -3, -2,  1,  5),
+        (-3, -4, -5, -6, -4, -3, -4, -4, -3, -3, -3, -5, -2,  0, -5, -4, -4, 11),
+        (-3, -3, -3, -4, -3, -2, -4, -5,  2, -2, -2, -3, -2,  3, -4, -2, -2,  2,  7),
+        (-1, -3, -4, -4, -1, -3, -3, -4, -4,  3,  0, -3,  0, -1, -3, -2,  0, -3, -2,  5),
+        (-2, -2,  4,  4, -4, -1,  0, -1, -1, -5, -5, -1, -4, -4, -3,  0, -1, -5, -4, -4,  4),
+        (-1,  0, -1,  1, -5,  4,  4, -3,  0, -4, -4,  1, -2, -4, -2, -1, -1, -4, -3, -3,  0,  4),
+        (-1, -2, -2, -2, -3, -1, -1, -2, -2, -2, -2, -1, -1, -2, -2, -1, -1, -3, -2, -1, -2, -1, -2),
+    )),
+    "BLOSUM90": (BLOSUM_ORDER, (
+        ( 5,),
+        (-2,  6),
+        (-2, -1,  7),
+        (-3, -3,  1,  7),
+        (-1, -5, -4, -5,  9),
+        (-1,  1,  0, -1, -4,  7),
+        (-1, -1, -1,  1, -6,  2,  6),
+        ( 0, -3, -1, -2, -4, -3, -3,  6),
+        (-2,  0,  0, -2, -5,  1, -1, -3,  8),
+        (-2, -4, -4, -5, -2, -4, -4, -5, -4,  5),
+        (-2, -3, -4, -5, -2, -3, -4, -5, -4,  1,  5),
+        (-1,  2,  0, -1, -4,  1,  0, -2, -1, -4, -3,  6),
+        (-2, -2, -3, -4, -2,  0, -3, -4, -3,  1,  2, -2,  7),
+        (-3, -4, -4, -5, -3, -4, -5, -5, -2, -1,  0, -4, -1,  7),
+        (-1, -3, -3, -3, -4, -2, -2, -3, -3, -4, -4, -2, -3, -4,  8),
+        ( 1, -1,  0, -1, -2, -1, -1, -1, -2, -3, -3, -1, -2, -3, -2,  5),
+        ( 0, -2,  0, -2, -2, -1, -1, -3, -2, -1, -2, -1, -1, -3, -2,  1,  6),
+        (-4, -4, -5, -6, -4, -3, -5, -4, -3, -4, -3, -5, -2,  0, -5, -4, -4, 11),
+        (-3, -3, -3, -4, -4, -3, -4, -5,  1, -2, -2, -3, -2,  3, -4, -3, -2,  2,  8),
+        (-1, -3, -4, -5, -2, -3, -3, -5, -4,  3,  0, -3,  0, -2, -3, -2, -1, -3, -3,  5),
+        (-2, -2,  4,  4, -4, -1,  0, -2, -1, -5, -5, -1, -4, -4, -3,  0, -1, -6, -4, -4,  4),
+        (-1,  0, -1,  0, -5,  4,  4, -3,  0, -4, -4,  1, -2, -4, -2, -1, -1, -4, -3, -3,  0,  4),
+        (-1, -2, -2, -2, -3, -1, -2, -2, -2, -2, -2, -1, -1, -2, -2, -1, -1, -3, -2, -2, -2, -1, -2),
+    )),
+    "BLOSUM95": (BLOSUM_ORDER, (
+        ( 5,),
+        (-2,  7),
+        (-2, -1,  7),
+        (-3, -3,  1,  7),
+        (-1, -5, -4, -5,  9),
+        (-1,  0,  0, -1, -4,  7),
+        (-1, -1, -1,  1, -6,  2,  6),
+        (-1, -4, -1, -2, -5, -3, -3,  6),
+        (-3, -1,  0, -2, -5,  1, -1, -3,  9),
+        (-2, -4, -4, -5, -2, -4, -4, -6, -4,  5),
+        (-2, -3, -5, -5, -3, -3, -4, -5, -4,  1,  5),
+        (-1,  2,  0, -2, -5,  1,  0, -3, -1, -4, -3,  6),
+        (-2, -2, -3, -5, -3, -1, -3, -4, -3,  1,  2, -2,  7),
+        (-3, -4, -4, -5, -3, -4, -5, -5, -2, -1,  0, -4, -1,  7),
+        (-1, -3, -3, -3, -5, -2, -2, -4, -3, -4, -4, -2, -3, -5,  8),
+        ( 1, -2,  0, -1, -2, -1, -1, -1, -2, -3, -3, -1, -3, -3, -2,  5),
+        ( 0, -2, -1, -2, -2, -1, -2, -3, -2, -2, -2, -1, -1, -3, -2,  1,  6),
+        (-4, -4, -5, -6, -4, -3, -5, -5, -3, -4, -3, -5, -2,  0, -5, -4, -4, 11),
+        (-3, -3, -3, -5, -4, -3, -4, -5,  1, -2, -2, -3, -3,  3, -5, -3, -3,  2,  8),
+        (-1, -4, -4, -5, -2, -3, -3, -5, -4,  3,  0, -3,  0, -2, -4, -3, -1, -3, -3,  5),
+        (-3, -2,  4,  4, -4, -1,  0, -2, -1, -5, -5, -1, -4, -5, -3, -1, -1, -6, -4, -5,  4),
+        (-1, -1, -1,  0, -5,  4,  4, -3,  0, -4, -4,  0, -2, -4, -2, -1, -2, -4, -4, -3,  0,  4),
+        (-1, -2, -2, -2, -3, -1, -2, -3, -2, -2, -2, -1, -2, -2, -3, -1, -1, -4, -2, -2, -2, -1, -2),
+    )),
+    "BLOSUM100": (BLOSUM_ORDER, (
+        ( 5,),
+        (-2,  7),
+        (-2, -1,  7),
+        (-3, -3,  1,  7),
+        (-1, -5, -4, -5,  9),
+        (-1,  0, -1, -2, -5,  7),
+        (-2, -2, -1,  1, -6,  1,  6),
+        (-1, -4, -2, -3, -5, -3, -4,  6),
+        (-3, -1,  0, -2, -5,  0, -1, -4,  9),
+        (-3, -4, -5, -6, -2, -4, -5, -6, -5,  5),
+        (-3, -4, -5, -6, -3, -3, -5, -5, -4,  1,  5),
+        (-2,  2, -1, -2, -5,  1,  0, -3, -2, -4, -4,  6),
+        (-2, -2, -4, -5, -3, -1, -4, -5, -3,  1,  2, -2,  8),
+        (-4, -4, -5, -5, -3, -4, -5, -5, -2, -1,  0, -4, -1,  7),
+        (-1, -3, -4, -3, -5, -2, -3, -4, -3, -4, -4, -2, -4, -5,  8),
+        ( 1, -2,  0, -1, -2, -1, -1, -1, -2, -4, -4, -1, -3, -3, -2,  6),
+        (-1, -2, -1, -2, -2, -2, -2, -3, -3, -2, -3, -2, -2, -3, -3,  1,  6),
+        (-4, -4, -6, -7, -5, -3, -5, -5, -3, -4, -4, -5, -3,  0, -6, -4, -5, 11),
+        (-4, -3, -3, -5, -4, -3, -4, -6,  1, -3, -3, -4, -3,  3, -5, -3, -3,  1,  8),
+        (-1, -4, -4, -5, -2, -3, -3, -5, -5,  2,  0, -4,  0, -2, -4, -3, -1, -4, -3,  5),
+        (-3, -2,  4,  4, -5, -1,  0, -2, -1, -5, -5, -1, -4, -5, -3, -1, -2, -6, -4, -5,  4),
+        (-2, -1, -1,  0, -6,  3,  5, -4, -1, -4, -4,  0, -3, -5, -3, -1, -2, -4, -4, -3,  1,  4),
+        (-1, -2, -2, -3, -3, -2, -2, -3, -2, -2, -2, -2, -2, -3, -3, -1, -1, -4, -3, -2, -2, -2, -2),
+    )),
+}
@@ -1,6 +1,10 @@
+import os
 from math import sqrt, log
 
-from pyprot.base.aminoacid import AminoAcid
+import numpy as np
+
+from pyprot.align import matrices
+from pyprot.base.aminoacid import AminoAcid, AA_NAMES
 from pyprot.base.sequence import Sequence
 
 
@@ -9,33 +13,32 @@ class ScoreMatrix:
     Represents a scoring matrix, used to determine the score between two Amino Acids
     """
 
-    def __init__(self, path="", description="", ignore=None):
+    _iijValues = {}  # values read from iij files, by absolute path : (modification time, values)
+
+    def __init__(self, path="", description="", ignore=None, missingScore=0, values=None):
         """
         Creates a Score object.
-        If 'path' is provided, loads the Score values from an iij file.
+        If 'path' is provided, loads the Score values from an iij file (each file is only parsed once while unchanged).
+        If 'values' is provided, loads them instead : they are the short names of the AminoAcids of the matrix,
+        and the lines of the lower triangle of its scores (see pyprot.align.matrices).
         Otherwise, creates a Score for all possible AminoAcids with values 0.
+        'missingScore' is the score of AminoAcids that are not part of the matrix (such as U, O or J in BLOSUM files).
         """
         self._description = description
+        self._missingScore = missingScore
         self._ignore = Sequence(ignore)
         self._matrix = []
         self._aaOrder = {}
         self._aaSequence = Sequence()
 
-        # If path is provided, load directly from iij file
+        # If path or values are provided, load them
         if path != "":
-            with open(path, 'r') as file:
-                foundAAOrder = False  # Have we found the line with the amino acid values and order yet?
-                for line in file:
-                    if line[0] != "#":  # Comments
-
-                        if not foundAAOrder:  # Read aa values and order
-                            for aa in line.split():
-                                self._aaSequence.extend(aa)
-                            self._aaOrder = {aa: index for aa, index in
-                                             zip(self._aaSequence, range(len(self._aaSequence)))}
-                            foundAAOrder = True
-                        else:  # Read matrix values
-                            self._matrix.append([int(v) for v in line.split()])
+            values = ScoreMatrix.__readIij(path)
+        if values is not None:
+            names, lines = values
+            self._aaSequence = Sequence(list(names))
+            self._aaOrder = {aa: index for index, aa in enumerate(self._aaSequence)}
+            self._matrix = [list(line) for line in lines]
 
         # Otherwise initialize matrix with 0
         else:
@@ -47,6 +50,56 @@ class ScoreMatrix:
                     self._matrix.append([0 for i in range(lineSize)])
                     lineSize += 1
 
+        self.__fillTable()
+
+    @staticmethod
+    def named(name, missingScore=0):
+        """
+        Returns a new ScoreMatrix from the built-in matrix called 'name' (see pyprot.align.matrices),
+        such as "BLOSUM62". No file is read.
+        """
+        try:
+            values = matrices.MATRICES[name.upper()]
+        except KeyError:
+            raise ValueError("Unknown score matrix {}".format(name))
+        return ScoreMatrix("", name.upper(), missingScore=missingScore, values=values)
+
+    @staticmethod
+    def __readIij(path):
+        """
+        Returns the values of the iij file at 'path' (see __init__), which are only read again once the file changes.
+        """
+        absolutePath = os.path.abspath(path)
+        modificationTime = os.stat(absolutePath).st_mtime_ns
+        cached = ScoreMatrix._iijValues.get(absolutePath)
+        if cached is not None and cached[0] == modificationTime:
+            return cached[1]
+
+        names, lines = None, []
+        with open(path, 'r') as file:
+            for line in file:
+                if line[0] != "#":  # Comments
+                    if names is None:  # Read aa values and order
+                        names = tuple(line.split())
+                    else:  # Read matrix values
+                        lines.append(tuple(int(v) for v in line.split()))
+
+        values = (names, tuple(lines))
+        ScoreMatrix._iijValues[absolutePath] = (modificationTime, values)
+        return values
+
+    def __fillTable(self):
+        """
+        Fills the full symmetric table of scores, indexed by AminoAcid ids (see AminoAcid.getId).
+        The table is also kept as nested lists, which are faster for single lookups.
+        """
+        ids = [aa.getId() for aa in self._aaSequence]
+        self._scores = [[self._missingScore for i in range(len(AA_NAMES))] for j in range(len(AA_NAMES))]
+        for id1, line in zip(ids, self._matrix):
+            for id2, value in zip(ids, line):
+                self._scores[id1][id2] = self._scores[id2][id1] = value
+        self._table = np.array(self._scores)
+
     # Representation
     def __repr__(self):
         """
@@ -78,16 +131,36 @@ class ScoreMatrix:
         else:
             self._matrix[id2][id1] = score
 
+        if np.result_type(self._table, score) != self._table.dtype:
+            self._table = self._table.astype(np.result_type(self._table, score))
+        self._table[aa1.getId(), aa2.getId()] = self._table[aa2.getId(), aa1.getId()] = score
+        self._scores[aa1.getId()][aa2.getId()] = self._scores[aa2.getId()][aa1.getId()] = score
+
     def getScore(self, aa1, aa2):
         """
         Get the score assigned to AminoAcids 'aa1', 'aa2'.
         """
-        id1 = self._aaOrder[aa1]
-        id2 = self._aaOrder[aa2]
-        if id1 > id2:
-            return self._matrix[id1][id2]
-        else:
-            return self._matrix[id2][id1]
+        return self._scores[aa1.getId()][aa2.getId()]
+
+    def getScores(self, idsA, idsB):
+        """
+        Get the scores assigned to each pair of AminoAcid ids from 'idsA' and 'idsB' (see AminoAcid.getId),
+        which can be arrays, lists or bytes (such as CompactSequence.getCodes()) and are broadcast together.
+        """
+        return self._table[ScoreMatrix.__idArray(idsA), ScoreMatrix.__idArray(idsB)]
+
+    @staticmethod
+    def __idArray(ids):
+        if isinstance(ids, (bytes, bytearray, memoryview)):
+            return np.frombuffer(ids, dtype=np.uint8)
+        return np.asarray(ids)
+
+    def getTable(self):
+        """
+        Returns the full symmetric array of scores, indexed by AminoAcid ids (see AminoAcid.getId).
+        The array must not be modified (use setScore instead).
+        """
+        return self._table
 
 
 # AA frequencies for complete UniProt database
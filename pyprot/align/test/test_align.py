@@ -0,0 +1,132 @@
+import os
+from unittest import TestCase
+
+from pyprot.align.align import Align
+from pyprot.align.score import ScoreMatrix
+from pyprot.base.sequence import Sequence
+
+RESOURCES = os.path.join(os.path.dirname(__file__), "..", "..", "..", "examples", "resources")
+BLOSUM62 = os.path.join(RESOURCES, "blosum", "blosum62.iij")
+
+
+class TestAlign(TestCase):
+    def setUp(self):
+        self.scoreMatrix = ScoreMatrix(BLOSUM62, "BLOSUM62")
+        self.seqA = Sequence("HEAGAWGHEEKLLSPYWAGHTRC", "seqA")
+        self.seqB = Sequence("PAWHEAEWKLLSPWHWAGHC", "seqB")
+
+    def alignBothEngines(self, method, *args, **kwargs):
+        results = []
+        for engine in ("python", "numpy"):
+            align = Align(self.scoreMatrix, engine)
+            results.append([repr(aligned) for aligned in getattr(align, method)(*args, **kwargs)])
+        return results
+
+    def test_unknownEngine(self):
+        with self.assertRaises(ValueError):
+            Align(self.scoreMatrix, "fortran")
+
+    def test_numpyEngine_global(self):
+        pythonResults, numpyResults = self.alignBothEngines("globalAlign", self.seqA, self.seqB, -8, -2,
+                                                            resultCount=10)
+        self.assertTrue(len(pythonResults) > 0)
+        self.assertEqual(pythonResults, numpyResults)
+
+    def test_numpyEngine_semiGlobal(self):
+        pythonResults, numpyResults = self.alignBothEngines("globalAlign", self.seqA, self.seqB, -4, -1,
+                                                            semiGlobal=True, resultCount=10)
+        self.assertTrue(len(pythonResults) > 0)
+        self.assertEqual(pythonResults, numpyResults)
+
+    def test_numpyEngine_localSuboptimal(self):
+        pythonResults, numpyResults = self.alignBothEngines("localAlign", self.seqA, self.seqB, -4, -1,
+                                                            resultCount=2, subOptimalDepth=2)
+        self.assertTrue(len(pythonResults) > 0)
+        self.assertEqual(pythonResults, numpyResults)
+
+    def test_numpyEngine_sameMatrices(self):
+        aligns = [Align(self.scoreMatrix, engine) for engine in ("python", "numpy")]
+        for align in aligns:
+            next(align.localAlign(self.seqA, self.seqB, -8, -2))
+        self.assertEqual(repr(aligns[0]), repr(aligns[1]))
+
+    def test_score_global(self):
+        aligned = next(Align(self.scoreMatrix).globalAlign(self.seqA, self.seqB, -8, -2, resultCount=1))
+        for engine in ("python", "numpy"):
+            score = Align(self.scoreMatrix, engine).score(self.seqA, self.seqB, -8, -2, mode="global")
+            self.assertEqual(score, (aligned.alignScore, len(self.seqA), len(self.seqB)))
+
+    def test_score_local(self):
+        aligned = next(Align(self.scoreMatrix).localAlign(self.seqA, self.seqB, -4, -1))
+        for engine in ("python", "numpy"):
+            ends = (aligned.seqAEnd, aligned.seqBEnd)
+            for seqA, seqB, expectedEnds in ((self.seqA, self.seqB, ends), (self.seqB, self.seqA, ends[::-1])):
+                score, seqAEnd, seqBEnd = Align(self.scoreMatrix, engine).score(seqA, seqB, -4, -1, mode="local")
+                self.assertEqual(score, aligned.alignScore)
+                self.assertEqual((seqAEnd, seqBEnd), expectedEnds)
+
+    def test_score_unknownMode(self):
+        with self.assertRaises(ValueError):
+            Align(self.scoreMatrix).score(self.seqA, self.seqB, mode="sideways")
+
+    def test_linearAlign_sameScoreAsGlobal(self):
+        aligned = next(Align(self.scoreMatrix).globalAlign(self.seqA, self.seqB, -8, -2, resultCount=1))
+        linear = Align(self.scoreMatrix).linearAlign(self.seqA, self.seqB, -8, -2, mode="global")
+        self.assertEqual(linear.alignScore, aligned.alignScore)
+        self.assertEqual((linear.seqAStart, linear.seqBStart), (0, 0))
+        self.assertEqual((linear.seqAEnd, linear.seqBEnd), (len(self.seqA), len(self.seqB)))
+
+    def test_linearAlign_sameScoreAsLocal(self):
+        aligned = next(Align(self.scoreMatrix).localAlign(self.seqA, self.seqB, -4, -1))
+        linear = Align(self.scoreMatrix).linearAlign(self.seqA, self.seqB, -4, -1, mode="local")
+        self.assertEqual(linear.alignScore, aligned.alignScore)
+        self.assertEqual((linear.seqAEnd, linear.seqBEnd), (aligned.seqAEnd, aligned.seqBEnd))
+        self.assertEqual([aa for aa in linear.seqA if not aa.isGap()],
+                         list(self.seqA[linear.seqAStart:linear.seqAEnd]))
+
+    def test_linearAlign_dividesLongSequences(self):
+        seqA = Sequence("MKVLAAGIVGLLLAACSSHEDKPQTTEAKPAEKAVEQPKVEAAPAAEVKPAAE" * 6)
+        seqB = Sequence("MKVLAAGIVALLLAGCSSHDDKPQTTEAKPAEKAVEAPKVEAAPVAEVKPAAE" * 6)
+        aligned = next(Align(self.scoreMatrix, "numpy").globalAlign(seqA, seqB, -11, -1, resultCount=1))
+        linear = Align(self.scoreMatrix).linearAlign(seqA, seqB, -11, -1, mode="global")
+        self.assertEqual(linear.alignScore, aligned.alignScore)
+        self.assertEqual(linear.identity, aligned.identity)
+
+    def test_bandWidth_sameAsUnbanded(self):
+        seqB = Sequence("HEAGAWGHEEKLLSPYWAGHTRC", "seqB")
+        seqB[3], seqB[10] = "W", "R"
+        del seqB[15]
+        aligned = next(Align(self.scoreMatrix).globalAlign(self.seqA, seqB, -8, -2, resultCount=1))
+        for engine in ("python", "numpy"):
+            for semiGlobal in (False, True):
+                align = Align(self.scoreMatrix, engine)
+                banded = next(align.globalAlign(self.seqA, seqB, -8, -2, semiGlobal, resultCount=1, bandWidth=2))
+                self.assertEqual(align.getBandWidth(), 2)
+                self.assertTrue(banded.alignType.endswith("-banded(2)"))
+                if not semiGlobal:
+                    self.assertEqual((str(banded.seqA), str(banded.seqB)), (str(aligned.seqA), str(aligned.seqB)))
+
+    def test_bandWidth_widened(self):
+        seqB = Sequence("HEAGAWGEKLLSPYWAGHWWTRC", "seqB")  # Two deletions, then two insertions
+        aligned = next(Align(self.scoreMatrix).globalAlign(self.seqA, seqB, -8, -2, resultCount=1))
+        pythonResults, numpyResults = self.alignBothEngines("globalAlign", self.seqA, seqB, -8, -2,
+                                                            resultCount=1, bandWidth=1)
+        self.assertEqual(pythonResults, numpyResults)
+        align = Align(self.scoreMatrix)
+        banded = next(align.globalAlign(self.seqA, seqB, -8, -2, resultCount=1, bandWidth=1))
+        self.assertEqual(align.getBandWidth(), 4)
+        self.assertEqual(banded.alignScore, aligned.alignScore)
+
+    def test_bandWidth_noBestScoreInBand(self):
+        seqA, seqB = Sequence("WFMQ"), Sequence("EPVNVS")
+        unbanded = next(Align(self.scoreMatrix).globalAlign(seqA, seqB, -3, -3, True, resultCount=1))
+        pythonResults, numpyResults = self.alignBothEngines("globalAlign", seqA, seqB, -3, -3, True,
+                                                            resultCount=1, bandWidth=1)
+        self.assertEqual(pythonResults, numpyResults)
+        self.assertEqual(len(pythonResults), 1)
+        banded = next(Align(self.scoreMatrix).globalAlign(seqA, seqB, -3, -3, True, resultCount=1, bandWidth=1))
+        self.assertEqual(banded.alignScore, unbanded.alignScore)
+
+    def test_bandWidth_invalid(self):
+        with self.assertRaises(ValueError):
+            next(Align(self.scoreMatrix).globalAlign(self.seqA, self.seqB, bandWidth=0))
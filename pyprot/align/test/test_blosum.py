@@ -0,0 +1,79 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from pyprot.align.blosum import BlosumCounts, blosumFromFasta, clusterSequences, getFrequencies, \
+    getFrequenciesFromArrays, valueArraysFromGroups, valueDictsFromGroups
+from pyprot.base.aminoacid import AminoAcid
+from pyprot.base.sequence import CompactSequence, Sequence
+from pyprot.data.fasta import writeSequencesToFasta
+
+
+class TestBlosum(TestCase):
+    def setUp(self):
+        self.groups = [[Sequence("AC")], [CompactSequence("AD"), CompactSequence("CD")]]
+
+    def test_getFrequenciesFromArrays(self):
+        A, C, D = AminoAcid("A"), AminoAcid("C"), AminoAcid("D")
+        freqPairs, freqSingle, freqSum = getFrequenciesFromArrays(valueArraysFromGroups(self.groups))
+        self.assertEqual(freqPairs, {(A, A): 0.5, (C, A): 0.5, (D, C): 1})
+        self.assertEqual((freqSingle[A], freqSingle[C], freqSingle[D], freqSingle[AminoAcid("W")]), (0.75, 0.75, 0.5, 0))
+        self.assertEqual(freqSum, 2)
+
+    def test_getFrequencies(self):
+        A, C, D = AminoAcid("A"), AminoAcid("C"), AminoAcid("D")
+        freqPairs, freqSingle, freqSum = getFrequencies(*valueDictsFromGroups(self.groups))
+        self.assertEqual(freqPairs, {(A, A): 0.5, (C, A): 0.5, (D, C): 1})
+        expectedSingle = {AminoAcid(aa): 0 for aa in AminoAcid.getAllNames()}
+        expectedSingle.update({A: 0.75, C: 0.75, D: 0.5})
+        self.assertEqual(freqSingle, expectedSingle)
+        self.assertEqual(freqSum, 2)
+
+    def test_clusterSequences_singleLinkage(self):
+        sequences = [CompactSequence(names) for names in ("AAAA", "CCCC", "WWWW", "AACC", "WWWY")]
+        groups = clusterSequences(sequences, 50, chunkSize=2)
+        # AACC links AAAA and CCCC, even though they have no identity
+        self.assertEqual([[str(sequence) for sequence in group] for group in groups],
+                         [["AAAA", "CCCC", "AACC"], ["WWWW", "WWWY"]])
+        self.assertEqual(len(clusterSequences(sequences, 100)), 5)
+
+    def test_clusterSequences_differentSizes(self):
+        with self.assertRaises(ValueError):
+            clusterSequences([CompactSequence("AAAA"), CompactSequence("AAA")], 50)
+
+
+class TestBlosumCounts(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.paths = []
+        for index, block in enumerate((("KVLAGH", "KVLSGH", "RILAGN", "KVLEGW"), ("WTDCAY", "WSDCAY", "FTECSY"))):
+            self.paths.append(os.path.join(self.directory, "block{}.fasta".format(index)))
+            writeSequencesToFasta(self.paths[-1], [CompactSequence(names) for names in block])
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_merge(self):
+        countsA, countsB = (BlosumCounts.fromFasta(path, 62) for path in self.paths)
+        counts = countsA + countsB
+        self.assertEqual(len(counts), 2)
+        freqPairs, freqSingle, freqSum = counts.getFrequencies()
+        self.assertAlmostEqual(freqSum, countsA.getFrequencies()[2] + countsB.getFrequencies()[2])
+        self.assertAlmostEqual(sum(freqSingle.values()), freqSum)
+        self.assertEqual(str(counts.getScoreMatrix()), str(blosumFromFasta(62, *self.paths, workers=1)))
+        with self.assertRaises(ValueError):
+            countsA + BlosumCounts.fromFasta(self.paths[1], 80)
+
+    def test_countsPath(self):
+        countsPath = os.path.join(self.directory, "counts.npz")
+        blosumFromFasta(62, self.paths[0], countsPath=countsPath)
+        self.assertEqual(len(BlosumCounts.load(countsPath)), 1)
+
+        scoreMatrix = blosumFromFasta(62, *self.paths, workers=2, countsPath=countsPath)
+        counts = BlosumCounts.load(countsPath)
+        self.assertEqual(len(counts), 2)
+        self.assertTrue(all(counts.isCurrent(path) for path in self.paths))
+        self.assertEqual(str(scoreMatrix), str(blosumFromFasta(62, *self.paths, workers=1)))
+        self.assertEqual(str(blosumFromFasta(62, self.paths[1], countsPath=countsPath)),
+                         str(blosumFromFasta(62, self.paths[1], workers=1)))
@@ -0,0 +1,31 @@
+import os
+from unittest import TestCase
+
+from pyprot.align import search
+from pyprot.align.align import Align
+from pyprot.align.score import ScoreMatrix
+from pyprot.base.sequence import Sequence
+from pyprot.data.fasta import getSequencesFromFasta
+
+PDZ = os.path.join(os.path.dirname(__file__), "..", "..", "..", "examples", "resources", "fasta", "PDZ-A.fasta")
+
+
+class TestSearch(TestCase):
+    def setUp(self):
+        self.scoreMatrix = ScoreMatrix.named("BLOSUM62")
+        self.query = Sequence("GGTLRIYA", "query")
+
+    def test_search_ranksHits(self):
+        hits = search(self.query, PDZ, self.scoreMatrix, -8, -2, hitCount=5, workers=1, chunkSize=100)
+        self.assertEqual(len(hits), 5)
+        self.assertEqual(hits[0].seqB.getDescription(), "AFAD_HUMAN|P55196|246-253")
+        self.assertEqual([hit.alignScore for hit in hits], sorted([hit.alignScore for hit in hits], reverse=True))
+
+        align = Align(self.scoreMatrix)
+        bestScore = max(align.score(self.query, target, -8, -2, "local")[0] for target in getSequencesFromFasta(PDZ))
+        self.assertEqual(hits[0].alignScore, bestScore)
+
+    def test_search_sameWithProcesses(self):
+        hits = search(self.query, PDZ, self.scoreMatrix, -8, -2, hitCount=3, workers=1)
+        processHits = search(self.query, PDZ, self.scoreMatrix, -8, -2, hitCount=3, workers=2, chunkSize=100)
+        self.assertEqual([repr(hit) for hit in hits], [repr(hit) for hit in processHits])
@@ -0,0 +1,55 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from pyprot.align.score import ScoreMatrix
+from pyprot.base.aminoacid import AminoAcid
+from pyprot.base.sequence import CompactSequence
+
+BLOSUM62 = os.path.join(os.path.dirname(__file__), "..", "..", "..", "examples", "resources", "blosum", "blosum62.iij")
+
+
+class TestScoreMatrix(TestCase):
+    def setUp(self):
+        self.scoreMatrix = ScoreMatrix(BLOSUM62, "BLOSUM62", missingScore=-4)
+
+    def test_getScore_isSymmetric(self):
+        self.assertEqual(self.scoreMatrix.getScore(AminoAcid("W"), AminoAcid("W")), 11)
+        self.assertEqual(self.scoreMatrix.getScore(AminoAcid("A"), AminoAcid("R")),
+                         self.scoreMatrix.getScore(AminoAcid("R"), AminoAcid("A")))
+
+    def test_getScore_missingAminoAcid(self):
+        self.assertEqual(self.scoreMatrix.getScore(AminoAcid("U"), AminoAcid("A")), -4)
+
+    def test_getScores_sameAsGetScore(self):
+        seqA, seqB = CompactSequence("HEAGAWUX"), CompactSequence("PAWHEAEW")
+        scores = self.scoreMatrix.getScores(seqA.getCodes(), seqB.getCodes())
+        self.assertEqual(scores.tolist(), [self.scoreMatrix.getScore(aa1, aa2) for aa1, aa2 in zip(seqA, seqB)])
+
+    def test_setScore_updatesTable(self):
+        self.scoreMatrix.setScore(AminoAcid("A"), AminoAcid("W"), 0.5)
+        self.assertEqual(self.scoreMatrix.getScore(AminoAcid("W"), AminoAcid("A")), 0.5)
+        self.assertEqual(self.scoreMatrix.getScores([AminoAcid("W").getId()], [AminoAcid("A").getId()]), [0.5])
+
+    def test_named_sameAsFile(self):
+        named = ScoreMatrix.named("blosum62", missingScore=-4)
+        self.assertEqual(named.getTable().tolist(), self.scoreMatrix.getTable().tolist())
+
+    def test_named_unknown(self):
+        with self.assertRaises(ValueError):
+            ScoreMatrix.named("BLOSUM1000")
+
+    def test_init_readsChangedFile(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "matrix.iij")
+            with open(path, "w") as file:
+                file.write(" A   R\n  4\n -1   5\n")
+            self.assertEqual(ScoreMatrix(path).getScore(AminoAcid("A"), AminoAcid("R")), -1)
+            with open(path, "w") as file:
+                file.write(" A   R\n  4\n -2   5\n")
+            os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10 ** 9))
+            self.assertEqual(ScoreMatrix(path).getScore(AminoAcid("A"), AminoAcid("R")), -2)
+        finally:
+            shutil.rmtree(directory)
@@ -47,29 +47,66 @@ class AminoAcid:
     The full list of possible amino acids is defined by AA_NAMES.
     """
 
+    __slots__ = ("_id",)  # id of the amino acid within the name group
+
     # Dictionary mapping name to id
     _nameDict = {AA_NAMES[id][i]: id for i in range(3) for id in range(len(AA_NAMES))}
     
     _nameModes = {"long": 0, "medium": 1, "short": 2}  # choices for name length
     _defaultNameMode = "short"  # short name by default
 
-    def __init__(self, aminoAcid):
+    _instances = ()  # the only AminoAcid objects, one per id (created below the class)
+    _instanceDict = {}  # maps names (as found in AA_NAMES, and lowercase short names) to instances
+
+    def __new__(cls, aminoAcid):
         """
-        Creates an AminoAcid object representing one of the possible amino acids.
-        @param aminoAcid can be the name of an amino acid, or an AminoAcid object (in which case a copy is created).
+        Returns the AminoAcid object representing one of the possible amino acids.
+        AminoAcid objects are immutable and shared : there is only one object per amino acid.
+        @param aminoAcid can be the name of an amino acid, or an AminoAcid object (which is returned as is).
         """
-        self._id = None  # id of the amino acid within the name group
+        try:
+            return AminoAcid._instanceDict[aminoAcid]  # fast path for exact names
+        except (KeyError, TypeError):
+            pass
 
         if isinstance(aminoAcid, str):
             if len(aminoAcid) == 1:
-                self._id = self.__getIdByName(aminoAcid.upper())  # id from short aminoAcid name
+                return AminoAcid._instances[AminoAcid.__getIdByName(aminoAcid.upper())]  # from short name
             else:
-                self._id = self.__getIdByName(aminoAcid.lower())  # id from other aminoAcid name
+                return AminoAcid._instances[AminoAcid.__getIdByName(aminoAcid.lower())]  # from other name
         elif isinstance(aminoAcid, AminoAcid):
-            self._id = aminoAcid._id  # copy of id
+            return aminoAcid
         else:
             raise TypeError("aminoAcid must be a string or an AminoAcid object")
 
+    @staticmethod
+    def fromId(id):
+        """Returns the AminoAcid object at index 'id' in AA_NAMES."""
+        if not 0 <= id < len(AA_NAMES):
+            raise ValueError("Could not find amino acid id {}".format(id))
+        return AminoAcid._instances[id]
+
+    @staticmethod
+    def _create(id):
+        aminoAcid = object.__new__(AminoAcid)
+        object.__setattr__(aminoAcid, "_id", id)
+        return aminoAcid
+
+    def __setattr__(self, name, value):
+        raise AttributeError("AminoAcid objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("AminoAcid objects are immutable")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return AminoAcid, (self.getName(),)
+
     @staticmethod
     def __getIdByName(name):
         try:
@@ -103,6 +140,10 @@ class AminoAcid:
         for aa in AA_NAMES[startIndex:stopIndex]:
             yield aa[nameModeIndex]
 
+    def getId(self):
+        """Returns the index of this amino acid in AA_NAMES."""
+        return self._id
+
     def isGap(self):
         """True if this amino acid is a gap, false otherwise."""
         return self._id == AA_NAMES_GAP_INDEX
@@ -130,10 +171,10 @@ class AminoAcid:
     # Comparison and hashing allow to manipulate and sort instances more efficiently
     # these functions do not have any biological meaning and their results may change over time.
     def __eq__(self, other):
-        return self._id == other._id
+        return self is other
 
     def __ne__(self, other):
-        return self._id != other._id
+        return self is not other
 
     def __gt__(self, other):
         return self._id > other._id
@@ -149,3 +190,8 @@ class AminoAcid:
 
     def __hash__(self):
         return hash(self._id)
+
+
+AminoAcid._instances = tuple(AminoAcid._create(id) for id in range(len(AA_NAMES)))
+AminoAcid._instanceDict = {name: AminoAcid._instances[id] for name, id in AminoAcid._nameDict.items()}
+AminoAcid._instanceDict.update({names[2].lower(): AminoAcid._instances[id] for id, names in enumerate(AA_NAMES)})
@@ -1,6 +1,6 @@
 from copy import deepcopy
 
-from pyprot.base.aminoacid import AminoAcid
+from pyprot.base.aminoacid import AminoAcid, AA_NAMES
 
 
 class Sequence(list):
@@ -41,9 +41,9 @@ class Sequence(list):
         if aminoAcids is None:
             return []
 
-        # A single AminoAcid is copied and put within a list
+        # A single AminoAcid is put within a list
         elif isinstance(aminoAcids, AminoAcid):
-            return [AminoAcid(aminoAcids)]  # Copy constructor
+            return [aminoAcids]
 
         # A string is converted to a list, based on its
         elif isinstance(aminoAcids, str):
@@ -108,3 +108,252 @@ class Sequence(list):
         @param aminoAcids must be compatible with the Sequence constructor
         """
         list.extend(self, Sequence.__formatList(aminoAcids))
+
+
+# Shared AminoAcid objects for each index of AA_NAMES, and translation tables between short names and indexes
+_AMINO_ACIDS = tuple(AminoAcid.fromId(id) for id in range(len(AA_NAMES)))
+_INVALID_CODE = 255
+_ENCODE_TABLE = bytes(AminoAcid(chr(char)).getId() if chr(char).upper() in AminoAcid.getNamesInRange(0, len(AA_NAMES))
+                      else _INVALID_CODE for char in range(256))
+_DECODE_TABLE = bytes(ord(names[2]) for names in AA_NAMES).ljust(256, b"?")
+
+
+class CompactSequence(Sequence):
+    """
+    Represents a sequence of amino acids, stored as one byte per amino acid (its index in AA_NAMES).
+    Behaves like a Sequence (items are AminoAcid objects) while being much cheaper to build, slice and store.
+    """
+
+    def __init__(self, aminoAcids=None, description=""):
+        """
+        Creates a CompactSequence object that represents the amino acid sequence contained in aminoAcids.
+        aminoAcids can be anything accepted by the Sequence constructor, or a buffer of bytes (bytes, bytearray,
+        memoryview, array('B'), numpy uint8 array...) containing indexes of AA_NAMES.
+        Buffers other than bytes are shared with the caller until the CompactSequence is modified.
+        (see fromBytes to create a CompactSequence from bytes of short names instead)
+        """
+        list.__init__(self)
+        self._nameMode = "short"
+        self._separator = ""
+        self._description = description
+
+        # if copy constructor, copy attributes
+        if isinstance(aminoAcids, Sequence):
+            self._nameMode = aminoAcids._nameMode
+            self._separator = aminoAcids._separator
+            if self._description == "":
+                self._description = aminoAcids._description
+
+        self._codes = CompactSequence.__encode(aminoAcids, True)
+
+    @staticmethod
+    def fromBytes(names, description=""):
+        """
+        Creates a CompactSequence from 'names', bytes of short amino acid names (of any case).
+        Whitespace (such as line breaks) within 'names' is ignored.
+        """
+        codes = bytes(names).translate(_ENCODE_TABLE, b" \t\r\n\v\f")
+        if _INVALID_CODE in codes:
+            invalidName = chr(bytes(names).translate(None, b" \t\r\n\v\f")[codes.index(_INVALID_CODE)])
+            raise ValueError("Could not find amino acid name {}".format(invalidName))
+        return CompactSequence._fromCodes(codes, description)
+
+    @staticmethod
+    def _fromCodes(codes, description=""):
+        """
+        Creates a CompactSequence sharing 'codes', a buffer of AA_NAMES indexes known to be valid,
+        without checking them (unlike the constructor, this does not read the whole buffer).
+        """
+        sequence = CompactSequence(None, description)
+        sequence._codes = codes  # copied once modified, as shared buffers
+        return sequence
+
+    @staticmethod
+    def __encode(aminoAcids, share=False):
+        """
+        Encodes 'aminoAcids' into a bytearray of AA_NAMES indexes.
+        If 'share' is True, buffers other than bytes are returned as memoryviews instead of copies
+        (they are never written to : see __writableCodes).
+        """
+        if isinstance(aminoAcids, CompactSequence):
+            return bytearray(aminoAcids._codes)
+
+        elif isinstance(aminoAcids, str) and aminoAcids.isupper():  # Multiple Amino Acids in short name mode
+            codes = bytearray(aminoAcids.encode("latin-1", "replace").translate(_ENCODE_TABLE))
+            if _INVALID_CODE in codes:
+                return bytearray(AminoAcid(aa).getId() for aa in aminoAcids)  # raises the error of AminoAcid
+            return codes
+
+        elif aminoAcids is None or isinstance(aminoAcids, (str, list, AminoAcid)):
+            return bytearray(aa.getId() for aa in Sequence(aminoAcids))
+
+        try:
+            codes = memoryview(aminoAcids).cast("B")
+        except TypeError:
+            raise TypeError("aminoAcids must be a Sequence, list, AminoAcid object, string, buffer of bytes or None")
+        if len(codes) > 0 and max(codes) >= len(AA_NAMES):
+            raise ValueError("Amino acid indexes must be lower than {}".format(len(AA_NAMES)))
+        if isinstance(aminoAcids, bytes) or not share:
+            return bytearray(codes)
+        return codes
+
+    def __writableCodes(self):
+        """Returns the bytes of the sequence, copied first if they are still shared or immutable."""
+        if not isinstance(self._codes, bytearray):
+            self._codes = bytearray(self._codes)
+        return self._codes
+
+    def toBytes(self):
+        """Returns the short names of all amino acids of the sequence, as bytes (see fromBytes)."""
+        return bytes(self._codes).translate(_DECODE_TABLE)
+
+    def getCodes(self):
+        """Returns the indexes of all amino acids of the sequence in AA_NAMES, as bytes."""
+        return bytes(self._codes)
+
+    def __reduce__(self):
+        """Pickling (and copy) support : the sequence is rebuilt from its bytes."""
+        return CompactSequence, (bytes(self._codes), self._description), \
+            {"_nameMode": self._nameMode, "_separator": self._separator}
+
+    def __str__(self):
+        """String conversion"""
+        if self._nameMode == "short":
+            names = self.toBytes().decode("ascii")
+            return names if self._separator == "" else self._separator.join(names)
+        return Sequence.__str__(self)
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __iter__(self):
+        for code in self._codes:
+            yield _AMINO_ACIDS[code]
+
+    def __reversed__(self):
+        for code in reversed(self._codes):
+            yield _AMINO_ACIDS[code]
+
+    def __contains__(self, aminoAcid):
+        return isinstance(aminoAcid, AminoAcid) and aminoAcid.getId() in self._codes
+
+    def __getitem__(self, key):
+        """Returns an AminoAcid, or a CompactSequence for slices"""
+        if isinstance(key, slice):
+            result = CompactSequence(None, self._description)
+            result._nameMode = self._nameMode
+            result._separator = self._separator
+            result._codes = self._codes[key]
+            return result
+        return _AMINO_ACIDS[self._codes[key]]
+
+    def __setitem__(self, key, value):
+        """Sets value for an item or a slice of the sequence"""
+        if isinstance(key, slice):
+            self.__writableCodes()[key] = CompactSequence.__encode(value)
+        else:
+            self.__writableCodes()[key] = AminoAcid(value).getId()
+
+    def __delitem__(self, key):
+        del self.__writableCodes()[key]
+
+    def __eq__(self, other):
+        if isinstance(other, CompactSequence):
+            return self._codes == other._codes
+        if isinstance(other, list):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __lt__(self, other):
+        return list(self) < list(other)
+
+    def __le__(self, other):
+        return list(self) <= list(other)
+
+    def __gt__(self, other):
+        return list(self) > list(other)
+
+    def __ge__(self, other):
+        return list(self) >= list(other)
+
+    def __add__(self, other):
+        result = self.copy()
+        result.extend(other)
+        return result
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __mul__(self, count):
+        result = self.copy()
+        result._codes = bytearray(self._codes) * count
+        return result
+
+    __rmul__ = __mul__
+
+    def __imul__(self, count):
+        self._codes = bytearray(self._codes) * count
+        return self
+
+    def copy(self):
+        """Returns a copy of the sequence."""
+        return CompactSequence(self)
+
+    def append(self, aminoAcid):
+        """Adds the AminoAcid 'aminoAcid' at the end of the sequence."""
+        self.__writableCodes().append(AminoAcid(aminoAcid).getId())
+
+    def insert(self, index, aminoAcids):
+        """
+        Inserts aminoAcids into the sequence at index 'index' (see Sequence.insert).
+        """
+        if index < 0:
+            index = max(0, index + len(self._codes))
+        self.__writableCodes()[index:index] = CompactSequence.__encode(aminoAcids)
+
+    def extend(self, aminoAcids):
+        """
+        Extends the sequence by adding 'aminoAcids' at its end (see Sequence.extend).
+        """
+        self.__writableCodes().extend(CompactSequence.__encode(aminoAcids))
+
+    def pop(self, index=-1):
+        """Removes and returns the AminoAcid at index 'index' (the last one by default)."""
+        return _AMINO_ACIDS[self.__writableCodes().pop(index)]
+
+    def remove(self, aminoAcid):
+        """Removes the first occurrence of the AminoAcid 'aminoAcid'."""
+        del self.__writableCodes()[self.index(aminoAcid)]
+
+    def clear(self):
+        """Removes all amino acids."""
+        self._codes = bytearray()
+
+    def index(self, aminoAcid, start=0, stop=None):
+        """Returns the index of the first occurrence of the AminoAcid 'aminoAcid' (between 'start' and 'stop')."""
+        codes = self._codes if isinstance(self._codes, (bytes, bytearray)) else bytes(self._codes)
+        index = codes.find(AminoAcid(aminoAcid).getId(), start, len(codes) if stop is None else stop)
+        if index == -1:
+            raise ValueError("{} is not in sequence".format(aminoAcid))
+        return index
+
+    def count(self, aminoAcid):
+        """Returns the number of occurrences of the AminoAcid 'aminoAcid'."""
+        codes = self._codes if isinstance(self._codes, (bytes, bytearray)) else bytes(self._codes)
+        return codes.count(AminoAcid(aminoAcid).getId())
+
+    def reverse(self):
+        """Reverses the sequence in place."""
+        self.__writableCodes().reverse()
+
+    def sort(self, key=None, reverse=False):
+        """Sorts the sequence in place (by AminoAcid order if 'key' is None)."""
+        if key is None:
+            self._codes = bytearray(sorted(self._codes, reverse=reverse))
+        else:
+            self._codes = bytearray(aa.getId() for aa in sorted(self, key=key, reverse=reverse))
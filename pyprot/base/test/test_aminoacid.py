@@ -1,3 +1,4 @@
+from copy import deepcopy
 from unittest import TestCase
 
 from pyprot.base.aminoacid import AminoAcid
@@ -37,5 +38,17 @@ class TestAminoAcid(TestCase):
         aa2 = AminoAcid("A")
         self.assertEquals(hash(aa1), hash(aa2))
 
+    def test_instancesAreShared(self):
+        aa = AminoAcid("A")
+        self.assertIs(aa, AminoAcid("alanine"))
+        self.assertIs(aa, AminoAcid(aa))
+        self.assertIs(aa, deepcopy(aa))
+        self.assertIs(aa, AminoAcid.fromId(aa.getId()))
+
+    def test_isImmutable(self):
+        aa = AminoAcid("A")
+        with self.assertRaises(AttributeError):
+            aa._id = 1
+
 if __name__ == "__main__":
     TestAminoAcid.main()
\ No newline at end of file
@@ -1,5 +1,5 @@
 from unittest import TestCase
-from pyprot.base.sequence import Sequence
+from pyprot.base.sequence import Sequence, CompactSequence
 from pyprot.base.aminoacid import AminoAcid
 
 
@@ -80,3 +80,40 @@ class TestSequence(TestCase):
         prot = Sequence("ABC")
         seq = prot[0:2]
         self.assertEquals(seq, Sequence("AB"))
+
+
+class TestCompactSequence(TestCase):
+    def test_sameAsSequence(self):
+        prot = CompactSequence("MOCK-X", "description")
+        self.assertEqual(prot, Sequence("MOCK-X"))
+        self.assertEqual(str(prot), "MOCK-X")
+        self.assertEqual(prot[1], AminoAcid("O"))
+        self.assertEqual(prot.getDescription(), "description")
+
+    def test_sliceIsCompactSequence(self):
+        prot = CompactSequence("ABCD")
+        subProt = prot[1:3]
+        self.assertIsInstance(subProt, CompactSequence)
+        del subProt[0]
+        self.assertEqual(subProt, Sequence("C"))
+        self.assertEqual(prot, Sequence("ABCD"))
+
+    def test_insertAndExtend(self):
+        prot = CompactSequence("KL")
+        prot.insert(0, "M")
+        prot.extend(Sequence("OK"))
+        prot.append("methionine")
+        self.assertEqual(prot, Sequence("MKLOKM"))
+
+    def test_fromBuffer(self):
+        codes = bytearray(CompactSequence("HEAGAWGHEE").getCodes())
+        prot = CompactSequence(codes)
+        self.assertEqual(str(prot), "HEAGAWGHEE")
+        prot[0] = "W"
+        self.assertEqual(codes, CompactSequence("HEAGAWGHEE").getCodes())
+
+    def test_invalidName(self):
+        with self.assertRaises(ValueError):
+            CompactSequence("AB1")
+        with self.assertRaises(ValueError):
+            CompactSequence(bytes([len("ACDEFGHIKLMNPQRSTVWYUOBZJX-|")]))
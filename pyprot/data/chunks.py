@@ -0,0 +1,32 @@
+from collections import deque
+
+
+def getChunks(items, chunkSize):
+    """
+    Yields lists of at most 'chunkSize' items from 'items' (which can be a generator), in order.
+    """
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == chunkSize:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def mapChunks(pool, function, chunks, maxPending):
+    """
+    Applies 'function' to each chunk of 'chunks' (which can be a generator) in the processes of 'pool'
+    (a multiprocessing Pool), and yields (chunk, result) pairs in order.
+    At most 'maxPending' chunks are waiting at once, so 'chunks' is never fully loaded.
+    """
+    pending = deque()
+    for chunk in chunks:
+        pending.append((chunk, pool.apply_async(function, (chunk,))))
+        if len(pending) >= maxPending:
+            chunk, result = pending.popleft()
+            yield chunk, result.get()
+    while pending:
+        chunk, result = pending.popleft()
+        yield chunk, result.get()
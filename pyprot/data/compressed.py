@@ -0,0 +1,169 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import struct
+import zlib
+from collections import deque
+
+# Magic bytes found at the start of compressed files
+GZIP_MAGIC = b"\x1f\x8b"
+BZ2_MAGIC = b"BZh"
+XZ_MAGIC = b"\xfd7zXZ\x00"
+
+# Number of BGZF blocks (of at most 64 KB each) decompressed by each task
+BGZF_BLOCKS_PER_TASK = 64
+
+
+def getCompression(path):
+    """
+    Returns the compression of the file located in 'path', from its first bytes :
+    "bgzf" (blocked gzip, as made by bgzip), "gzip", "bz2", "xz", or None if it is not compressed.
+    """
+    with open(path, 'rb') as file:
+        header = file.read(18)
+    if header.startswith(GZIP_MAGIC):
+        # BGZF blocks are gzip members with a 'BC' extra subfield holding the block size
+        if len(header) >= 18 and header[3] & 4 and header[12:14] == b"BC":
+            return "bgzf"
+        return "gzip"
+    if header.startswith(BZ2_MAGIC):
+        return "bz2"
+    if header.startswith(XZ_MAGIC):
+        return "xz"
+    return None
+
+
+def openBinary(path, threads=None):
+    """
+    Opens the file located in 'path' for binary reading, decompressing it on the fly if needed (see getCompression).
+    BGZF files are decompressed by 'threads' threads (as many as CPUs if None).
+    """
+    compression = getCompression(path)
+    if compression == "bgzf":
+        return io.BufferedReader(BgzfReader(path, threads), 1 << 20)
+    if compression == "gzip":
+        return gzip.open(path, 'rb')
+    if compression == "bz2":
+        return bz2.open(path, 'rb')
+    if compression == "xz":
+        return lzma.open(path, 'rb')
+    return open(path, 'rb')
+
+
+def openBinaryOutput(path, compression=None):
+    """
+    Opens the file located in 'path' for binary writing, compressed with 'compression' ("gzip", "bz2", "xz" or None).
+    If 'compression' is "infer", it is chosen from the extension of 'path' (.gz, .bz2, .xz, or none).
+    """
+    if compression == "infer":
+        compression = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz"}.get(os.path.splitext(path)[1].lower())
+    if compression == "gzip":
+        return gzip.open(path, 'wb')
+    if compression == "bz2":
+        return bz2.open(path, 'wb')
+    if compression == "xz":
+        return lzma.open(path, 'wb')
+    if compression is None:
+        return open(path, 'wb')
+    raise ValueError("compression must be 'gzip', 'bz2', 'xz', 'infer' or None")
+
+
+class BgzfReader(io.RawIOBase):
+    """
+    Reads a BGZF file (a series of independent gzip blocks) : blocks are read in batches,
+    and batches are decompressed concurrently by a pool of threads (zlib releases the GIL).
+    """
+
+    def __init__(self, path, threads=None):
+        """
+        Opens the BGZF file located in 'path', decompressed by 'threads' threads (as many as CPUs if None).
+        """
+        from concurrent.futures import ThreadPoolExecutor  # Only loaded for BGZF files, as it is slow to import
+
+        self._file = open(path, 'rb')
+        self._threads = threads or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(self._threads)
+        self._pending = deque()  # futures of the batches decompressed ahead
+        self._chunks = self.__decompressedChunks()
+        self._chunk = b""
+        self._position = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while self._position == len(self._chunk):
+            self._chunk = next(self._chunks, None)
+            self._position = 0
+            if self._chunk is None:
+                self._chunk = b""
+                return 0
+        size = min(len(buffer), len(self._chunk) - self._position)
+        buffer[:size] = self._chunk[self._position:self._position + size]
+        self._position += size
+        return size
+
+    def close(self):
+        if not self.closed:
+            for future in self._pending:
+                future.cancel()
+            self._executor.shutdown(wait=True)
+            self._file.close()
+        super().close()
+
+    def __decompressedChunks(self):
+        """
+        Yields the decompressed content of the file, by batches of blocks. A few batches are decompressed ahead.
+        """
+        pending = self._pending
+        while True:
+            blocks = self.__readBlocks(BGZF_BLOCKS_PER_TASK)
+            if blocks:
+                pending.append(self._executor.submit(_inflateBlocks, blocks))
+            if pending and (not blocks or len(pending) > 2 * self._threads):
+                yield pending.popleft().result()
+            elif not blocks:
+                return
+
+    def __readBlocks(self, count):
+        """
+        Reads at most 'count' blocks from the file, and returns their compressed data and expected sizes and CRCs.
+        """
+        blocks = []
+        while len(blocks) < count:
+            header = self._file.read(12)
+            if len(header) == 0:
+                break
+            if len(header) < 12 or not header.startswith(GZIP_MAGIC) or not header[3] & 4:
+                raise ValueError("Invalid BGZF block in {}".format(self._file.name))
+
+            extra = self._file.read(struct.unpack("<H", header[10:12])[0])
+            blockSize = None
+            position = 0
+            while position + 4 <= len(extra):
+                subfieldSize = struct.unpack("<H", extra[position + 2:position + 4])[0]
+                if extra[position:position + 2] == b"BC":
+                    blockSize = struct.unpack("<H", extra[position + 4:position + 6])[0] + 1
+                position += 4 + subfieldSize
+            if blockSize is None:
+                raise ValueError("Invalid BGZF block in {}".format(self._file.name))
+
+            data = self._file.read(blockSize - 12 - len(extra))
+            crc, size = struct.unpack("<II", data[-8:])
+            blocks.append((data[:-8], crc, size))
+        return blocks
+
+
+def _inflateBlocks(blocks):
+    """
+    Decompresses BGZF 'blocks' (see BgzfReader.__readBlocks), and returns their concatenated content.
+    """
+    contents = []
+    for data, crc, size in blocks:
+        content = zlib.decompress(data, -15)
+        if len(content) != size or zlib.crc32(content) != crc:
+            raise ValueError("Corrupted BGZF block")
+        contents.append(content)
+    return b"".join(contents)
@@ -0,0 +1,214 @@
+import json
+import mmap
+import os
+import struct
+
+import numpy as np
+
+from pyprot.data.dssp import getDsspNames, parseDsspFiles
+
+# Corpus files start with this header : magic bytes, format version, chain count,
+# and the offsets of the chain offsets, the structures and the metadata sections (sequences follow the header)
+CORPUS_MAGIC = b"PYPRDSSP"
+CORPUS_VERSION = 1
+CORPUS_NAME = ".pyprot-dssp.corpus"
+_HEADER = struct.Struct("<8sIIQQQQ")
+
+
+def compileDsspCorpus(directory, corpusPath=None, workers=None):
+    """
+    Compiles all .dssp files of 'directory' into a corpus file saved to 'corpusPath'
+    (CORPUS_NAME inside 'directory' if None), see DsspCorpus.
+    If 'corpusPath' already holds a corpus, only the files whose size or modification time changed are parsed again,
+    over 'workers' processes (as in parseDsspFiles). Returns the number of chains in the corpus.
+    """
+    corpusPath = corpusPath or os.path.join(directory, CORPUS_NAME)
+    files = _getFileStats(directory)
+
+    # Unchanged files are copied from the previous corpus
+    previous = {}
+    try:
+        with DsspCorpus(corpusPath) as corpus:
+            for name, size, mtime, *metadata in corpus.getFiles():
+                if files.get(name) == (size, mtime):
+                    previous[name] = (tuple(metadata), [])
+            for index in range(len(corpus)):
+                name = corpus.getFile(index)[0]
+                if name in previous:
+                    previous[name][1].append((corpus.getChain(index),) + corpus[index])
+    except (OSError, ValueError):
+        pass
+
+    changed = [name for name in files if name not in previous]
+    parsed = dict(zip(changed, parseDsspFiles([os.path.join(directory, name) for name in changed], workers)))
+
+    fileRecords, chainRecords, structures, chainOffsets = [], [], [], [0]
+    temporaryPath = corpusPath + ".tmp"
+    with open(temporaryPath, 'wb') as corpusFile:
+        corpusFile.write(bytes(_HEADER.size))
+        for name, (size, mtime) in files.items():
+            if name in parsed:
+                dssp = parsed[name]
+                metadata = (dssp.identifier, dssp.protein, dssp.organism)
+                chains = [(chain,) + dssp.getSequenceStructure(chain) for chain in dssp.getChains()]
+            else:
+                metadata, chains = previous[name]
+
+            fileRecords.append((name, size, mtime) + metadata)
+            for chain, sequence, structure in chains:
+                corpusFile.write(sequence.encode("latin-1"))
+                structures.append(structure.encode("latin-1"))
+                chainOffsets.append(chainOffsets[-1] + len(sequence))
+                chainRecords.append((len(fileRecords) - 1, chain))
+
+        structuresStart = corpusFile.tell()
+        corpusFile.write(b"".join(structures))
+
+        # The offsets section is aligned on 8 bytes, so it can be mapped as an array
+        corpusFile.write(bytes(-corpusFile.tell() % 8))
+        offsetsStart = corpusFile.tell()
+        corpusFile.write(np.array(chainOffsets, dtype="<u8").tobytes())
+
+        metadataStart = corpusFile.tell()
+        corpusFile.write(json.dumps({"files": fileRecords, "chains": chainRecords}).encode("utf-8"))
+
+        corpusFile.seek(0)
+        corpusFile.write(_HEADER.pack(CORPUS_MAGIC, CORPUS_VERSION, 0, len(chainRecords),
+                                      offsetsStart, structuresStart, metadataStart))
+
+    # Replacing the file at once never leaves a partial corpus to other processes
+    os.replace(temporaryPath, corpusPath)
+    return len(chainRecords)
+
+
+def loadDsspCorpus(directory, corpusPath=None, workers=None):
+    """
+    Returns the DsspCorpus of the .dssp files of 'directory', saved to 'corpusPath' (as in compileDsspCorpus).
+    The corpus is only compiled again if it is missing, or if a file was added, removed or modified since.
+    """
+    corpusPath = corpusPath or os.path.join(directory, CORPUS_NAME)
+    try:
+        corpus = DsspCorpus(corpusPath)
+    except (OSError, ValueError):
+        corpus = None
+    if corpus is not None and corpus.isCurrent(directory):
+        return corpus
+
+    if corpus is not None:
+        corpus.close()
+    compileDsspCorpus(directory, corpusPath, workers)
+    return DsspCorpus(corpusPath)
+
+
+def _getFileStats(directory):
+    """
+    Returns the (size, modification time in nanoseconds) of each .dssp file of 'directory', by file name.
+    """
+    files = {}
+    for name in getDsspNames(directory):
+        stat = os.stat(os.path.join(directory, name))
+        files[name] = (stat.st_size, stat.st_mtime_ns)
+    return files
+
+
+class DsspCorpus:
+    """
+    Represents a corpus of .dssp files compiled for training (see compileDsspCorpus) :
+    the sequence and the structure (reduced as in DSSP.getSequenceStructure) of every chain of every file,
+    along with the metadata of the files. The file is memory-mapped, so opening it only reads the metadata.
+    """
+
+    def __init__(self, path):
+        """
+        Opens the corpus located in 'path'.
+        """
+        self._path = path
+        with open(path, 'rb') as corpusFile:
+            self._mmap = mmap.mmap(corpusFile.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, padding, count, offsetsStart, structuresStart, metadataStart = \
+                _HEADER.unpack_from(self._mmap)
+        except struct.error:
+            magic, version = None, None
+        if magic != CORPUS_MAGIC or version != CORPUS_VERSION:
+            self._mmap.close()
+            if magic != CORPUS_MAGIC:
+                raise ValueError("{} is not a DSSP corpus".format(path))
+            raise ValueError("Unsupported DSSP corpus version {}".format(version))
+
+        self._count = count
+        self._structuresOffset = structuresStart - _HEADER.size
+        self._chainOffsets = np.frombuffer(self._mmap, dtype="<u8", count=count + 1, offset=offsetsStart)
+        metadata = json.loads(self._mmap[metadataStart:].decode("utf-8"))
+        self._files = [tuple(record) for record in metadata["files"]]
+        self._chains = [tuple(record) for record in metadata["chains"]]
+
+    def __reduce__(self):
+        """Pickling support (for other processes) : the corpus is opened again from its path."""
+        return DsspCorpus, (self._path,)
+
+    def __len__(self):
+        """Number of chains in the corpus."""
+        return self._count
+
+    def __getitem__(self, index):
+        """Returns the sequence and the structure of the chain at index 'index', as two strings."""
+        index = self.__checkIndex(index)
+        start = _HEADER.size + int(self._chainOffsets[index])
+        stop = _HEADER.size + int(self._chainOffsets[index + 1])
+        sequence = self._mmap[start:stop].decode("latin-1")
+        structure = self._mmap[start + self._structuresOffset:stop + self._structuresOffset].decode("latin-1")
+        return sequence, structure
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def getChain(self, index):
+        """Returns the identifier of the chain at index 'index' (as in DSSP.getChains)."""
+        return self._chains[self.__checkIndex(index)][1]
+
+    def getFile(self, index):
+        """
+        Returns the file of the chain at index 'index',
+        as a (name, size, modification time, identifier, protein, organism) tuple.
+        """
+        return self._files[self._chains[self.__checkIndex(index)][0]]
+
+    def getFiles(self):
+        """Returns the files of the corpus, as in getFile (including files without chains)."""
+        return list(self._files)
+
+    def getMetadata(self, index):
+        """Returns the identifier, protein and organism (as in DSSP) of the file of the chain at index 'index'."""
+        return self.getFile(index)[3:]
+
+    def isCurrent(self, directory):
+        """
+        Returns True if the corpus holds all .dssp files of 'directory', unchanged since it was compiled.
+        """
+        return {name: (size, mtime) for name, size, mtime, *metadata in self._files} == _getFileStats(directory)
+
+    def __checkIndex(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("DsspCorpus index out of range")
+        return index
+
+    def close(self):
+        """
+        Closes the corpus.
+        """
+        self._chainOffsets = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
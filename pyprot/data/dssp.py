@@ -1,11 +1,25 @@
+import os
+import re
+from multiprocessing import Pool
+
+# Secondary structures of DSSP, reduced to the 4 structures used by GOR3 (any other structure is a coil)
+STRUCTURES = {"H": "H", "G": "H", "I": "H", "E": "E", "B": "E", "T": "T", "C": "C", "S": "C", " ": "C"}
+_STRUCTURE_TABLE = bytes(ord(STRUCTURES.get(chr(code), "C")) for code in range(256))
 
 
 class DSSP:
-    def __init__(self, filePath):
+    """
+    Represents a parsed .dssp file : its metadata, and the RESIDUE, AA and STRUCTURE columns of its residues.
+    Columns are stored as compact byte strings (one fixed-width field per residue),
+    and the residues of each chain are indexed once, when parsing.
+    """
 
+    def __init__(self, filePath):
+        """
+        Parses the .dssp file located in 'filePath', reading it line by line.
+        """
         # Interesting columns : (start index, end index)
         self.columns = ("RESIDUE", "AA", "STRUCTURE")
-        self.residues = []
 
         # Metadata
         self.identifier = ""
@@ -13,38 +27,70 @@ class DSSP:
         self.organism = ""
 
         # Parsing
-        with open(filePath, 'r') as dsspFile:
-            columnIndex = {col: (0, 0) for col in self.columns}
-            lineIsData = False
+        residueColumn, aminoAcidColumn, structureColumn = bytearray(), bytearray(), bytearray()
+        with open(filePath, 'rb') as dsspFile:
+            for line in dsspFile:
+                if line.lstrip().startswith(b"#"):
+                    columnIndex = {}
+                    for column in self.columns:
+                        startIndex = line.find(column.encode())
+                        endIndex = startIndex + len(column)
+                        endIndex = endIndex + (len(line[endIndex:]) - len(line[endIndex:].lstrip())) - 1
+                        columnIndex[column] = (startIndex, endIndex)
+                    break
 
-            for line in dsspFile.readlines():
+                line = line.decode("latin-1")
+                if line.startswith("HEADER"):
+                    self.identifier = line.split()[-2]
 
-                if lineIsData:
-                    data = []
-                    for column in self.columns:
-                        start, end = columnIndex[column]
-                        data.append(line[start:end])
-
-                    self.residues.append(data)
-
-                else:
-                    if line.strip()[0] == "#":
-                        lineIsData = True
-                        for column in self.columns:
-                            startIndex = line.find(column)
-                            endIndex = startIndex + len(column)
-                            endIndex = endIndex + (len(line[endIndex:]) - len(line[endIndex:].lstrip())) - 1
-                            columnIndex[column] = (startIndex, endIndex)
-                    elif line.startswith("HEADER"):
-                        self.identifier = line.split()[-2]
-
-                    elif line.startswith("COMPND"):
-                        self.protein = line.split(":")[1].split(";")[0].strip()
-                        self.protein = " ".join(self.protein.split())
-
-                    elif line.startswith("SOURCE"):
-                        self.organism = line.split(":")[1].split(";")[0].strip()
-                        self.organism = " ".join(self.organism.split())
+                elif line.startswith("COMPND"):
+                    self.protein = line.split(":")[1].split(";")[0].strip()
+                    self.protein = " ".join(self.protein.split())
+
+                elif line.startswith("SOURCE"):
+                    self.organism = line.split(":")[1].split(";")[0].strip()
+                    self.organism = " ".join(self.organism.split())
+            else:
+                columnIndex = {column: (0, 0) for column in self.columns}
+
+            residueStart, residueEnd = columnIndex["RESIDUE"]
+            self._residueWidth = residueEnd - residueStart
+            aminoAcidIndex = columnIndex["AA"][0]
+            structureIndex = columnIndex["STRUCTURE"][0]
+            lineWidth = max(residueEnd, aminoAcidIndex, structureIndex) + 1
+
+            for line in dsspFile:
+                line = line.rstrip(b"\r\n")
+                if not line:
+                    continue
+                line = line.ljust(lineWidth)
+                residueColumn += line[residueStart:residueEnd]
+                aminoAcidColumn.append(line[aminoAcidIndex])
+                structureColumn.append(line[structureIndex])
+
+        self._residueColumn = bytes(residueColumn)
+        self._aminoAcids = bytes(aminoAcidColumn)
+        self._structures = bytes(structureColumn)
+
+        # Residues of each chain : the chain is the last character of the RESIDUE column
+        chains = self._residueColumn[self._residueWidth - 1::self._residueWidth] if self._residueWidth else b""
+        self._chainSlices = {}
+        for match in re.finditer(rb"(.)\1*", chains, re.DOTALL):
+            self._chainSlices.setdefault(match.group().decode("latin-1")[0], []).append(match.span())
+
+    @property
+    def residues(self):
+        """
+        The residues of the file, as [residue, amino acid, structure] lists of strings.
+        """
+        width = self._residueWidth
+        residues = self._residueColumn.decode("latin-1")
+        return [[residues[index * width:(index + 1) * width], chr(aminoAcid), chr(structure)]
+                for index, (aminoAcid, structure) in enumerate(zip(self._aminoAcids, self._structures))]
+
+    def __len__(self):
+        """Number of residues in the file (including chain breaks)."""
+        return len(self._aminoAcids)
 
     def __repr__(self):
         res = []
@@ -52,14 +98,46 @@ class DSSP:
             res.append(str(values))
         return "\n".join(res)
 
+    def getChains(self):
+        """
+        Returns the identifiers of the chains of the file, in order of appearance (chain breaks are not included).
+        """
+        return [chain for chain in self._chainSlices if chain != " "]
+
     def getSequenceStructure(self, chain):
-        structs = {"H": "H", "G": "H", "I": "H", "E": "E", "B": "E", "T": "T", "C": "C", "S": "C", " ": "C"}
-        sequence = []
-        structure = []
+        """
+        Returns the sequence of 'chain' and its structure (reduced with STRUCTURES), as two strings.
+        """
+        slices = self._chainSlices.get(chain, ())
+        sequence = b"".join(self._aminoAcids[start:stop] for start, stop in slices)
+        structure = b"".join(self._structures[start:stop] for start, stop in slices).translate(_STRUCTURE_TABLE)
+        return sequence.decode("latin-1"), structure.decode("latin-1")
+
+
+def loadDsspDirectory(directory, workers=None):
+    """
+    Parses all .dssp files of 'directory' over 'workers' processes (as many as CPUs if None, none if 1),
+    and returns their DSSP objects, sorted by file name.
+    """
+    return parseDsspFiles([os.path.join(directory, name) for name in getDsspNames(directory)], workers)
+
+
+def getDsspNames(directory):
+    """
+    Returns the sorted names of the .dssp files of 'directory'.
+    """
+    return sorted(name for name in os.listdir(directory) if name.lower().endswith(".dssp"))
+
 
-        for residue in self.residues:
-            if residue[0][-1] == chain:
-                sequence.append(residue[1][0])
-                structure.append(structs[residue[2][0]])
+def parseDsspFiles(paths, workers=None):
+    """
+    Parses the .dssp files located in 'paths' over 'workers' processes (as many as CPUs if None, none if 1),
+    and returns their DSSP objects, in the same order.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 1 or len(paths) < 2:
+        return list(map(DSSP, paths))
 
-        return "".join(sequence), "".join(structure)
+    with Pool(min(workers, len(paths))) as pool:
+        return pool.map(DSSP, paths, chunksize=max(1, len(paths) // (4 * workers)))
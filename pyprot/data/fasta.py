@@ -1,19 +1,230 @@
-from pyprot.base.sequence import Sequence
+import os
 
+from pyprot.base.sequence import CompactSequence
+from pyprot.data.compressed import getCompression, openBinary, openBinaryOutput
 
-def getSequencesFromFasta(path):
+# Size of blocks read from FASTA files
+BLOCK_SIZE = 1 << 22
+
+
+def getSequencesFromFasta(path, batchSize=None):
+    """
+    Loads the FASTA file located in 'path' and yields the Sequences it contains, as CompactSequences.
+    The file can be compressed (see pyprot.data.compressed.openBinary).
+    Amino acids found before the first header form a Sequence without description.
+    If 'batchSize' is provided, yields lists of (at most) 'batchSize' Sequences instead.
+    """
+    sequences = map(_sequenceFromRecord, getRecordsFromFasta(path))
+    if batchSize is None:
+        yield from sequences
+    else:
+        batch = []
+        for sequence in sequences:
+            batch.append(sequence)
+            if len(batch) == batchSize:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def getRecordsFromFasta(path):
+    """
+    Reads the FASTA file located in 'path' by large blocks, and yields the raw bytes of each of its records
+    (from the '>' of their header, if any, to the end of their last line).
+    Whitespace found before the first header is not a record.
+    """
+    with openBinary(path) as fastaFile:
+        buffer = bytearray()
+        for block in iter(lambda: fastaFile.read(BLOCK_SIZE), b""):
+            searchStart = max(len(buffer) - 1, 0)  # a record separator can be split between blocks
+            buffer += block
+            recordStart = 0
+            recordEnd = buffer.find(b"\n>", searchStart)
+            while recordEnd != -1:
+                record = bytes(buffer[recordStart:recordEnd])
+                if record[:1] == b">" or record.strip() != b"":
+                    yield record
+                recordStart = recordEnd + 1
+                recordEnd = buffer.find(b"\n>", recordStart)
+            del buffer[:recordStart]
+        if buffer.strip() != b"":
+            yield bytes(buffer)
+
+
+def _sequenceFromRecord(record):
     """
-    Loads the FASTA file located in 'path' and yields the Sequences it contains.
+    Returns the CompactSequence of a FASTA record (see getRecordsFromFasta).
     """
-    with open(path, 'r') as fastaFile:
-        newProtein = None
+    if record[:1] != b">":
+        return CompactSequence.fromBytes(record)
+    headerEnd = record.find(b"\n")
+    if headerEnd == -1:
+        headerEnd = len(record)
+    description = record[1:headerEnd].rstrip().decode("utf-8", "replace")
+    return CompactSequence.fromBytes(record[headerEnd + 1:], description)
+
+
+def writeSequencesToFasta(path, sequences, lineWidth=60, compression="infer"):
+    """
+    Writes all Sequences from 'sequences' (which can be a generator) to a FASTA file located in 'path',
+    with at most 'lineWidth' amino acids per line (no limit if None), and returns the number of Sequences written.
+    The file is compressed with 'compression' (see pyprot.data.compressed.openBinaryOutput), by default
+    according to its extension. Sequences are written in large chunks, without ever being all held in memory.
+    """
+    count = 0
+    with openBinaryOutput(path, compression) as fastaFile:
+        chunk, chunkSize = [], 0
+        for sequence in sequences:
+            if not isinstance(sequence, CompactSequence):
+                sequence = CompactSequence(sequence)
+            names = sequence.toBytes()
+            chunk.append(b">" + sequence.getDescription().encode("utf-8") + b"\n")
+            if lineWidth is None or len(names) <= lineWidth:
+                chunk.append(names + b"\n" if names else b"")
+            else:
+                chunk.append(b"\n".join([names[start:start + lineWidth]
+                                         for start in range(0, len(names), lineWidth)]) + b"\n")
+            chunkSize += len(names)
+            count += 1
+            if chunkSize >= BLOCK_SIZE:
+                fastaFile.write(b"".join(chunk))
+                chunk, chunkSize = [], 0
+        fastaFile.write(b"".join(chunk))
+    return count
+
+
+def indexFasta(path):
+    """
+    Indexes the FASTA file located in 'path', and saves the index next to it (in 'path'.fai, as samtools does).
+    Returns the index, mapping the name of each record (the first word of its header) to its length,
+    the offset of its first amino acid in the file, its number of amino acids per line and its line width in bytes.
+    """
+    if getCompression(path) is not None:
+        raise ValueError("Compressed FASTA files cannot be indexed")
+
+    index = {}
+    with open(path, 'rb') as fastaFile:
+        name, record, offset, ended = None, None, 0, False
         for line in fastaFile:
-            line_s = line.strip()
-            if line_s != "" and line_s[0] == ">":
-                if newProtein is not None:
-                    yield newProtein
-                newProtein = Sequence(None, line_s[1:])
+            if line[:1] == b">":
+                name = line[1:].split(maxsplit=1)[0].decode("utf-8", "replace") if line[1:].strip() else ""
+                if name in index:
+                    raise ValueError("Record name {} is found twice in {}".format(name, path))
+                record, ended = [0, offset + len(line), 0, 0], False
+                index[name] = record
+            elif line.strip() == b"":
+                ended = record is not None and record[0] > 0  # only blank lines can follow
             else:
-                newProtein.extend(line_s)
-        if len(newProtein) > 0:
-            yield newProtein
+                if record is None:
+                    raise ValueError("{} does not start with a header".format(path))
+                lineBases = len(line.rstrip(b"\r\n"))
+                if record[2] == 0:
+                    record[2], record[3] = lineBases, len(line)
+                elif ended or record[0] % record[2] != 0 or lineBases > record[2]:
+                    raise ValueError("Record {} of {} has lines of different lengths".format(name, path))
+                record[0] += lineBases
+            offset += len(line)
+
+    index = {name: tuple(record) for name, record in index.items()}
+    try:
+        with open(path + ".fai", 'w') as indexFile:
+            for name, record in index.items():
+                indexFile.write("\t".join([name] + [str(value) for value in record]) + "\n")
+    except OSError:
+        pass  # the index is still usable, but will be built again next time
+    return index
+
+
+class FastaIndex:
+    """
+    Gives access to the Sequences of a FASTA file by name, reading only the bytes they are made of.
+    The index of the file is read from 'path'.fai, which is created (or updated) when needed.
+    """
+
+    def __init__(self, path):
+        """
+        Creates a FastaIndex object for the FASTA file located in 'path'.
+        """
+        self._path = path
+        self._records = FastaIndex.__loadIndex(path)
+        self._file = open(path, 'rb')
+
+    @staticmethod
+    def __loadIndex(path):
+        """Returns the index of the FASTA file located in 'path' (see indexFasta)."""
+        indexPath = path + ".fai"
+        if not os.path.exists(indexPath) or os.path.getmtime(indexPath) < os.path.getmtime(path):
+            return indexFasta(path)
+        with open(indexPath, 'r') as indexFile:
+            return {values[0]: tuple(int(value) for value in values[1:5])
+                    for values in (line.rstrip("\n").split("\t") for line in indexFile)}
+
+    def __len__(self):
+        """Number of Sequences in the FASTA file."""
+        return len(self._records)
+
+    def __contains__(self, name):
+        return name in self._records
+
+    def __iter__(self):
+        """Iterates over the names of all Sequences, in file order."""
+        return iter(self._records)
+
+    def __getitem__(self, name):
+        """Returns the Sequence called 'name' as a CompactSequence."""
+        return self.fetch(name)
+
+    def getLength(self, name):
+        """Returns the number of amino acids of the Sequence called 'name'."""
+        return self.__getRecord(name)[0]
+
+    def fetch(self, name, start=0, end=None):
+        """
+        Returns the amino acids of the Sequence called 'name' from index 'start' to 'end' (excluded),
+        as a CompactSequence described by its whole header (as in getSequencesFromFasta).
+        'start' and 'end' are used as in slices.
+        """
+        length, offset, lineBases, lineWidth = self.__getRecord(name)
+        description = self.__readDescription(offset)
+        start, end, step = slice(start, end).indices(length)
+        if start >= end:
+            return CompactSequence(None, description)
+
+        # Position of amino acids in the file, skipping line breaks
+        startOffset = offset + (start // lineBases) * lineWidth + start % lineBases
+        endOffset = offset + ((end - 1) // lineBases) * lineWidth + (end - 1) % lineBases + 1
+        self._file.seek(startOffset)
+        return CompactSequence.fromBytes(self._file.read(endOffset - startOffset), description)
+
+    def __readDescription(self, offset):
+        """
+        Returns the description of the record whose amino acids start at 'offset',
+        reading its header line (which ends right before 'offset') backwards.
+        """
+        header, position, lineStart = b"", offset, -1
+        while position > 0:
+            readStart = max(position - 1024, 0)
+            self._file.seek(readStart)
+            header = self._file.read(position - readStart) + header
+            position = readStart
+            lineStart = header.rfind(b"\n", 0, len(header) - 1)  # the last byte is the end of the header line
+            if lineStart != -1:
+                break
+        return header[lineStart + 2:].rstrip().decode("utf-8", "replace")
+
+    def __getRecord(self, name):
+        try:
+            return self._records[name]
+        except KeyError:
+            raise KeyError("No Sequence called {} in {}".format(name, self._path))
+
+    def close(self):
+        """Closes the FASTA file."""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
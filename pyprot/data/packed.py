@@ -0,0 +1,129 @@
+import mmap
+import struct
+
+import numpy as np
+
+from pyprot.base.sequence import CompactSequence
+from pyprot.data.fasta import getSequencesFromFasta
+
+# Packed databases start with this header : magic bytes, format version, Sequence count,
+# and the offsets of the amino acids, the Sequence offsets and the descriptions sections
+PACKED_MAGIC = b"PYPROTDB"
+PACKED_VERSION = 1
+_HEADER = struct.Struct("<8sIIQQQQ")
+
+
+def packFasta(fastaPath, packedPath):
+    """
+    Converts the FASTA file located in 'fastaPath' into a packed database saved to 'packedPath' (see PackedDatabase).
+    Sequences are streamed, so only their offsets and descriptions are kept in memory.
+    Returns the number of Sequences in the database.
+    """
+    sequenceOffsets, descriptions = [0], []
+    with open(packedPath, 'wb') as packedFile:
+        packedFile.write(bytes(_HEADER.size))
+        for sequence in getSequencesFromFasta(fastaPath):
+            packedFile.write(sequence.getCodes())
+            sequenceOffsets.append(sequenceOffsets[-1] + len(sequence))
+            descriptions.append(sequence.getDescription().encode("utf-8"))
+
+        # Offset sections are aligned on 8 bytes, so they can be mapped as arrays
+        packedFile.write(bytes(-packedFile.tell() % 8))
+        offsetsStart = packedFile.tell()
+        packedFile.write(np.array(sequenceOffsets, dtype="<u8").tobytes())
+
+        descriptionsStart = packedFile.tell()
+        descriptionOffsets = np.cumsum([0] + [len(description) for description in descriptions], dtype="<u8")
+        packedFile.write(descriptionOffsets.tobytes())
+        packedFile.write(b"".join(descriptions))
+
+        packedFile.seek(0)
+        packedFile.write(_HEADER.pack(PACKED_MAGIC, PACKED_VERSION, 0, len(descriptions), _HEADER.size,
+                                      offsetsStart, descriptionsStart))
+    return len(descriptions)
+
+
+class PackedDatabase:
+    """
+    Represents a packed database of Sequences (see packFasta) : the amino acid ids of all Sequences
+    (as in AA_NAMES) are concatenated, followed by the offsets of each Sequence and their descriptions.
+    The file is memory-mapped : opening it reads nothing, and Sequences are CompactSequences sharing the pages
+    of the file (with any other process using the same database) until they are modified.
+    """
+
+    def __init__(self, path):
+        """
+        Opens the packed database located in 'path'.
+        """
+        self._path = path
+        with open(path, 'rb') as packedFile:
+            self._mmap = mmap.mmap(packedFile.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, padding, count, codesStart, offsetsStart, descriptionsStart = \
+            _HEADER.unpack_from(self._mmap)
+        if magic != PACKED_MAGIC or version != PACKED_VERSION:
+            self._mmap.close()
+            if magic != PACKED_MAGIC:
+                raise ValueError("{} is not a packed database".format(path))
+            raise ValueError("Unsupported packed database version {}".format(version))
+
+        self._count = count
+        self._codesStart = codesStart
+        self._sequenceOffsets = np.frombuffer(self._mmap, dtype="<u8", count=count + 1, offset=offsetsStart)
+        self._descriptionOffsets = np.frombuffer(self._mmap, dtype="<u8", count=count + 1, offset=descriptionsStart)
+        self._descriptionsStart = descriptionsStart + 8 * (count + 1)
+
+    def __reduce__(self):
+        """Pickling support (for other processes) : the database is opened again from its path."""
+        return PackedDatabase, (self._path,)
+
+    def __len__(self):
+        """Number of Sequences in the database."""
+        return self._count
+
+    def __getitem__(self, index):
+        """Returns the Sequence at index 'index', as a CompactSequence sharing the pages of the database."""
+        index = self.__checkIndex(index)
+        start = self._codesStart + int(self._sequenceOffsets[index])
+        stop = self._codesStart + int(self._sequenceOffsets[index + 1])
+        # The codes were checked when packing the database
+        return CompactSequence._fromCodes(memoryview(self._mmap)[start:stop], self.getDescription(index))
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def getDescription(self, index):
+        """Returns the description of the Sequence at index 'index'."""
+        index = self.__checkIndex(index)
+        start = self._descriptionsStart + int(self._descriptionOffsets[index])
+        stop = self._descriptionsStart + int(self._descriptionOffsets[index + 1])
+        return self._mmap[start:stop].decode("utf-8")
+
+    def getLength(self, index):
+        """Returns the number of amino acids of the Sequence at index 'index'."""
+        index = self.__checkIndex(index)
+        return int(self._sequenceOffsets[index + 1] - self._sequenceOffsets[index])
+
+    def __checkIndex(self, index):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("PackedDatabase index out of range")
+        return index
+
+    def close(self):
+        """
+        Closes the database. Pages still used by its Sequences are only released once they are deleted.
+        """
+        self._sequenceOffsets = self._descriptionOffsets = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
@@ -0,0 +1,15 @@
+from multiprocessing import Pool
+from unittest import TestCase
+
+from pyprot.data.chunks import getChunks, mapChunks
+
+
+class TestChunks(TestCase):
+    def test_getChunks(self):
+        self.assertEqual(list(getChunks(iter(range(7)), 3)), [[0, 1, 2], [3, 4, 5], [6]])
+        self.assertEqual(list(getChunks([], 3)), [])
+
+    def test_mapChunks(self):
+        chunks = list(getChunks(range(20), 3))
+        with Pool(2) as pool:
+            self.assertEqual(list(mapChunks(pool, sum, iter(chunks), 2)), [(chunk, sum(chunk)) for chunk in chunks])
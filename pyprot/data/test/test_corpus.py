@@ -0,0 +1,51 @@
+import os
+import pickle
+import shutil
+import tempfile
+from unittest import TestCase
+
+from pyprot.data.corpus import DsspCorpus, compileDsspCorpus, loadDsspCorpus
+from pyprot.data.dssp import loadDsspDirectory
+from pyprot.data.test.test_dssp import writeDssp
+
+
+class TestDsspCorpus(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        writeDssp(os.path.join(self.directory, "1abc.dssp"), [("A", "MKVLAGHE", "  HHGGIE"), ("B", "KVLTTS", "EBTSC ")])
+        writeDssp(os.path.join(self.directory, "2abc.dssp"), [("C", "WWPP", "HHHH")])
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def expectedChains(self):
+        return [dssp.getSequenceStructure(chain) for dssp in loadDsspDirectory(self.directory, 1)
+                for chain in dssp.getChains()]
+
+    def test_sameAsDssp(self):
+        self.assertEqual(compileDsspCorpus(self.directory, workers=1), 3)
+        with loadDsspCorpus(self.directory) as corpus:
+            self.assertEqual(list(corpus), self.expectedChains())
+            self.assertEqual(corpus.getChain(1), "B")
+            self.assertEqual(corpus.getMetadata(-1), ("1ABC", "LYSOZYME C", "GALLUS GALLUS"))
+            self.assertEqual(corpus.getFile(2)[0], "2abc.dssp")
+            self.assertEqual(pickle.loads(pickle.dumps(corpus))[2], ("WWPP", "HHHH"))
+
+    def test_invalidation(self):
+        with loadDsspCorpus(self.directory, workers=1) as corpus:
+            self.assertTrue(corpus.isCurrent(self.directory))
+
+        writeDssp(os.path.join(self.directory, "2abc.dssp"), [("C", "WWPPG", "HHHHE")])
+        os.utime(os.path.join(self.directory, "2abc.dssp"), ns=(0, 0))
+        writeDssp(os.path.join(self.directory, "3abc.dssp"), [("D", "GG", "TT")])
+        with DsspCorpus(os.path.join(self.directory, ".pyprot-dssp.corpus")) as corpus:
+            self.assertFalse(corpus.isCurrent(self.directory))
+        with loadDsspCorpus(self.directory, workers=1) as corpus:
+            self.assertTrue(corpus.isCurrent(self.directory))
+            self.assertEqual(list(corpus), self.expectedChains())
+            self.assertEqual(len(corpus), 4)
+
+    def test_notACorpus(self):
+        path = os.path.join(self.directory, "1abc.dssp")
+        with self.assertRaises(ValueError):
+            DsspCorpus(path)
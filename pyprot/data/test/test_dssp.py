@@ -0,0 +1,68 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from pyprot.data.dssp import DSSP, loadDsspDirectory
+
+HEADER = """==== Secondary Structure Definition by the program DSSP ==== DATE=2017-01-01                        .
+REFERENCE W. KABSCH AND C.SANDER, BIOPOLYMERS 22 (1983) 2577-2637                                    .
+HEADER    HYDROLASE                               01-JAN-17   1ABC                                   .
+COMPND   2 MOLECULE: LYSOZYME   C;                                                                   .
+SOURCE   2 ORGANISM_SCIENTIFIC: GALLUS  GALLUS;                                                      .
+  #  RESIDUE AA STRUCTURE BP1 BP2  ACC     N-H-->O    O-->H-N    N-H-->O    O-->H-N    TCO  KAPPA ALPHA  PHI   PSI
+"""
+
+
+def dsspLine(number, residue, chain, aminoAcid, structure):
+    return "{:5d}{:5}{:1}{:1} {:1}  {:1}              0   0   50      0, 0.0     0, 0.0\n".format(
+        number, residue, " ", chain, aminoAcid, structure)
+
+
+def writeDssp(path, chains):
+    with open(path, 'w') as dsspFile:
+        dsspFile.write(HEADER)
+        number = 1
+        for chain, sequence, structure in chains:
+            if number > 1:
+                dsspFile.write("{:5d}        !              0   0    0      0, 0.0     0, 0.0\n".format(number))
+                number += 1
+            for residue, (aminoAcid, struct) in enumerate(zip(sequence, structure)):
+                dsspFile.write(dsspLine(number, residue + 1, chain, aminoAcid, struct))
+                number += 1
+
+
+class TestDSSP(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "1abc.dssp")
+        writeDssp(self.path, [("A", "MKVLAGHE", "  HHGGIE"), ("B", "KVLTTS", "EBTSC ")])
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_metadata(self):
+        dssp = DSSP(self.path)
+        self.assertEqual(dssp.identifier, "1ABC")
+        self.assertEqual(dssp.protein, "LYSOZYME C")
+        self.assertEqual(dssp.organism, "GALLUS GALLUS")
+
+    def test_residues(self):
+        dssp = DSSP(self.path)
+        self.assertEqual(len(dssp), 15)
+        self.assertEqual(dssp.residues[0], ["    1 A", "M", " "])
+        self.assertEqual(dssp.residues[8][1], "!")
+
+    def test_getSequenceStructure(self):
+        dssp = DSSP(self.path)
+        self.assertEqual(dssp.getChains(), ["A", "B"])
+        self.assertEqual(dssp.getSequenceStructure("A"), ("MKVLAGHE", "CCHHHHHE"))
+        self.assertEqual(dssp.getSequenceStructure("B"), ("KVLTTS", "EETCCC"))
+        self.assertEqual(dssp.getSequenceStructure("Z"), ("", ""))
+
+    def test_loadDsspDirectory(self):
+        writeDssp(os.path.join(self.directory, "2abc.dssp"), [("C", "WWPP", "HHHH")])
+        for workers in (1, 2):
+            dssps = loadDsspDirectory(self.directory, workers)
+            self.assertEqual([dssp.getChains() for dssp in dssps], [["A", "B"], ["C"]])
+            self.assertEqual(dssps[1].getSequenceStructure("C"), ("WWPP", "HHHH"))
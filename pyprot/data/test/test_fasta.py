@@ -0,0 +1,126 @@
+import bz2
+import gzip
+import lzma
+import os
+import shutil
+import struct
+import tempfile
+import zlib
+from unittest import TestCase
+
+from pyprot.base.sequence import CompactSequence, Sequence
+from pyprot.data import compressed, fasta
+
+
+class TestFasta(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def writeFasta(self, content, name="test.fasta"):
+        path = os.path.join(self.directory, name)
+        with open(path, "wb") as file:
+            file.write(content)
+        return path
+
+    def writeBgzf(self, content, blockSize=20):
+        blocks = []
+        for start in range(0, len(content), blockSize):
+            block = content[start:start + blockSize]
+            compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+            data = compressor.compress(block) + compressor.flush()
+            blocks.append(b"\x1f\x8b\x08\x04" + bytes(6) + struct.pack("<HccHH", 6, b"B", b"C", 2, len(data) + 25)
+                          + data + struct.pack("<II", zlib.crc32(block), len(block)))
+        return self.writeFasta(b"".join(blocks), "test.fasta.bgz")
+
+    def test_getSequencesFromFasta(self):
+        path = self.writeFasta(b">first protein\r\nMKL\r\nOK\r\n>second\nhea\n\n>empty\n")
+        sequences = list(fasta.getSequencesFromFasta(path))
+        self.assertEqual([seq.getDescription() for seq in sequences], ["first protein", "second", "empty"])
+        self.assertEqual(sequences, [Sequence("MKLOK"), Sequence("HEA"), Sequence()])
+        self.assertIsInstance(sequences[0], CompactSequence)
+
+    def test_getSequencesFromFasta_withoutHeader(self):
+        path = self.writeFasta(b"MKL\n>next\nOK\n")
+        sequences = list(fasta.getSequencesFromFasta(path))
+        self.assertEqual([seq.getDescription() for seq in sequences], ["", "next"])
+        self.assertEqual(sequences, [Sequence("MKL"), Sequence("OK")])
+
+    def test_getSequencesFromFasta_leadingBlankLines(self):
+        path = self.writeFasta(b"\n \r\n>a\nAC\n")
+        sequences = list(fasta.getSequencesFromFasta(path))
+        self.assertEqual([seq.getDescription() for seq in sequences], ["a"])
+        self.assertEqual(sequences, [Sequence("AC")])
+
+    def test_getSequencesFromFasta_smallBlocks(self):
+        path = self.writeFasta(b"".join(b">seq" + str(i).encode() + b"\nHEAGAWGHEE\nPAW\n" for i in range(20)))
+        blockSize = fasta.BLOCK_SIZE
+        try:
+            fasta.BLOCK_SIZE = 7
+            sequences = list(fasta.getSequencesFromFasta(path))
+        finally:
+            fasta.BLOCK_SIZE = blockSize
+        self.assertEqual(sequences, [Sequence("HEAGAWGHEEPAW")] * 20)
+        self.assertEqual(sequences[-1].getDescription(), "seq19")
+
+    def test_getSequencesFromFasta_batches(self):
+        path = self.writeFasta(b"".join(b">seq\nPAW\n" for i in range(5)))
+        batches = list(fasta.getSequencesFromFasta(path, batchSize=2))
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+
+    def test_getSequencesFromFasta_invalidName(self):
+        path = self.writeFasta(b">seq\nPA1W\n")
+        with self.assertRaises(ValueError):
+            list(fasta.getSequencesFromFasta(path))
+
+    def test_fastaIndex(self):
+        path = self.writeFasta(b">first protein\nHEAGA\nWGHEE\nKL\n>second\r\nPAWH\r\nEAE\r\n>empty\n")
+        with fasta.FastaIndex(path) as index:
+            self.assertEqual(list(index), ["first", "second", "empty"])
+            self.assertEqual(len(index), 3)
+            self.assertEqual(index["first"], Sequence("HEAGAWGHEEKL"))
+            self.assertEqual(index["second"], Sequence("PAWHEAE"))
+            self.assertEqual(index["empty"], Sequence())
+            self.assertEqual(index.fetch("first", 3, 11), Sequence("GAWGHEEK"))
+            self.assertEqual(index.fetch("second", -2), Sequence("AE"))
+            self.assertEqual(index["first"].getDescription(), "first protein")
+            self.assertEqual(index.fetch("second", 2, 2).getDescription(), "second")
+            self.assertEqual(index["empty"].getDescription(), "empty")
+        self.assertTrue(os.path.exists(path + ".fai"))
+        with fasta.FastaIndex(path) as index:
+            self.assertEqual(index.getLength("first"), 12)
+
+    def test_fastaIndex_unevenLines(self):
+        path = self.writeFasta(b">first\nHEA\nGAWGH\n")
+        with self.assertRaises(ValueError):
+            fasta.FastaIndex(path)
+
+    def test_getSequencesFromFasta_compressed(self):
+        content = b"".join(b">seq" + str(i).encode() + b"\nHEAGAWGHEE\nPAW\n" for i in range(50))
+        expected = list(fasta.getSequencesFromFasta(self.writeFasta(content)))
+        paths = {"bgzf": self.writeBgzf(content),
+                 "gzip": self.writeFasta(gzip.compress(content), "test.fasta.gz"),
+                 "bz2": self.writeFasta(bz2.compress(content), "test.fasta.bz2"),
+                 "xz": self.writeFasta(lzma.compress(content), "test.fasta.xz")}
+        for compression, path in paths.items():
+            self.assertEqual(compressed.getCompression(path), compression)
+            sequences = list(fasta.getSequencesFromFasta(path))
+            self.assertEqual(sequences, expected)
+            self.assertEqual(sequences[-1].getDescription(), "seq49")
+
+    def test_writeSequencesToFasta(self):
+        sequences = [Sequence("HEAGAWGHEEK", "first protein"), CompactSequence("PAW-HEAE", "second"), Sequence()]
+        path = os.path.join(self.directory, "written.fasta")
+        self.assertEqual(fasta.writeSequencesToFasta(path, iter(sequences), lineWidth=4), 3)
+        with open(path, "rb") as file:
+            self.assertEqual(file.read(), b">first protein\nHEAG\nAWGH\nEEK\n>second\nPAW-\nHEAE\n>\n")
+        self.assertEqual(list(fasta.getSequencesFromFasta(path)), sequences)
+
+    def test_writeSequencesToFasta_compressed(self):
+        sequences = [CompactSequence("HEAGAWGHEE" * 20, "seq" + str(i)) for i in range(10)]
+        path = os.path.join(self.directory, "written.fasta.gz")
+        fasta.writeSequencesToFasta(path, sequences)
+        self.assertEqual(compressed.getCompression(path), "gzip")
+        self.assertEqual(list(fasta.getSequencesFromFasta(path)), sequences)
@@ -0,0 +1,46 @@
+import os
+import pickle
+import shutil
+import tempfile
+from unittest import TestCase
+
+from pyprot.data.fasta import getSequencesFromFasta
+from pyprot.data.packed import PackedDatabase, packFasta
+
+PDZ = os.path.join(os.path.dirname(__file__), "..", "..", "..", "examples", "resources", "fasta", "PDZ-A.fasta")
+
+
+class TestPackedDatabase(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "PDZ-A.db")
+        self.count = packFasta(PDZ, self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_sameAsFasta(self):
+        sequences = list(getSequencesFromFasta(PDZ))
+        with PackedDatabase(self.path) as database:
+            self.assertEqual(len(database), self.count)
+            self.assertEqual(len(database), len(sequences))
+            self.assertEqual(list(database), sequences)
+            self.assertEqual(database[-1].getDescription(), sequences[-1].getDescription())
+            self.assertEqual(database.getLength(3), len(sequences[3]))
+
+    def test_sequencesAreCopiedOnWrite(self):
+        with PackedDatabase(self.path) as database:
+            sequence = database[0]
+            sequence[0] = "W"
+            self.assertNotEqual(database[0], sequence)
+            del sequence
+
+    def test_pickle(self):
+        with PackedDatabase(self.path) as database:
+            copy = pickle.loads(pickle.dumps(database))
+            self.assertEqual(copy[10], database[10])
+            copy.close()
+
+    def test_notPacked(self):
+        with self.assertRaises(ValueError):
+            PackedDatabase(PDZ)
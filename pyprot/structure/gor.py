@@ -1,9 +1,49 @@
-from math import log, sqrt
+import copy
+import mmap
+import os
+import struct
+from math import sqrt
+from multiprocessing import Pool
 
-import matplotlib.pyplot as pyplot
 import numpy as np
 
 from pyprot.base.aminoacid import AminoAcid
+from pyprot.data.chunks import getChunks, mapChunks
+from pyprot.data.compressed import openBinaryOutput
+
+# Model used for predictions in the current process, set by _initWorker
+_worker = None
+
+# Saved models start with this header : magic bytes, format version, neighbour offset and number of trainings,
+# followed by the counts and the score tables of the model (see GOR3.save)
+GOR3_MAGIC = b"PYPRGOR3"
+GOR3_VERSION = 1
+_HEADER = struct.Struct("<8sIIQ")
+
+
+def _namesTable(names):
+    """
+    Returns a translation table from the characters of 'names' to their index in 'names' (255 for other characters).
+    """
+    table = bytearray(b"\xff" * 256)
+    for index, name in enumerate(names):
+        table[ord(name)] = index
+    return bytes(table)
+
+
+def _checkCodes(codes, count, kind):
+    """
+    Returns the bytes 'codes' as an array, after checking that they are all lower than 'count'.
+    """
+    codes = np.frombuffer(codes, dtype=np.uint8)
+    if codes.size and codes.max() >= count:
+        raise ValueError("Unknown {} at position {}".format(kind, int(np.argmax(codes >= count))))
+    return codes
+
+
+# Translation tables from names to indices in GOR3.aminoAcids and GOR3.structures
+_AMINO_ACID_TABLE = _namesTable(AminoAcid.getAllNames())
+_STRUCTURE_TABLE = _namesTable("HETC")
 
 
 class GOR3:
@@ -15,93 +55,234 @@ class GOR3:
 
     def __init__(self):
         self.structures = "HETC"
+        self.aminoAcids = tuple(AminoAcid.getAllNames())
         self.roc = {(s, r): 0 for s in self.structures for r in ("TP", "TN", "FP", "FN")}
         self.minScore, self.maxScore = 0, 0
-        self.scores = {(classifier, realS): [] for classifier in self.structures for realS in self.structures}
+        self.__resetEvaluation()
         self.correctPred = 0
         self.totalPred = 0
         self.neighbourOffset = 8
 
+        # Counts of structures, (structure, AA) pairs and (structure, AA, neighbour offset, neighbour AA) triplets,
+        # indexed by position in 'structures', in 'aminoAcids' and in neighbourOffsets
         self.trainings = 0  # Number of trainings (one per AA)
-        self.strucCount = {s: 0 for s in self.structures}
-        self.pairCount = {(s, a): 0 for s in self.structures for a in AminoAcid.getAllNames()}
-        self.tripletCount = {}
-        for s in self.structures:
-            for a in AminoAcid.getAllNames():
-                for na in AminoAcid.getAllNames():  # Neighbour AA
-                    self.tripletCount[(s, a, na)] = 0
+        self.strucCounts = np.zeros(len(self.structures), dtype=np.int64)
+        self.pairCounts = np.zeros((len(self.structures), len(self.aminoAcids)), dtype=np.int64)
+        self.tripletCounts = np.zeros((len(self.structures), len(self.aminoAcids), 2 * self.neighbourOffset,
+                                       len(self.aminoAcids)), dtype=np.int64)
+        self._pairScores, self._neighbourScores = None, None  # Score tables, see compile
+
+    def __resetEvaluation(self):
+        """
+        Forgets the scores of evaluated residues. They are stored in arrays that grow as predictions are evaluated :
+        one row of scores (one per structure) and the real structure of each residue.
+        """
+        self._evaluatedScores = np.empty((0, len(self.structures)))
+        self._evaluatedStructures = np.empty(0, dtype=np.uint8)
+        self._evaluatedCount = 0
+
+    @property
+    def scores(self):
+        """Scores of evaluated residues given by each classifier, by (classifier, real structure)."""
+        scores = self._evaluatedScores[:self._evaluatedCount]
+        reality = self._evaluatedStructures[:self._evaluatedCount]
+        return {(classifier, realS): scores[reality == realIndex, classifierIndex]
+                for classifierIndex, classifier in enumerate(self.structures)
+                for realIndex, realS in enumerate(self.structures)}
+
+    @property
+    def strucCount(self):
+        """Number of trainings of each structure, by structure name."""
+        return {s: int(count) for s, count in zip(self.structures, self.strucCounts)}
+
+    @property
+    def pairCount(self):
+        """Number of trainings of each (structure, AA) pair, by names."""
+        return {(s, a): int(self.pairCounts[sIndex, aIndex])
+                for sIndex, s in enumerate(self.structures) for aIndex, a in enumerate(self.aminoAcids)}
+
+    @property
+    def tripletCount(self):
+        """Number of trainings of each (structure, AA, neighbour AA) triplet (at any offset), by names."""
+        counts = self.tripletCounts.sum(axis=2)
+        return {(s, a, na): int(counts[sIndex, aIndex, naIndex])
+                for sIndex, s in enumerate(self.structures) for aIndex, a in enumerate(self.aminoAcids)
+                for naIndex, na in enumerate(self.aminoAcids)}
+
+    def encodeSequence(self, sequence):
+        """
+        Returns the indices in 'aminoAcids' of the amino acids of 'sequence' (a string or a Sequence), as an array.
+        """
+        if isinstance(sequence, str):
+            codes = sequence.encode("latin-1", "replace").translate(_AMINO_ACID_TABLE)
+        elif hasattr(sequence, "getCodes"):
+            codes = bytes(sequence.getCodes())  # CompactSequence codes are ids, which start with 'aminoAcids'
+        else:
+            codes = bytes(aminoAcid.getId() for aminoAcid in sequence)
+        return _checkCodes(codes, len(self.aminoAcids), "amino acid")
+
+    def encodeStructure(self, structure):
+        """
+        Returns the indices in 'structures' of the structures of the string 'structure', as an array.
+        """
+        codes = structure.encode("latin-1", "replace").translate(_STRUCTURE_TABLE)
+        return _checkCodes(codes, len(self.structures), "structure")
 
     def train(self, sequence, structure):
         """
         Trains the system with a known example of a sequence and its structure.
         """
+        sequence = self.encodeSequence(sequence)
+        structure = self.encodeStructure(structure)
+        if len(structure) != len(sequence):
+            raise ValueError("The sequence and the structure must have the same length")
+        if not self.tripletCounts.flags.writeable:  # Counts of loaded models are memory-mapped
+            self.strucCounts, self.pairCounts, self.tripletCounts = \
+                self.strucCounts.copy(), self.pairCounts.copy(), self.tripletCounts.copy()
         self.trainings += len(sequence)
+        self._pairScores, self._neighbourScores = None, None
 
-        for index in range(len(sequence)):
-            curAminoacid = sequence[index]
-            curStructure = structure[index]
-            self.strucCount[curStructure] += 1
-            self.pairCount[(curStructure, curAminoacid)] += 1
+        self.strucCounts += np.bincount(structure, minlength=self.strucCounts.size)
+        pairs = structure.astype(np.intp) * len(self.aminoAcids) + sequence
+        self.pairCounts += np.bincount(pairs, minlength=self.pairCounts.size).reshape(self.pairCounts.shape)
 
-            for neiAminoacid in self.neighbourValues(sequence, index):
-                self.tripletCount[(curStructure, curAminoacid, neiAminoacid)] += 1
+        # Triplets are counted for all residues at once, one neighbour offset at a time
+        triplets = []
+        for offsetIndex, offset in enumerate(self.neighbourOffsets()):
+            length = max(0, len(sequence) - abs(offset))
+            residues, neighbours = max(0, -offset), max(0, offset)
+            triplets.append((pairs[residues:residues + length] * self.tripletCounts.shape[2] + offsetIndex)
+                            * len(self.aminoAcids) + sequence[neighbours:neighbours + length])
+        self.tripletCounts += np.bincount(np.concatenate(triplets), minlength=self.tripletCounts.size) \
+            .reshape(self.tripletCounts.shape)
 
-    def predict(self, sequence, realStructure=None):
+    def compile(self):
+        """
+        Computes the score tables used for predictions from the training counts (done by getScores when needed).
+        The score of a structure S for a residue R is the sum of the pair score of (S, R)
+        and of the neighbour scores of (S, R, N) for every neighbour N of R, as defined by the GOR III algorithm.
+        Combinations that were never trained have infinite scores, or null scores if no score can be defined.
+        """
+        neighbourCounts = self.tripletCounts.sum(axis=2)
+        otherPairCounts = self.pairCounts.sum(axis=0) - self.pairCounts
+        otherNeighbourCounts = neighbourCounts.sum(axis=0) - neighbourCounts
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pairScores = np.log(self.pairCounts / otherPairCounts)
+            pairScores += np.log((self.trainings - self.strucCounts) / self.strucCounts)[:, np.newaxis]
+            neighbourScores = np.log(neighbourCounts / otherNeighbourCounts)
+            neighbourScores += np.log(otherPairCounts / self.pairCounts)[:, :, np.newaxis]
+
+        # Tables are indexed by AA (and neighbour AA) first, so a lookup gives the scores of all structures
+        self._pairScores = np.nan_to_num(pairScores.T, nan=0, posinf=np.inf, neginf=-np.inf)
+        self._neighbourScores = np.nan_to_num(neighbourScores.transpose(1, 2, 0), nan=0, posinf=np.inf,
+                                              neginf=-np.inf)
+
+    def save(self, path):
         """
-        Returns the predicted structure of 'sequence', based on received training.
+        Saves the trained model (its counts and score tables, but not its evaluation results) to 'path',
+        in a binary file that can be loaded with GOR3.load.
         """
-        structure = []  # Result: predicted structure
+        if self._pairScores is None:
+            self.compile()
+        with open(path, 'wb') as modelFile:
+            modelFile.write(_HEADER.pack(GOR3_MAGIC, GOR3_VERSION, self.neighbourOffset, self.trainings))
+            for array in self.__modelArrays():
+                modelFile.write(np.ascontiguousarray(array, dtype=array.dtype.newbyteorder("<")).tobytes())
 
-        # Predict structures for each aminoacid in sequence
-        for index in range(len(sequence)):
-            curAminoacid = sequence[index]
+    @staticmethod
+    def load(path):
+        """
+        Returns the GOR3 model saved to 'path' (see save). The file is memory-mapped : its tables are only read
+        when predicting, and shared with any other process using the same model.
+        """
+        with open(path, 'rb') as modelFile:
+            modelMap = mmap.mmap(modelFile.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, neighbourOffset, trainings = _HEADER.unpack_from(modelMap)
+        except struct.error:
+            magic, version = None, None
+        if magic != GOR3_MAGIC or version != GOR3_VERSION:
+            modelMap.close()
+            if magic != GOR3_MAGIC:
+                raise ValueError("{} is not a GOR3 model".format(path))
+            raise ValueError("Unsupported GOR3 model version {}".format(version))
 
-            # First possible structure
-            predStructure = self.structures[0]
-            predScore = self.__getScore(sequence, index, predStructure)
+        model = GOR3()
+        model.neighbourOffset = neighbourOffset
+        model.trainings = trainings
+        model.tripletCounts = np.zeros(model.tripletCounts.shape[:2] + (2 * neighbourOffset,)
+                                       + model.tripletCounts.shape[3:], dtype=np.int64)
+        model._pairScores = np.zeros((len(model.aminoAcids), len(model.structures)))
+        model._neighbourScores = np.zeros((len(model.aminoAcids),) * 2 + (len(model.structures),))
 
-            # Other structures
-            for curStructure in self.structures[1:]:
-                curScore = self.__getScore(sequence, index, curStructure)
+        arrays, offset = [], _HEADER.size
+        for array in model.__modelArrays():
+            arrays.append(np.frombuffer(modelMap, dtype=array.dtype.newbyteorder("<"), count=array.size,
+                                        offset=offset).reshape(array.shape))
+            offset += array.nbytes
+        model.strucCounts, model.pairCounts, model.tripletCounts, model._pairScores, model._neighbourScores = arrays
+        return model
 
-                # Remember structure that gives best score
-                if curScore > predScore:
-                    predStructure = curStructure
-                    predScore = curScore
+    def __modelArrays(self):
+        """Returns the arrays saved by save, in order."""
+        return self.strucCounts, self.pairCounts, self.tripletCounts, self._pairScores, self._neighbourScores
 
-            structure.append(predStructure)
-        structure = "".join(structure)
+    def getScores(self, sequence):
+        """
+        Returns the scores of each structure (in the order of 'structures') for each residue of 'sequence',
+        as an array of shape (len(sequence), len(structures)).
+        """
+        if self._pairScores is None:
+            self.compile()
+        codes = self.encodeSequence(sequence)
+        scores = self._pairScores[codes]
+        for offset in self.neighbourOffsets():
+            length = max(0, len(codes) - abs(offset))
+            residues, neighbours = max(0, -offset), max(0, offset)
+            scores[residues:residues + length] += self._neighbourScores[codes[residues:residues + length],
+                                                                        codes[neighbours:neighbours + length]]
+        scores[np.isnan(scores)] = 0
+        return scores
 
+    def predict(self, sequence, realStructure=None):
+        """
+        Returns the predicted structure of 'sequence', based on received training : the structure with the best score
+        for each residue (see getScores).
+        """
+        scores = self.getScores(sequence)
+        names = np.frombuffer(self.structures.encode("ascii"), dtype=np.uint8)
+        structure = names[scores.argmax(axis=1)].tobytes().decode("ascii")
         if not realStructure is None:
-            self.__quality(sequence, structure, realStructure)
+            self.__quality(scores, structure, realStructure)
 
         return structure
 
-    def __getScore(self, sequence, index, struct):
+    def predictMany(self, sequences, workers=None, outPath=None, chunkSize=64):
         """
-        Returns I(deltaS, R) as defined by the GOR III algorithm.
+        Yields the predicted structure of each Sequence (or string) of 'sequences' (which can be a generator), in order.
+        Sequences are predicted in chunks of 'chunkSize' Sequences, distributed over 'workers' processes
+        (as many as CPUs if None, none if 1) which all receive the trained model once.
+        If 'outPath' is given, structures are also written to it as FASTA records (with the descriptions of the
+        Sequences), compressed according to its extension as in pyprot.data.fasta.writeSequencesToFasta.
         """
-        aminoacid = sequence[index]
-        scoreTerms = []
-
-        score = self.pairCount[(struct, aminoacid)]
-        score /= sum(self.pairCount[(otherStruct, aminoacid)] for otherStruct in self.getStructures(struct))
-        scoreTerms.append(score)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if self._pairScores is None:
+            self.compile()
 
-        score = (self.trainings - self.strucCount[struct]) / self.strucCount[struct]
-        scoreTerms.append(score)
+        # Evaluation results are not needed to predict, so they are not sent to other processes
+        model = copy.copy(self)
+        model.__resetEvaluation()
 
-        for neiAminoacid in self.neighbourValues(sequence, index):
-            score = self.tripletCount[(struct, aminoacid, neiAminoacid)]
-            score /= sum(
-                self.tripletCount[(otherStruct, aminoacid, neiAminoacid)] for otherStruct in self.getStructures(struct))
-            scoreTerms.append(score)
+        chunks = getChunks(sequences, chunkSize)
+        if workers == 1:
+            predictedChunks = ((chunk, _predictChunk(chunk, model)) for chunk in chunks)
+            yield from _writePredictions(predictedChunks, outPath)
+            return
 
-            score = sum(self.pairCount[(otherStruct, aminoacid)] for otherStruct in self.getStructures(struct))
-            score /= self.pairCount[(struct, aminoacid)]
-            scoreTerms.append(score)
-
-        return sum(log(s) for s in scoreTerms)
+        with Pool(workers, _initWorker, (model,)) as pool:
+            # Only a few chunks per process are waiting at once, so 'sequences' is never fully loaded
+            yield from _writePredictions(mapChunks(pool, _predictChunk, chunks, 4 * workers), outPath)
 
     def neighbourOffsets(self):
         for offset in range(-self.neighbourOffset, self.neighbourOffset + 1):
@@ -119,27 +300,32 @@ class GOR3:
             if s != exclude:
                 yield s
 
-    def __quality(self, sequence, structure, reality):
+    def __quality(self, scores, structure, reality):
         self.totalPred += len(structure)  # Total predictions
         self.correctPred += sum([1 if s == r else 0 for s, r in zip(structure, reality)])  # Correct predictions
-        for index in range(len(sequence)):
-            scores = [self.__getScore(sequence, index, classifier) for classifier in self.structures]
-            maxScore = max(scores)
-            for classifier, score in zip(self.structures, scores):
-                realS = reality[index]
-                self.scores[(classifier, realS)].append(score)
-                self.minScore = score if score < self.minScore else self.minScore
-                self.maxScore = score if score > self.maxScore else self.maxScore
-                if score == maxScore:  # Positive
-                    if classifier == realS:  # True
-                        self.roc[(classifier, "TP")] += 1
-                    else:  # False
-                        self.roc[(classifier, "FP")] += 1
-                else:  # Negative
-                    if classifier != realS:  # True
-                        self.roc[(classifier, "TN")] += 1
-                    else:  # False
-                        self.roc[(classifier, "FN")] += 1
+        if len(scores) == 0:
+            return
+        reality = self.encodeStructure(reality[:len(scores)])
+        positives = scores == scores.max(axis=1, keepdims=True)
+        finiteScores = scores[np.isfinite(scores)]
+        if finiteScores.size:
+            self.minScore = min(self.minScore, float(finiteScores.min()))
+            self.maxScore = max(self.maxScore, float(finiteScores.max()))
+        count = self._evaluatedCount + len(scores)
+        if count > len(self._evaluatedStructures):
+            capacity = max(count, 2 * len(self._evaluatedStructures), 1024)
+            self._evaluatedScores = np.resize(self._evaluatedScores, (capacity, len(self.structures)))
+            self._evaluatedStructures = np.resize(self._evaluatedStructures, capacity)
+        self._evaluatedScores[self._evaluatedCount:count] = scores
+        self._evaluatedStructures[self._evaluatedCount:count] = reality
+        self._evaluatedCount = count
+
+        for classifierIndex, classifier in enumerate(self.structures):
+            real = reality == classifierIndex
+            self.roc[(classifier, "TP")] += int(np.count_nonzero(positives[:, classifierIndex] & real))
+            self.roc[(classifier, "FP")] += int(np.count_nonzero(positives[:, classifierIndex] & ~real))
+            self.roc[(classifier, "TN")] += int(np.count_nonzero(~positives[:, classifierIndex] & ~real))
+            self.roc[(classifier, "FN")] += int(np.count_nonzero(~positives[:, classifierIndex] & real))
 
     def getQuality(self):
         tp = sum([self.roc[(c, "TP")] for c in self.structures])
@@ -150,32 +336,39 @@ class GOR3:
         q3 = self.correctPred / self.totalPred
         return q3, mcc
 
+    def getROC(self):
+        """
+        Returns the Receiver Operating Characteristic curve of each classifier, computed from the scores of all
+        residues evaluated by predict : a (false positive rates, true positive rates, area under curve) tuple
+        by structure. The curves have one point per distinct score, found by sorting the scores once.
+        """
+        scores = self._evaluatedScores[:self._evaluatedCount]
+        reality = self._evaluatedStructures[:self._evaluatedCount]
+        curves = {}
+        for classifierIndex, classifier in enumerate(self.structures):
+            order = np.argsort(-scores[:, classifierIndex], kind="stable")
+            sortedScores = scores[order, classifierIndex]
+            truePositives = np.cumsum(reality[order] == classifierIndex)
+            falsePositives = np.arange(1, len(order) + 1) - truePositives
+
+            # Residues with equal scores are all positive or all negative, so only the last one gives a point
+            thresholds = np.append(np.flatnonzero(sortedScores[1:] != sortedScores[:-1]), len(order) - 1)
+            thresholds = thresholds[thresholds >= 0]
+            truePositives = np.append(0, truePositives[thresholds])
+            falsePositives = np.append(0, falsePositives[thresholds])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                tpr = truePositives / truePositives[-1]
+                fpr = falsePositives / falsePositives[-1]
+            auc = float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1])) / 2)  # Area Under Curve
+            curves[classifier] = (fpr, tpr, auc)
+        return curves
+
     def plotROC(self):
-        for classifier in self.structures:
-            x, y = [], []
-            for threshold in np.arange(self.minScore, self.maxScore, 0.1):
-                tp, tn, fp, fn = 0, 0, 0, 0
-                for realS in self.structures:
-                    for score in self.scores[(classifier, realS)]:
-                        if score >= threshold:  # Positive
-                            if classifier == realS:  # True
-                                tp += 1
-                            else:  # False
-                                fp += 1
-                        else:  # Negative
-                            if classifier != realS:  # True
-                                tn += 1
-                            else:  # False
-                                fn += 1
-                tpr = tp / (tp + fn)
-                fpr = fp / (tn + fp)
-                x.append(fpr)
-                y.append(tpr)
+        import matplotlib.pyplot as pyplot  # Only loaded when plotting, as it is slow to import
+
+        for classifier, (x, y, auc) in self.getROC().items():
             print("----- Receiver Operating Characteristic Curve -----")
             print("Classifier:", classifier)
-            x.sort()
-            y.sort()
-            auc = np.trapz(y, x)  # Area Under Curve
             print("AUC:", auc)
             pyplot.title("Classifier " + classifier)
             pyplot.xlabel('False Positive Rate')
@@ -183,3 +376,40 @@ class GOR3:
             pyplot.plot([0, 1], [0, 1])
             pyplot.plot(x, y)
             pyplot.show()
+
+
+def _initWorker(model):
+    """
+    Stores the GOR3 'model' used for predictions in the current process.
+    """
+    global _worker
+    _worker = model
+
+
+def _predictChunk(chunk, model=None):
+    """
+    Returns the structures predicted for the Sequences of 'chunk' by 'model' (the model of the process if None).
+    """
+    model = model if model is not None else _worker
+    return [model.predict(sequence) for sequence in chunk]
+
+
+def _writePredictions(predictedChunks, outPath):
+    """
+    Yields the structures of all (Sequences, structures) 'predictedChunks',
+    and writes them to 'outPath' as FASTA records if it is not None.
+    """
+    if outPath is None:
+        for chunk, structures in predictedChunks:
+            yield from structures
+        return
+
+    with openBinaryOutput(outPath, "infer") as outFile:
+        for chunk, structures in predictedChunks:
+            records = []
+            for sequence, structure in zip(chunk, structures):
+                description = sequence.getDescription() if hasattr(sequence, "getDescription") else ""
+                records.append(">{}\n".format(description))
+                records.extend(structure[start:start + 60] + "\n" for start in range(0, len(structure), 60))
+            outFile.write("".join(records).encode("utf-8"))
+            yield from structures
@@ -0,0 +1,139 @@
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+from unittest import TestCase
+
+from pyprot.base.sequence import CompactSequence, Sequence
+from pyprot.data.fasta import getSequencesFromFasta
+from pyprot.structure.gor import GOR3
+
+
+def randomExamples(count, seed=0):
+    generator = random.Random(seed)
+    examples = []
+    for _ in range(count):
+        length = generator.randint(3, 120)
+        examples.append(("".join(generator.choice("ACDEFGHIKLMNPQRSTVWY") for _ in range(length)),
+                         "".join(generator.choice("HHHEETCC") for _ in range(length))))
+    return examples
+
+
+class TestGOR3(TestCase):
+    def setUp(self):
+        self.gor = GOR3()
+        for sequence, structure in randomExamples(100):
+            self.gor.train(sequence, structure)
+
+    def test_trainCounts(self):
+        gor = GOR3()
+        gor.train("ACDA", "HHEC")
+        self.assertEqual(gor.trainings, 4)
+        self.assertEqual(gor.strucCount, {"H": 2, "E": 1, "T": 0, "C": 1})
+        self.assertEqual(gor.pairCount[("H", "A")], 1)
+        self.assertEqual(gor.pairCount[("C", "A")], 1)
+        self.assertEqual(gor.tripletCount[("H", "A", "D")], 1)
+        self.assertEqual(gor.tripletCount[("C", "A", "A")], 1)
+        self.assertEqual(gor.tripletCounts.sum(), 4 * 3)
+        # 'A' in C sees 'A' at offset -3 (index 5 of neighbourOffsets)
+        self.assertEqual(gor.tripletCounts[3, 0, 5, 0], 1)
+
+    def test_predict(self):
+        sequence, structure = randomExamples(1, seed=1)[0]
+        predicted = self.gor.predict(sequence)
+        self.assertEqual(len(predicted), len(sequence))
+        self.assertTrue(set(predicted) <= set("HETC"))
+        self.assertEqual(self.gor.predict(Sequence(sequence)), predicted)
+        self.assertEqual(self.gor.predict(CompactSequence(sequence)), predicted)
+
+    def test_getScores(self):
+        sequence, structure = randomExamples(1, seed=2)[0]
+        scores = self.gor.getScores(sequence)
+        self.assertEqual(scores.shape, (len(sequence), 4))
+        self.assertEqual(self.gor.predict(sequence), "".join("HETC"[index] for index in scores.argmax(axis=1)))
+        self.assertEqual(self.gor.getScores("").shape, (0, 4))
+
+    def test_getScores_untrained(self):
+        gor = GOR3()
+        gor.train("ACDA", "HHEC")
+        scores = gor.getScores("ACDAWW")
+        self.assertEqual(scores[0, 1], float("-inf"))
+        self.assertEqual(list(scores[5]), [0, 0, 0, 0])
+        gor.train("WW", "EE")
+        self.assertNotEqual(list(gor.getScores("ACDAWW")[5]), [0, 0, 0, 0])
+
+    def test_predict_quality(self):
+        for sequence, structure in randomExamples(10, seed=3):
+            self.gor.predict(sequence, structure)
+        q3, mcc = self.gor.getQuality()
+        self.assertTrue(0 < q3 < 1)
+        self.assertEqual(sum(len(scores) for scores in self.gor.scores.values()), 4 * self.gor.totalPred)
+        self.assertEqual(sum(self.gor.roc.values()), 4 * self.gor.totalPred)
+
+    def test_getROC(self):
+        for sequence, structure in randomExamples(10, seed=3):
+            self.gor.predict(sequence, structure)
+        curves = self.gor.getROC()
+        self.assertEqual(list(curves), list("HETC"))
+        for classifier, (fpr, tpr, auc) in curves.items():
+            positives = self.gor.scores[(classifier, classifier)]
+            negatives = [score for realS in "HETC" if realS != classifier for score in self.gor.scores[(classifier, realS)]]
+            # The AUC is the probability that a positive residue scores higher than a negative one
+            pairs = [(p > n) + (p == n) / 2 for p in positives for n in negatives]
+            self.assertAlmostEqual(auc, sum(pairs) / len(pairs))
+            self.assertEqual((fpr[0], tpr[0], fpr[-1], tpr[-1]), (0, 0, 1, 1))
+
+    def test_predictMany(self):
+        sequences = [CompactSequence(sequence, "seq{}".format(index))
+                     for index, (sequence, structure) in enumerate(randomExamples(7, seed=4))]
+        expected = [self.gor.predict(sequence) for sequence in sequences]
+        directory = tempfile.mkdtemp()
+        try:
+            for workers in (1, 2):
+                path = os.path.join(directory, "structures{}.fasta.gz".format(workers))
+                predicted = list(self.gor.predictMany(iter(sequences), workers, path, chunkSize=2))
+                self.assertEqual(predicted, expected)
+                records = list(getSequencesFromFasta(path))
+                self.assertEqual([record.getDescription() for record in records], ["seq{}".format(i) for i in range(7)])
+                self.assertEqual([str(record) for record in records], expected)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_saveLoad(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, "model.gor3")
+            self.gor.save(path)
+            model = GOR3.load(path)
+            self.assertEqual(model.trainings, self.gor.trainings)
+            self.assertEqual(model.tripletCount, self.gor.tripletCount)
+            for sequence, structure in randomExamples(5, seed=5):
+                self.assertEqual(model.predict(sequence), self.gor.predict(sequence))
+            self.assertEqual(list(model.predictMany(["MKVLAGHE"], workers=2)), [self.gor.predict("MKVLAGHE")])
+
+            model.train("ACDA", "HHEC")
+            self.assertEqual(model.trainings, self.gor.trainings + 4)
+            self.assertEqual(GOR3.load(path).trainings, self.gor.trainings)
+
+            with open(path, 'r+b') as modelFile:
+                modelFile.write(b"PYPROTDB")
+            with self.assertRaises(ValueError):
+                GOR3.load(path)
+        finally:
+            shutil.rmtree(directory)
+
+    def test_lazyImports(self):
+        imported = subprocess.check_output([sys.executable, "-c", "import sys, pyprot.structure.gor; "
+                                            "print('matplotlib' in sys.modules, 'concurrent.futures' in sys.modules)"],
+                                           universal_newlines=True)
+        self.assertEqual(imported.split(), ["False", "False"])
+
+    def test_unknownNames(self):
+        with self.assertRaises(ValueError):
+            self.gor.train("AC-A", "HHEC")
+        with self.assertRaises(ValueError):
+            self.gor.train("ACDA", "HHGC")
+        with self.assertRaises(ValueError):
+            self.gor.train("ACDA", "HHE")